@@ -1,7 +1,10 @@
 from ._async_clients import AsyncClient
 from ._auth import AnaplanLocalOAuth, AnaplanRefreshTokenAuth
 from ._clients import Client
+from ._delta import RowChange
 from ._oauth import AsyncOauth, Oauth
+from ._polling import AsyncTaskHandle, PollingPolicy, TaskHandle
+from ._write_buffer import AsyncModuleWriteBuffer, ModuleWriteBuffer
 from .models.scim import field
 
 __all__ = [
@@ -11,6 +14,12 @@ __all__ = [
     "AnaplanRefreshTokenAuth",
     "AsyncOauth",
     "Oauth",
+    "PollingPolicy",
+    "TaskHandle",
+    "AsyncTaskHandle",
+    "RowChange",
+    "ModuleWriteBuffer",
+    "AsyncModuleWriteBuffer",
     "models",  # pyright: ignore[reportUnsupportedDunderAll]
     "exceptions",  # pyright: ignore[reportUnsupportedDunderAll]
     "field",
@@ -1,8 +1,9 @@
 # pyright: reportPrivateUsage=false
 import logging
-from asyncio import sleep
+from functools import partial
 from typing import Literal, overload
 
+from anaplan_sdk._polling import PollingPolicy, _AsyncTaskPoller, as_delay, as_policy
 from anaplan_sdk._services import _AsyncHttpService
 from anaplan_sdk._utils import sort_params
 from anaplan_sdk.exceptions import AnaplanActionError
@@ -26,12 +27,25 @@ logger = logging.getLogger("anaplan_sdk")
 
 
 class _AsyncAlmClient:
-    def __init__(self, http: _AsyncHttpService, model_id: str, poll_delay: int) -> None:
+    def __init__(self, http: _AsyncHttpService, model_id: str, poller: _AsyncTaskPoller) -> None:
         self._http = http
         self._model_id = model_id
-        self.poll_delay = poll_delay
+        self._poller = poller
         self._url = f"https://api.anaplan.com/2/0/models/{model_id}"
 
+    @property
+    def poll_delay(self) -> float | PollingPolicy:
+        """
+        The delay in seconds between polling the status of a task, or the `PollingPolicy` if it
+        is not a fixed delay. This is shared with the Client this ALM Client belongs to, so
+        changing it here changes it there as well.
+        """
+        return as_delay(self._poller.policy)
+
+    @poll_delay.setter
+    def poll_delay(self, value: float | PollingPolicy) -> None:
+        self._poller.policy = as_policy(value)
+
     async def change_model_status(self, status: Literal["online", "offline"]) -> None:
         """
         Use this call to change the status of a model.
@@ -164,12 +178,19 @@ class _AsyncAlmClient:
         )
         if not wait_for_completion:
             return task
-        while (task := await self.get_sync_task(task.id)).task_state != "COMPLETE":
-            await sleep(self.poll_delay)
-        if not task.result.successful:
-            msg = f"Sync task {task.id} was unsuccessful."
-            logger.error(msg)
-            raise AnaplanActionError(msg)
+
+        def resolve(t: SyncTask) -> CompletedSyncTask | None:
+            if t.task_state != "COMPLETE":
+                return None
+            if not t.result.successful:
+                msg = f"Sync task {t.id} was unsuccessful."
+                logger.error(msg)
+                raise AnaplanActionError(msg)
+            return t
+
+        task = await self._poller.track(
+            task.id, task, partial(self.get_sync_task, task.id), resolve
+        )
         logger.info(f"Sync task {task.id} completed successfully.")
         return task
 
@@ -231,12 +252,19 @@ class _AsyncAlmClient:
         )
         if not wait_for_completion:
             return task
-        while (task := await self.get_comparison_report_task(task.id)).task_state != "COMPLETE":
-            await sleep(self.poll_delay)
-        if task.result.successful is False:
-            msg = f"Comparison Report task {task.id} completed with errors: {task.result.error}."
-            logger.error(msg)
-            raise AnaplanActionError(msg)
+
+        def resolve(t: ReportTask) -> CompletedReportTask | None:
+            if t.task_state != "COMPLETE":
+                return None
+            if t.result.successful is False:
+                msg = f"Comparison Report task {t.id} completed with errors: {t.result.error}."
+                logger.error(msg)
+                raise AnaplanActionError(msg)
+            return t
+
+        task = await self._poller.track(
+            task.id, task, partial(self.get_comparison_report_task, task.id), resolve
+        )
         logger.info(f"Comparison Report task {task.id} completed successfully.")
         return task
 
@@ -307,12 +335,19 @@ class _AsyncAlmClient:
         )
         if not wait_for_completion:
             return task
-        while (task := await self.get_comparison_summary_task(task.id)).task_state != "COMPLETE":
-            await sleep(self.poll_delay)
-        if task.result.successful is False:
-            msg = f"Comparison Summary task {task.id} completed with errors: {task.result.error}."
-            logger.error(msg)
-            raise AnaplanActionError(msg)
+
+        def resolve(t: ReportTask) -> CompletedReportTask | None:
+            if t.task_state != "COMPLETE":
+                return None
+            if t.result.successful is False:
+                msg = f"Comparison Summary task {t.id} completed with errors: {t.result.error}."
+                logger.error(msg)
+                raise AnaplanActionError(msg)
+            return t
+
+        task = await self._poller.track(
+            task.id, task, partial(self.get_comparison_summary_task, task.id), resolve
+        )
         logger.info(f"Comparison Summary task {task.id} completed successfully.")
         return await self.get_comparison_summary(task)
 
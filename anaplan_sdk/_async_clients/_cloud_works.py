@@ -1,13 +1,19 @@
 import logging
-from typing import Any, Literal
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Literal, overload
 
+from anaplan_sdk._downloads import csv_rows_async, write_blocks_async
+from anaplan_sdk._polling import _AsyncTaskPoller  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._services import _AsyncHttpService  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._utils import (
     connection_body_payload,
     construct_payload,
+    dump_url,
     integration_payload,
     schedule_payload,
 )
+from anaplan_sdk.exceptions import AnaplanActionError
 from anaplan_sdk.models.cloud_works import (
     Connection,
     ConnectionBody,
@@ -30,8 +36,9 @@ logger = logging.getLogger("anaplan_sdk")
 
 
 class _AsyncCloudWorksClient:
-    def __init__(self, http: _AsyncHttpService) -> None:
+    def __init__(self, http: _AsyncHttpService, poller: _AsyncTaskPoller) -> None:
         self._http = http
+        self._poller = poller
         self._url = "https://api.cloudworks.anaplan.com/2/0/integrations"
         self._flow = _AsyncFlowClient(http)
 
@@ -168,15 +175,45 @@ class _AsyncCloudWorksClient:
         json = integration_payload(body)
         await self._http.put(f"{self._url}/{integration_id}", json=json)
 
-    async def run_integration(self, integration_id: str) -> str:
+    @overload
+    async def run_integration(
+        self, integration_id: str, wait_for_completion: Literal[False] = False
+    ) -> str: ...
+
+    @overload
+    async def run_integration(
+        self, integration_id: str, wait_for_completion: Literal[True]
+    ) -> RunStatus: ...
+
+    async def run_integration(
+        self, integration_id: str, wait_for_completion: bool = False
+    ) -> str | RunStatus:
         """
         Run an integration in CloudWorks.
         :param integration_id: The ID of the integration to run.
-        :return: The ID of the run instance.
+        :param wait_for_completion: If True, the method will poll the run status and not return
+               until the run has finished. If False, it will start the run and return immediately.
+        :return: The ID of the run instance, or the final status of the run if
+                 `wait_for_completion` is True.
         """
         run_id = (await self._http.post_empty(f"{self._url}/{integration_id}/run"))["run"]["id"]
         logger.info(f"Started integration run '{run_id}' for integration '{integration_id}'.")
-        return run_id
+        if not wait_for_completion:
+            return run_id
+
+        def resolve(run: RunStatus) -> RunStatus | None:
+            if run.end_date is None:
+                return None
+            if not run.success:
+                msg = f"Integration run '{run_id}' failed: {run.message}"
+                logger.error(msg)
+                raise AnaplanActionError(msg)
+            return run
+
+        fetch = partial(self.get_run_status, run_id)
+        run = await self._poller.track(run_id, await fetch(), fetch, resolve)
+        logger.info(f"Integration run '{run_id}' completed successfully.")
+        return run
 
     async def delete_integration(self, integration_id: str) -> None:
         """
@@ -362,3 +399,58 @@ class _AsyncCloudWorksClient:
         return await self._http.get_binary(
             f"{self._url}/run/{run_id}/process/import/{action_id}/dumps"
         )
+
+    async def get_import_error_dump_stream(self, run_id: str) -> AsyncIterator[bytes]:
+        """
+        Get the error dump of a specific import run in CloudWorks as a stream of blocks, so large
+        dumps never need to be held in memory in their entirety.
+
+        **Note that if you need the error dump of an action in a process, you must use the
+        `get_process_error_dump_stream` method instead.**
+        :param run_id: The ID of the run to retrieve.
+        :return: A generator yielding the blocks of the error dump.
+        """
+        async for block in self._http.get_stream(dump_url(self._url, run_id)):
+            yield block
+
+    async def get_process_error_dump_stream(
+        self, run_id: str, action_id: int | str
+    ) -> AsyncIterator[bytes]:
+        """
+        Get the error dump of a specific import run in CloudWorks, that is part of a process, as a
+        stream of blocks.
+        :param run_id: The ID of the run to retrieve.
+        :param action_id: The ID of the action to retrieve. This can be found in the RunError.
+        :return: A generator yielding the blocks of the error dump.
+        """
+        async for block in self._http.get_stream(dump_url(self._url, run_id, action_id)):
+            yield block
+
+    async def save_error_dump(
+        self, run_id: str, path: str | Path, action_id: int | str | None = None
+    ) -> int:
+        """
+        Streams the error dump of a specific import run in CloudWorks to a file.
+        :param run_id: The ID of the run to retrieve.
+        :param path: The path to write the error dump to.
+        :param action_id: The ID of the action to retrieve, if the run is part of a process.
+        :return: The number of bytes written.
+        """
+        return await write_blocks_async(
+            self._http.get_stream(dump_url(self._url, run_id, action_id)), path
+        )
+
+    async def get_error_dump_rows(
+        self, run_id: str, action_id: int | str | None = None
+    ) -> AsyncIterator[list[str]]:
+        """
+        Get the rows of the error dump of a specific import run in CloudWorks. The dump is parsed
+        as it is streamed, so you can inspect the failures of large imports row by row.
+        :param run_id: The ID of the run to retrieve.
+        :param action_id: The ID of the action to retrieve, if the run is part of a process.
+        :return: A generator yielding the rows of the error dump, starting with the header.
+        """
+        async for row in csv_rows_async(
+            self._http.get_stream(dump_url(self._url, run_id, action_id))
+        ):
+            yield row
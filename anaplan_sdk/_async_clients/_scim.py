@@ -69,21 +69,19 @@ class _AsyncScimClient:
             _predicate = predicate if isinstance(predicate, str) else str(predicate)
             logger.debug(f"Searching for users with predicate: {_predicate}")
             params["filter"] = _predicate
-        res = await self._http.get(f"{self._url}/Users", params=params)
-        users = [User.model_validate(e) for e in res.get("Resources", [])]
-        if (total := res["totalResults"]) <= page_size:
-            return users
+        url = f"{self._url}/Users"
+        res = await self._http.get_validated(url, "Resources", User, params=params)
+        if (total := res.total_results or 0) <= page_size:
+            return res.items
         pages = await gather(
             *(
-                self._http.get(
-                    f"{self._url}/Users", params=(params | {"startIndex": i, "count": page_size})
+                self._http.get_validated(
+                    url, "Resources", User, params=(params | {"startIndex": i, "count": page_size})
                 )
                 for i in range(page_size + 1, total + 1, page_size)
             )
         )
-        for user in chain(*(p.get("Resources", []) for p in pages)):
-            users.append(User.model_validate(user))
-        return users
+        return list(chain(res.items, *(p.items for p in pages)))
 
     async def get_user(self, user_id: str) -> User:
         """
@@ -1,32 +1,62 @@
 import logging
-from asyncio import gather
+import time
+from asyncio import get_running_loop, to_thread
 from itertools import chain
-from typing import Any, Literal, overload
-
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Literal, Sequence, overload
+
+from anaplan_sdk._cache import _DimensionIndexes, _LineItemDimensionIndexes  # pyright: ignore[reportPrivateUsage]
+from anaplan_sdk._chunking import (
+    MAX_LIST_WRITE_BYTES,
+    MAX_LIST_WRITE_ITEMS,
+    MAX_MODULE_WRITE_BYTES,
+    MAX_MODULE_WRITE_CELLS,
+    MAX_VIEW_CELLS,
+    WRITE_PARALLELISM,
+    encoded_chunks,
+    iter_bounded_async,
+    run_bounded_async,
+)
+from anaplan_sdk._downloads import json_array_items_async
+from anaplan_sdk._list_sync import _ListDiff  # pyright: ignore[reportPrivateUsage]
+from anaplan_sdk._lookups import MAX_LOOKUP_VALUES, _DimensionLookups  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._services import _AsyncHttpService  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._utils import (
+    is_lookup_dimension,
     parse_calendar_response,
+    parse_deletion_response,
     parse_insertion_response,
+    parse_module_write_response,
+    parse_update_response,
     sort_params,
     validate_dimension_id,
+    view_page_selections,
 )
+from anaplan_sdk._write_buffer import AsyncModuleWriteBuffer
 from anaplan_sdk.exceptions import InvalidIdentifierException
 from anaplan_sdk.models import (
+    ChunkStats,
     CurrentPeriod,
     Dimension,
+    DimensionIndex,
     DimensionWithCode,
     FiscalYear,
     InsertionResult,
     LineItem,
+    LineItemDimensionIndex,
     List,
     ListDeletionResult,
     ListItem,
+    ListItemsFrame,
     ListMetadata,
+    ListSyncResult,
+    ListUpdateResult,
     Model,
     ModelCalendar,
     ModelStatus,
     Module,
     View,
+    ViewArray,
     ViewInfo,
 )
 from anaplan_sdk.models._transactional import ViewExportType
@@ -37,10 +67,13 @@ logger = logging.getLogger("anaplan_sdk")
 
 
 class _AsyncTransactionalClient:
-    def __init__(self, http: _AsyncHttpService, model_id: str) -> None:
+    def __init__(self, http: _AsyncHttpService, model_id: str, cache_dir: Path) -> None:
         self._http = http
         self._url = f"https://api.anaplan.com/2/0/models/{model_id}"
         self._model_id = model_id
+        self._indexes = _DimensionIndexes(cache_dir, model_id)
+        self._line_item_dimensions = _LineItemDimensionIndexes(cache_dir, model_id)
+        self._lookups = _DimensionLookups()
 
     async def get_model_details(self) -> Model:
         """
@@ -79,10 +112,10 @@ class _AsyncTransactionalClient:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Modules.
         """
-        res = await self._http.get_paginated(
-            f"{self._url}/modules", "modules", params=sort_params(sort_by, descending)
+        res = await self._http.get_paginated_validated(
+            f"{self._url}/modules", "modules", Module, params=sort_params(sort_by, descending)
         )
-        return [Module.model_validate(e) for e in res]
+        return list(res)
 
     async def get_views(
         self, sort_by: Literal["id", "module_id", "name"] | None = None, descending: bool = False
@@ -95,10 +128,10 @@ class _AsyncTransactionalClient:
         :return: The List of Views.
         """
         params = {"includesubsidiaryviews": True} | sort_params(sort_by, descending)
-        return [
-            View.model_validate(e)
-            for e in await self._http.get_paginated(f"{self._url}/views", "views", params=params)
-        ]
+        res = await self._http.get_paginated_validated(
+            f"{self._url}/views", "views", View, params=params
+        )
+        return list(res)
 
     async def get_view_info(self, view_id: int) -> ViewInfo:
         """
@@ -143,7 +176,8 @@ class _AsyncTransactionalClient:
     ) -> dict[str, Any] | bytes:
         """
         Retrieves cell data for a View. The view must contain no more than 1,000,000 cells —
-        if exceeded the API returns a 400 error rather than a partial result.
+        if exceeded the API returns a 400 error rather than a partial result. To read larger Views
+        or all pages of a View, use `iter_view_data`, which splits the View by its pages.
 
         You may pass a `view_id` or any valid `line_item_id`. For line items with a subsidiary
         view the response reflects that subsidiary view; otherwise the default module view is used.
@@ -189,12 +223,78 @@ class _AsyncTransactionalClient:
         :param only_module_id: If provided, only Line Items from this Module will be returned.
         :return: All Line Items on this Model or only from the specified Module.
         """
-        res = await self._http.get(
+        url = (
             f"{self._url}/modules/{only_module_id}/lineItems?includeAll=true"
             if only_module_id
             else f"{self._url}/lineItems?includeAll=true"
         )
-        return [LineItem.model_validate(e) for e in res.get("items", [])]
+        return (await self._http.get_validated(url, "items", LineItem)).items
+
+    async def iter_view_data(
+        self, view_id: int, max_cells: int = MAX_VIEW_CELLS, max_parallel: int = WRITE_PARALLELISM
+    ) -> AsyncIterator[tuple[list[tuple[int, int]], dict[str, Any]]]:
+        """
+        Iterates over the data of all pages of a View, one page combination at a time. Unlike
+        `get_view_data`, which reads a single page and fails for views with more than 1,000,000
+        cells, this reads the page dimensions of the View with `get_view_info` and
+        `get_view_dimension_items` and requests every combination of page items separately, so
+        that each request only holds the cells of the rows and columns. The slices are fetched
+        concurrently, with at most `max_parallel` requests in flight, and yielded in order as soon
+        as they are available, so only a few slices are held in memory at any time. This is the
+        preferred way to read large Views.
+        :param view_id: The ID of the View (or Line Item) to retrieve data for.
+        :param max_cells: The maximum number of cells per request. If a single page holds more
+               cells than this, an `AnaplanException` is raised before any data is requested.
+        :param max_parallel: The maximum number of slices to fetch concurrently.
+        :return: A generator yielding tuples of the page selection, as `(dimension_id, item_id)`
+                 tuples, and the data of that page in the same format as `get_view_data`.
+        """
+        info = await self.get_view_info(view_id)
+        dimension_items = await self._get_view_dimension_items(info, max_parallel)
+        selections = view_page_selections(info, dimension_items, max_cells)
+
+        async def fetch(
+            pages: list[tuple[int, int]],
+        ) -> tuple[list[tuple[int, int]], dict[str, Any]]:
+            return pages, await self.get_view_data(view_id, pages)
+
+        async for page in iter_bounded_async(fetch, selections, max(max_parallel, 1)):
+            yield page
+
+    async def get_view_array(
+        self, view_id: int, max_parallel: int = WRITE_PARALLELISM
+    ) -> ViewArray:
+        """
+        Gets the cell values of all pages of a View as a `ViewArray`, a float64 NumPy array shaped
+        by the row, column and page dimensions of the View, with label vectors for each axis. The
+        data is read in the CSV format and parsed in bulk rather than cell by cell, which is
+        considerably faster than converting the result of `get_view_data`. As in
+        `iter_view_data`, every combination of page items is requested separately and
+        concurrently, with at most `max_parallel` requests in flight. Requires NumPy.
+        :param view_id: The ID of the View (or Line Item) to retrieve data for.
+        :param max_parallel: The maximum number of pages to fetch concurrently.
+        :return: The cell values and labels of the View.
+        """
+        info = await self.get_view_info(view_id)
+        dimension_items = await self._get_view_dimension_items(info, max_parallel)
+        selections = view_page_selections(info, dimension_items, MAX_VIEW_CELLS)
+
+        async def fetch(pages: list[tuple[int, int]]) -> bytes:
+            return await self.get_view_data(view_id, pages, data_format="text/csv")
+
+        grids = await run_bounded_async(fetch, selections, max(max_parallel, 1))
+        grid = len(info.rows) + len(info.columns)
+        pages = [[item.name for item in items] for items in dimension_items[grid:]]
+        return ViewArray.from_grids(info, grids, pages)
+
+    async def _get_view_dimension_items(
+        self, info: ViewInfo, max_parallel: int
+    ) -> list[list[Dimension]]:
+        async def items(dimension: Dimension) -> list[Dimension]:
+            return await self.get_view_dimension_items(info.view_id, dimension.id)
+
+        dimensions = [*info.rows, *info.columns, *info.pages]
+        return await run_bounded_async(items, dimensions, max(max_parallel, 1))
 
     async def get_lists(self, sort_by: SortBy = None, descending: bool = False) -> list[List]:
         """
@@ -203,10 +303,10 @@ class _AsyncTransactionalClient:
         :param descending: If True, the results will be sorted in descending order.
         :return: All Lists on this model.
         """
-        res = await self._http.get_paginated(
-            f"{self._url}/lists", "lists", params=sort_params(sort_by, descending)
+        res = await self._http.get_paginated_validated(
+            f"{self._url}/lists", "lists", List, params=sort_params(sort_by, descending)
         )
-        return [List.model_validate(e) for e in res]
+        return list(res)
 
     async def get_list_metadata(self, list_id: int) -> ListMetadata:
         """
@@ -245,14 +345,60 @@ class _AsyncTransactionalClient:
             return res.get("listItems", [])
         return [ListItem.model_validate(e) for e in res.get("listItems", [])]
 
+    @overload
+    def iter_list_items(  # pyright: ignore[reportOverlappingOverload]
+        self, list_id: int, return_raw: Literal[False] = False
+    ) -> AsyncIterator[ListItem]: ...
+
+    @overload
+    def iter_list_items(
+        self, list_id: int, return_raw: Literal[True] = True
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def iter_list_items(
+        self, list_id: int, return_raw: bool = False
+    ) -> AsyncIterator[ListItem | dict[str, Any]]:
+        """
+        Iterates over all the items in a List. Unlike `get_list_items`, the response is parsed
+        incrementally as it is streamed, and each item is yielded as soon as it is complete. Memory
+        use therefore stays constant regardless of the size of the List, which makes this the
+        better choice for Lists with millions of items.
+        :param list_id: The ID of the List.
+        :param return_raw: If True, yields the items as dictionaries instead of ListItem objects.
+        :return: A generator yielding the items in the List.
+        """
+        async for item in json_array_items_async(
+            self._http.get_stream(f"{self._url}/lists/{list_id}/items?includeAll=true"), "listItems"
+        ):
+            yield item if return_raw else ListItem.model_validate(item)
+
+    async def get_list_items_frame(self, list_id: int) -> ListItemsFrame:
+        """
+        Gets all the items in a List as a columnar `ListItemsFrame`. The response is streamed and
+        each item is added to the frame as soon as it is parsed, so neither the response nor a
+        dictionary or object per item is ever held in memory. Use this for Lists with millions of
+        items, or if you need fast lookups by code or want to pass the items on to NumPy or Arrow.
+        :param list_id: The ID of the List.
+        :return: All items in the List.
+        """
+        frame = ListItemsFrame()
+        async for item in self.iter_list_items(list_id, return_raw=True):
+            frame.append(item)
+        return frame
+
     async def insert_list_items(
-        self, list_id: int, items: list[dict[str, str | int | dict[str, Any]]]
+        self,
+        list_id: int,
+        items: list[dict[str, str | int | dict[str, Any]]],
+        max_parallel: int = WRITE_PARALLELISM,
     ) -> InsertionResult:
         """
         Insert new items to the given list. The items must be a list of dictionaries with at least
         the keys `code` and `name`. You can optionally pass further keys for parents, extra
-        properties etc. If you pass a long list, it will be split into chunks of 100,000 items, the
-        maximum allowed by the API.
+        properties etc. If you pass a long list, it will be split into chunks of at most 100,000
+        items, the maximum allowed by the API, and at most 15 MB, measured on the encoded payload,
+        so that items with large properties do not exceed the payload limits. The chunks are sent
+        concurrently, with at most `max_parallel` requests in flight.
 
         **Warning**: If one or some of the requests timeout during large batch operations, the
         operation may actually complete on the server. Retries for these chunks will then report
@@ -262,37 +408,25 @@ class _AsyncTransactionalClient:
 
         :param list_id: The ID of the List.
         :param items: The items to insert into the List.
+        :param max_parallel: The maximum number of chunks to send concurrently.
         :return: The result of the insertion, indicating how many items were added,
-                 ignored or failed.
+                 ignored or failed, and the timings and retries of each chunk.
         """
         if not items:
             return InsertionResult(added=0, ignored=0, failures=[], total=0)
-        if len(items) <= 100_000:
-            result = InsertionResult.model_validate(
-                await self._http.post(
-                    f"{self._url}/lists/{list_id}/items?action=add", json={"items": items}
-                )
-            )
-            logger.info(f"Inserted {result.added} items into list '{list_id}'.")
-            return result
-        responses = await gather(
-            *(
-                self._http.post(
-                    f"{self._url}/lists/{list_id}/items?action=add", json={"items": chunk}
-                )
-                for chunk in (items[i : i + 100_000] for i in range(0, len(items), 100_000))
-            )
+        result = parse_insertion_response(
+            await self._write_list_items(list_id, "add", items, max_parallel)
         )
-        result = parse_insertion_response(responses)
         logger.info(f"Inserted {result.added} items into list '{list_id}'.")
         return result
 
     async def delete_list_items(
-        self, list_id: int, items: list[dict[str, str | int]]
+        self, list_id: int, items: list[dict[str, str | int]], max_parallel: int = WRITE_PARALLELISM
     ) -> ListDeletionResult:
         """
-        Deletes items from a List. If you pass a long list, it will be split into chunks of 100,000
-        items, the maximum allowed by the API.
+        Deletes items from a List. If you pass a long list, it will be split into chunks of at most
+        100,000 items, the maximum allowed by the API, and at most 15 MB, measured on the encoded
+        payload. The chunks are sent concurrently, with at most `max_parallel` requests in flight.
 
         **Warning**: If one or some of the requests timeout during large batch operations, the
         operation may actually complete on the server. Retries for these chunks will then report
@@ -304,32 +438,123 @@ class _AsyncTransactionalClient:
         :param list_id: The ID of the List.
         :param items: The items to delete from the List. Must be a dict with either `code` or `id`
                       as the keys to identify the records to delete. Specifying both will error.
-        :return: The result of the deletion, indicating how many items were deleted or failed.
+        :param max_parallel: The maximum number of chunks to send concurrently.
+        :return: The result of the deletion, indicating how many items were deleted or failed, and
+                 the timings and retries of each chunk.
         """
         if not items:
             return ListDeletionResult(deleted=0, failures=[])
-        if len(items) <= 100_000:
-            res = await self._http.post(
-                f"{self._url}/lists/{list_id}/items?action=delete", json={"items": items}
-            )
-            info = ListDeletionResult.model_validate(res)
-            logger.info(f"Deleted {info.deleted} items from list '{list_id}'.")
-            return info
-
-        responses = await gather(
-            *(
-                self._http.post(
-                    f"{self._url}/lists/{list_id}/items?action=delete", json={"items": chunk}
-                )
-                for chunk in (items[i : i + 100_000] for i in range(0, len(items), 100_000))
+        info = parse_deletion_response(
+            await self._write_list_items(list_id, "delete", items, max_parallel)
+        )
+        logger.info(f"Deleted {info.deleted} items from list '{list_id}'.")
+        return info
+
+    async def update_list_items(
+        self, list_id: int, items: list[dict[str, Any]], max_parallel: int = WRITE_PARALLELISM
+    ) -> ListUpdateResult:
+        """
+        Updates existing items in a List. Each item must contain the `id` or `code` of the item to
+        update and only needs to contain the fields that should change, such as `name`, `parent`,
+        `properties` or `subsets`. If you pass a long list, it will be split into chunks of at most
+        100,000 items, the maximum allowed by the API, and at most 15 MB, measured on the encoded
+        payload. The chunks are sent concurrently, with at most `max_parallel` requests in flight.
+        :param list_id: The ID of the List.
+        :param items: The items to update.
+        :param max_parallel: The maximum number of chunks to send concurrently.
+        :return: The result of the update, indicating how many items were updated or failed, and
+                 the timings and retries of each chunk.
+        """
+        if not items:
+            return ListUpdateResult(updated=0, failures=[])
+        result = parse_update_response(
+            await self._write_list_items(list_id, "update", items, max_parallel)
+        )
+        logger.info(f"Updated {result.updated} items in list '{list_id}'.")
+        return result
+
+    async def sync_list(
+        self,
+        list_id: int,
+        items: Iterable[dict[str, Any]],
+        key: Literal["code", "name"] = "code",
+        delete_missing: bool = True,
+        max_parallel: int = WRITE_PARALLELISM,
+    ) -> ListSyncResult:
+        """
+        Makes the items of a List match the given items, sending only what differs. The current
+        items are streamed and matched against the given items by `key`. Items that do not exist
+        yet are inserted, items with differing fields are updated with only the changed fields,
+        properties and subsets, and items that are not in the given items are deleted. Current
+        items that have no value for `key` are skipped and reported in the result rather than
+        deleted. Values are compared by type, so a number matches its text form returned by the
+        API, e.g. `1` matches `"1.0"`. Items that are already up to date are not sent at all, so
+        syncing a large List that has barely changed takes a fraction of the requests and payload
+        of deleting and re-inserting it.
+
+        Parents are compared against the parent name or Id returned by the API, so pass the
+        parent by name to avoid needless updates. The changes are applied in the order insert,
+        update, delete, so that items can be moved to newly inserted parents, and each step is
+        chunked and sent concurrently as in `insert_list_items`.
+        :param list_id: The ID of the List.
+        :param items: The desired items of the List, in the same format as for
+               `insert_list_items`.
+        :param key: The field used to match the given items to the current items.
+        :param delete_missing: Whether to delete the current items that are not in the given items.
+        :param max_parallel: The maximum number of chunks to send concurrently in each step.
+        :return: The results of the insertion, update and deletion, and the number of items that
+                 were already up to date.
+        """
+        diff = _ListDiff(items, key)
+        async for item in self.iter_list_items(list_id, return_raw=True):
+            diff.feed(item)
+        inserted = await self.insert_list_items(list_id, diff.adds, max_parallel)
+        updated = await self.update_list_items(list_id, diff.updates, max_parallel)
+        deleted = (
+            await self.delete_list_items(list_id, diff.deletes, max_parallel)
+            if delete_missing
+            else ListDeletionResult(deleted=0, failures=[])
+        )
+        if diff.skipped:
+            logger.warning(
+                f"Skipped {len(diff.skipped)} items of list '{list_id}' without a {key}."
             )
+        logger.info(f"Synced list '{list_id}', {diff.unchanged} items were unchanged.")
+        return ListSyncResult(
+            inserted=inserted,
+            updated=updated,
+            deleted=deleted,
+            unchanged=diff.unchanged,
+            skipped=diff.skipped,
         )
-        info = ListDeletionResult(
-            deleted=sum(res.get("deleted", 0) for res in responses),
-            failures=list(chain.from_iterable(res.get("failures", []) for res in responses)),
+
+    async def _write_list_items(
+        self,
+        list_id: int,
+        action: Literal["add", "delete", "update"],
+        items: Sequence[dict[str, Any]],
+        max_parallel: int,
+    ) -> list[tuple[ChunkStats, dict[str, Any]]]:
+        url = f"{self._url}/lists/{list_id}/items"
+        send = self._http.put_encoded_with_attempts
+        if action != "update":
+            url, send = f"{url}?action={action}", self._http.post_encoded_with_attempts
+
+        async def write(chunk: tuple[int, int, bytes]) -> tuple[ChunkStats, dict[str, Any]]:
+            start, count, content = chunk
+            content = b'{"items":' + content + b"}"
+            started = time.perf_counter()
+            res, attempts = await send(url, content)
+            seconds = time.perf_counter() - started
+            stats = ChunkStats(
+                start=start, items=count, size=len(content), seconds=seconds, attempts=attempts
+            )
+            return stats, res
+
+        chunks = encoded_chunks(
+            items, self._http.encode, MAX_LIST_WRITE_ITEMS, MAX_LIST_WRITE_BYTES - 11
         )
-        logger.info(f"Deleted {info} items from list '{list_id}'.")
-        return info
+        return await run_bounded_async(write, chunks, max(max_parallel, 1))
 
     async def reset_list_index(self, list_id: int) -> None:
         """
@@ -340,26 +565,100 @@ class _AsyncTransactionalClient:
         logger.info(f"Reset index for list '{list_id}'.")
 
     async def update_module_data(
-        self, module_id: int, data: list[dict[str, Any]]
+        self, module_id: int, data: list[dict[str, Any]], max_parallel: int = WRITE_PARALLELISM
     ) -> int | dict[str, Any]:
         """
         Write the passed items to the specified module. If successful, the number of cells changed
         is returned, if only partially successful or unsuccessful, the response with the according
         details is returned instead.
 
-        **You can update a maximum of 100,000 cells or 15 MB of data (whichever is lower) in a
-        single request.** You must chunk your data accordingly. This is not done by this SDK,
-        since it is discouraged. For larger imports, you should use the Bulk API instead.
+        Anaplan accepts a maximum of 100,000 cells or 15 MB of data (whichever is lower) in a
+        single request. Larger writes are split into chunks within these limits, measured on the
+        encoded payload, and the chunks are sent concurrently. The responses are aggregated, with
+        the `requestIndex` of failures referring to the position in `data`. Keep in mind that the
+        chunks are not written atomically. For very large writes, you should use the Bulk API
+        instead.
 
         For more details see: https://anaplan.docs.apiary.io/#UpdateModuleCellData.
         :param module_id: The ID of the Module.
         :param data: The data to write to the Module.
+        :param max_parallel: The maximum number of chunks to send concurrently.
+        :return: The number of cells changed or the response with the according error details.
+        """
+        url = f"{self._url}/modules/{module_id}/data"
+
+        async def write(chunk: tuple[int, int, bytes]) -> tuple[int, dict[str, Any]]:
+            return chunk[0], await self._http.post_encoded(url, chunk[2])
+
+        chunks = encoded_chunks(
+            data, self._http.encode, MAX_MODULE_WRITE_CELLS, MAX_MODULE_WRITE_BYTES
+        )
+        res = parse_module_write_response(
+            await run_bounded_async(write, chunks, max(max_parallel, 1))
+        )
+        if isinstance(res, int):
+            logger.info(f"Updated {res} cells in module '{module_id}'.")
+        return res
+
+    async def write_view_changes(
+        self,
+        module_id: int,
+        snapshot: ViewArray,
+        values: Any,
+        line_item_id: int | None = None,
+        max_parallel: int = WRITE_PARALLELISM,
+    ) -> int | dict[str, Any]:
+        """
+        Writes only the cells that differ from a snapshot of a View, as read with
+        `get_view_array`. The new values are compared against the snapshot in a single vectorized
+        pass, and only the changed cells are translated into the payload of `update_module_data`
+        and written, chunked and concurrently as described there. Writing back a grid with a
+        handful of changed values therefore sends a handful of cells rather than the entire grid.
+        If all cells are written successfully, the snapshot is updated in place, so it can be
+        reused for the next write. Cells that are NaN in `values` are skipped.
+        :param module_id: The ID of the Module the View belongs to.
+        :param snapshot: The last read state of the View.
+        :param values: The new values, in the shape of `snapshot.values`.
+        :param line_item_id: The ID of the Line Item, if the View has no Line Items dimension.
+        :param max_parallel: The maximum number of chunks to send concurrently.
         :return: The number of cells changed or the response with the according error details.
         """
-        res = await self._http.post(f"{self._url}/modules/{module_id}/data", json=data)
-        if "failures" not in res:
-            logger.info(f"Updated {res['numberOfCellsChanged']} cells in module '{module_id}'.")
-        return res if "failures" in res else res["numberOfCellsChanged"]
+        mask = snapshot.changed(values)
+        data = snapshot.to_module_data(values, mask, line_item_id)
+        if not data:
+            return 0
+        res = await self.update_module_data(module_id, data, max_parallel)
+        if isinstance(res, int):
+            snapshot.apply(values, mask)
+        return res
+
+    def buffered_writer(
+        self,
+        module_id: int,
+        max_cells: int = MAX_MODULE_WRITE_CELLS,
+        max_age: float = 5.0,
+        max_parallel: int = WRITE_PARALLELISM,
+    ) -> AsyncModuleWriteBuffer:
+        """
+        Creates a buffer for cell writes to a Module, to be used as an async context manager.
+        Instead of calling `update_module_data` for every few cells, e.g. once per incoming event,
+        cells are collected in the buffer and written in batches in the background. Repeated
+        writes to the same cell are merged, so only the last value is sent. The buffer is flushed
+        once it holds `max_cells` cells, once the oldest pending cell is `max_age` seconds old and
+        on exit. Exceptions raised while writing are re-raised by the next call to the buffer as a
+        `BufferedWriteError`, and failed and partially failed writes are collected in its
+        `failures` together with their cells.
+        :param module_id: The ID of the Module.
+        :param max_cells: The number of pending cells at which the buffer is flushed.
+        :param max_age: The maximum number of seconds a cell is held before the buffer is flushed.
+        :param max_parallel: The maximum number of chunks to send concurrently per flush.
+        :return: The buffer.
+        """
+
+        async def write(data: list[dict[str, Any]]) -> int | dict[str, Any]:
+            return await self.update_module_data(module_id, data, max_parallel)
+
+        return AsyncModuleWriteBuffer(write, max_cells, max_age)
 
     async def get_current_period(self) -> CurrentPeriod:
         """
@@ -420,8 +719,12 @@ class _AsyncTransactionalClient:
     ) -> list[DimensionWithCode]:
         """
         Looks up items in a dimension by their codes or names. If both are provided, both will be
-        searched for. You must provide at least one of `codes` or `names`. Valid Dimensions to
-        lookup are:
+        searched for. You must provide at least one of `codes` or `names`. Found items are
+        memoized per dimension in an LRU cache of the 100,000 most recently used items, so only
+        values that have not been found before are sent to the server. These are split into
+        batches of at most 5,000 values that are sent concurrently, and values that are already
+        being looked up concurrently, e.g. from another thread or task, are awaited instead of
+        requested twice. Valid Dimensions to lookup are:
 
         - Lists (101xxxxxxxxx)
         - Time (20000000003)
@@ -434,20 +737,111 @@ class _AsyncTransactionalClient:
         """
         if not codes and not names:
             raise ValueError("At least one of 'codes' or 'names' must be provided.")
-        if not (
-            dimension_id == 101999999999
-            or 101_000_000_000 <= dimension_id < 102_000_000_000
-            or dimension_id == 20000000003
-            or dimension_id == 20000000020
-        ):
+        if not is_lookup_dimension(dimension_id):
             raise InvalidIdentifierException(
                 "Invalid dimension_id. Must be a List (101xxxxxxxxx), Time (20000000003), "
                 "Version (20000000020), or Users (101999999999)."
             )
-        res = await self._http.post(
-            f"{self._url}/dimensions/{dimension_id}/items", json={"codes": codes, "names": names}
+        items: dict[int, DimensionWithCode] = {}
+        if codes:
+            items.update((i.id, i) for i in await self._lookup(dimension_id, "code", codes))
+        if names:
+            items.update((i.id, i) for i in await self._lookup(dimension_id, "name", names))
+        return list(items.values())
+
+    async def _lookup(
+        self, dimension_id: int, field: Literal["code", "name"], values: list[str]
+    ) -> list[DimensionWithCode]:
+        hits, owned, pending = self._lookups.claim(
+            dimension_id, field, values, get_running_loop().create_future
         )
-        return [DimensionWithCode.model_validate(e) for e in res.get("items", [])]
+        url = f"{self._url}/dimensions/{dimension_id}/items"
+
+        async def post(batch: list[str]) -> list[DimensionWithCode]:
+            payload = (
+                {"codes": batch, "names": None}
+                if field == "code"
+                else {"codes": None, "names": batch}
+            )
+            res = await self._http.post(url, json=payload)
+            return [DimensionWithCode.model_validate(e) for e in res.get("items", [])]
+
+        batches = [
+            owned[i : i + MAX_LOOKUP_VALUES] for i in range(0, len(owned), MAX_LOOKUP_VALUES)
+        ]
+        try:
+            found = list(
+                chain.from_iterable(await run_bounded_async(post, batches, WRITE_PARALLELISM))
+            )
+        except BaseException as e:
+            self._lookups.fail(dimension_id, field, owned, e)
+            raise
+        resolved = {**hits, **self._lookups.complete(dimension_id, field, owned, found)}
+        for value, future in pending.items():
+            if (item := await future) is not None:
+                resolved[value] = item
+        items = {resolved[v].id: resolved[v] for v in dict.fromkeys(values) if v in resolved}
+        items.update((i.id, i) for i in found)
+        return list(items.values())
+
+    async def get_dimension_index(
+        self, dimension_id: int, max_age: float = 3600, refresh: bool = False
+    ) -> DimensionIndex:
+        """
+        Get an index of the codes and names of the items in a dimension to their Ids, to resolve
+        items locally instead of looking them up one request at a time. The index is loaded once
+        with all items of the dimension and kept in memory and in the client's `cache_dir`, so it
+        is reused across runs until it is older than `max_age`. Lists are streamed, so this works
+        for Lists of any size. Time and Version cannot be listed, so their indexes start empty
+        and are filled as items are resolved with `resolve_dimension_items`.
+        :param dimension_id: The ID of the dimension.
+        :param max_age: The maximum age of the index in seconds before it is reloaded.
+        :param refresh: If True, reload the index regardless of its age.
+        :return: The index of the dimension.
+        """
+        index = None if refresh else await to_thread(self._indexes.get, dimension_id, max_age)
+        if index is not None:
+            return index
+        index = DimensionIndex(dimension_id)
+        if 101_000_000_000 <= dimension_id < 101_999_999_999:
+            async for item in self.iter_list_items(dimension_id, return_raw=True):
+                index.add((item,))
+        elif dimension_id not in (20000000003, 20000000020):
+            res = await self._http.get(
+                f"{self._url}/dimensions/{validate_dimension_id(dimension_id, warn=False)}/items"
+            )
+            index.add(res.get("items", []))
+        await to_thread(self._indexes.put, index)
+        logger.info(f"Loaded index of {len(index)} items for dimension '{dimension_id}'.")
+        return index
+
+    async def resolve_dimension_items(
+        self,
+        dimension_id: int,
+        values: list[str],
+        by: Literal["code", "name"] = "code",
+        max_age: float = 3600,
+    ) -> dict[str, int]:
+        """
+        Resolves the codes or names of items in a dimension to their Ids using the index of the
+        dimension, see `get_dimension_index`. Values that are not in the index, for example items
+        added since the index was loaded, are looked up with a single request and added to the
+        index, so it is refreshed incrementally without reloading the entire dimension.
+        :param dimension_id: The ID of the dimension.
+        :param values: The codes or names of the items.
+        :param by: Whether `values` are codes or names.
+        :param max_age: The maximum age of the index in seconds before it is reloaded.
+        :return: The Ids by code or name. Values that do not exist in the dimension are omitted.
+        """
+        index = await self.get_dimension_index(dimension_id, max_age)
+        missing = index.missing(values, by)
+        if missing and is_lookup_dimension(dimension_id):
+            found = await self.lookup_dimension_items(
+                dimension_id, **{"codes" if by == "code" else "names": missing}
+            )
+            index.add(e.model_dump() for e in found)
+            await to_thread(self._indexes.changed, index)
+        return index.resolve(values, by)
 
     async def get_view_dimension_items(self, view_id: int, dimension_id: int) -> list[Dimension]:
         """
@@ -473,3 +867,34 @@ class _AsyncTransactionalClient:
         """
         res = await self._http.get(f"{self._url}/lineItems/{line_item_id}/dimensions")
         return [Dimension.model_validate(e) for e in res.get("dimensions", [])]
+
+    async def get_line_item_dimension_index(
+        self, line_item_ids: Iterable[int] | None = None, max_parallel: int = WRITE_PARALLELISM
+    ) -> LineItemDimensionIndex:
+        """
+        Get the dimensions of many Line Items at once, along with the inverted index from each
+        dimension to the Line Items that use it. Line Items that are not in the index yet are
+        requested with at most `max_parallel` requests in flight. The index is stored in the
+        client's `cache_dir` and reused until the Model is saved again, so as long as the Model is
+        unchanged, only the Model details are requested to compare its `last_saved_serial_number`.
+        :param line_item_ids: The IDs of the Line Items, or None for all Line Items of the Model.
+        :param max_parallel: The maximum number of concurrent requests.
+        :return: The index. It may hold more Line Items than requested, if they were requested
+                 before.
+        """
+        serial_number = (await self.get_model_details()).last_saved_serial_number
+        index = await to_thread(self._line_item_dimensions.get, serial_number)
+        if index is None:
+            index = LineItemDimensionIndex(serial_number)
+        if line_item_ids is None:
+            line_item_ids = [e.id for e in await self.get_line_items()]
+        missing = index.missing(line_item_ids)
+        if missing:
+            logger.info(f"Requesting the dimensions of {len(missing)} Line Items.")
+            dimensions = await run_bounded_async(
+                self.get_line_item_dimensions, missing, max(max_parallel, 1)
+            )
+            for line_item_id, dims in zip(missing, dimensions, strict=True):
+                index.add(line_item_id, dims)
+            await to_thread(self._line_item_dimensions.put, index)
+        return index
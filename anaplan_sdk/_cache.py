@@ -0,0 +1,239 @@
+import gzip
+import json
+import os
+import time
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from threading import Lock
+from typing import Any, Iterator
+from weakref import finalize
+
+from pydantic import ValidationError
+
+from anaplan_sdk.models import DimensionIndex, LineItemDimensionIndex, ModelMetadata
+
+_SPOOL_MEMORY = 64_000_000
+_PERSIST_INTERVAL = 60.0
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "anaplan_sdk"
+
+
+def read_json(path: Path) -> Any:
+    try:
+        with path.open("rb") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        return None
+
+
+def write_json(path: Path, content: Any) -> None:
+    """
+    Write the content to the given path atomically, so concurrent readers and interrupted writes
+    never observe a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as file:
+        json.dump(content, file)
+    os.replace(file.name, path)
+
+
+class _UploadDigests:
+    """
+    Persists the SHA-256 digest of the last successful upload for each file in each Model. Each
+    digest is kept in its own file and replaced atomically, so reading or writing a digest never
+    touches the digests of other files, and concurrent processes uploading to different files
+    cannot overwrite each other's digests.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._dir = cache_dir / "upload_digests"
+
+    def get(self, model_id: str | None, file_id: int) -> str | None:
+        try:
+            return self._path(model_id, file_id).read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def set(self, model_id: str | None, file_id: int, digest: str) -> None:
+        path = self._path(model_id, file_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as file:
+            file.write(digest)
+        os.replace(file.name, path)
+
+    def _path(self, model_id: str | None, file_id: int) -> Path:
+        return self._dir / str(model_id) / f"{file_id}.sha256"
+
+
+class _DimensionIndexes:
+    """
+    Keeps the dimension indexes of a Model in memory and persists them in `cache_dir`, so that the
+    indexes survive across runs and do not need to be reloaded until they expire. Indexes are
+    written when they are loaded, while items added to an index afterwards are written at most
+    once per `_PERSIST_INTERVAL` seconds, so that resolving a few items at a time does not rewrite
+    the entire index on every miss. Indexes with items that have not been written yet are written
+    when the cache is garbage collected or the interpreter exits.
+    """
+
+    def __init__(self, cache_dir: Path, model_id: str) -> None:
+        self._dir = cache_dir / "dimensions"
+        self._model_id = model_id
+        self._indexes: dict[int, DimensionIndex] = {}
+        self._written: dict[int, float] = {}
+        self._unwritten: dict[Path, DimensionIndex] = {}
+        self._lock = Lock()
+        finalize(self, _write_indexes, self._unwritten, self._lock)
+
+    def get(self, dimension_id: int, max_age: float) -> DimensionIndex | None:
+        with self._lock:
+            index = self._indexes.get(dimension_id)
+            if index is None:
+                data = read_json(self._path(dimension_id))
+                index = DimensionIndex.from_dict(data) if data else None
+            if index is None or index.age > max_age:
+                return None
+            self._indexes[dimension_id] = index
+            return index
+
+    def put(self, index: DimensionIndex) -> None:
+        with self._lock:
+            self._indexes[index.dimension_id] = index
+            self._write(index)
+
+    def changed(self, index: DimensionIndex) -> None:
+        with self._lock:
+            self._indexes[index.dimension_id] = index
+            last = self._written.get(index.dimension_id, float("-inf"))
+            if time.monotonic() - last >= _PERSIST_INTERVAL:
+                self._write(index)
+            else:
+                self._unwritten[self._path(index.dimension_id)] = index
+
+    def _write(self, index: DimensionIndex) -> None:
+        path = self._path(index.dimension_id)
+        self._unwritten.pop(path, None)
+        write_json(path, index.to_dict())
+        self._written[index.dimension_id] = time.monotonic()
+
+    def _path(self, dimension_id: int) -> Path:
+        return self._dir / f"{self._model_id}-{dimension_id}.json"
+
+
+def _write_indexes(unwritten: dict[Path, DimensionIndex], lock: Lock) -> None:
+    with lock:
+        for path, index in unwritten.items():
+            write_json(path, index.to_dict())
+        unwritten.clear()
+
+
+class _LineItemDimensionIndexes:
+    """
+    Keeps the Line Item dimension index of a Model in memory and persists it in `cache_dir`. Only
+    the index of the latest revision of the Model is kept.
+    """
+
+    def __init__(self, cache_dir: Path, model_id: str) -> None:
+        self._path = cache_dir / "line_item_dimensions" / f"{model_id}.json"
+        self._index: LineItemDimensionIndex | None = None
+        self._lock = Lock()
+
+    def get(self, serial_number: int) -> LineItemDimensionIndex | None:
+        with self._lock:
+            if self._index is None or self._index.serial_number != serial_number:
+                data = read_json(self._path)
+                self._index = LineItemDimensionIndex.from_dict(data) if data else None
+            if self._index is None or self._index.serial_number != serial_number:
+                return None
+            return self._index
+
+    def put(self, index: LineItemDimensionIndex) -> None:
+        with self._lock:
+            self._index = index
+            write_json(self._path, index.to_dict())
+
+
+class _MetadataSnapshots:
+    """
+    Keeps the metadata snapshots of Models in memory and persists them in `cache_dir` as
+    compressed JSON. A snapshot is only returned for the serial number it was taken at, so it is
+    invalidated by any save of the Model.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._dir = cache_dir / "metadata"
+        self._snapshots: dict[str, ModelMetadata] = {}
+        self._lock = Lock()
+
+    def get(self, model_id: str, serial_number: int) -> ModelMetadata | None:
+        with self._lock:
+            snapshot = self._snapshots.get(model_id) or self._read(model_id)
+            if snapshot is None or snapshot.last_saved_serial_number != serial_number:
+                return None
+            self._snapshots[model_id] = snapshot
+            return snapshot
+
+    def put(self, snapshot: ModelMetadata) -> None:
+        with self._lock:
+            self._snapshots[snapshot.model_id] = snapshot
+            path = self._path(snapshot.model_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as file:
+                file.write(gzip.compress(snapshot.model_dump_json().encode()))
+            os.replace(file.name, path)
+
+    def _read(self, model_id: str) -> ModelMetadata | None:
+        try:
+            content = gzip.decompress(self._path(model_id).read_bytes())
+            return ModelMetadata.model_validate_json(content)
+        except OSError:
+            return None
+        except EOFError:
+            return None
+        except ValidationError:
+            return None
+
+    def _path(self, model_id: str) -> Path:
+        return self._dir / f"{model_id}.json.gz"
+
+
+class _Spool:
+    """
+    Buffers a stream of chunks while hashing it, so the digest is known before the first chunk is
+    uploaded. Chunks are kept in memory up to 64MB and spill to a temporary file beyond that, so
+    streams larger than RAM can be replayed with their original chunk boundaries.
+    """
+
+    def __init__(self) -> None:
+        self._file = SpooledTemporaryFile(max_size=_SPOOL_MEMORY)
+        self._sizes: list[int] = []
+        self._hash = sha256()
+
+    def write(self, chunk: str | bytes) -> None:
+        chunk = chunk.encode() if isinstance(chunk, str) else chunk
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self._sizes.append(len(chunk))
+
+    @property
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def size(self) -> int:
+        return sum(self._sizes)
+
+    def chunks(self) -> Iterator[bytes]:
+        try:
+            self._file.seek(0)
+            for size in self._sizes:
+                yield self._file.read(size)
+        finally:
+            self._file.close()
+
+    def close(self) -> None:
+        self._file.close()
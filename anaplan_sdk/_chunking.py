@@ -0,0 +1,302 @@
+import os
+from asyncio import Semaphore, Task, create_task, gather
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from math import ceil
+from threading import Lock
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence, TypeVar
+
+MIN_CHUNK_SIZE = 1_000_000
+MAX_CHUNK_SIZE = 50_000_000
+_INITIAL_CHUNK_SIZE = 10_000_000
+_TARGET_SECONDS = 10.0
+_SMOOTHING = 0.3
+MAX_MODULE_WRITE_CELLS = 100_000
+MAX_MODULE_WRITE_BYTES = 15_000_000
+MAX_LIST_WRITE_ITEMS = 100_000
+MAX_LIST_WRITE_BYTES = 15_000_000
+WRITE_PARALLELISM = 4
+MAX_VIEW_CELLS = 1_000_000
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _ChunkSizer:
+    """
+    Chooses the chunk size and the number of concurrent chunk uploads for uploads with
+    `upload_chunk_size="auto"`.
+
+    The first round splits the content evenly across all connections. After each round, the chunk
+    size is set so that a single chunk takes about ten seconds at the observed per-connection
+    throughput, which keeps fast links busy with few large chunks. Retries shrink the chunks and
+    reduce the parallelism, so that a flaky link re-sends less data per failure. Chunk sizes always
+    stay within the 1MB to 50MB range supported by Anaplan.
+    """
+
+    def __init__(self, max_parallel: int | None = None) -> None:
+        self.max_parallel = max(max_parallel or os.cpu_count() or 4, 1)
+        self._throughput: float | None = None
+        self._failure_rate = 0.0
+        self._seconds = 0.0
+        self.chunk_sizes: list[int] = []
+        self.retries = 0
+        self.parallelism = 0
+        self._lock = Lock()
+
+    def next_size(self, remaining: int | None = None) -> int:
+        """
+        :param remaining: The number of bytes left to upload, if known.
+        :return: The size of the next chunks.
+        """
+        if self._throughput is None:
+            if remaining is None:
+                return _INITIAL_CHUNK_SIZE
+            size = ceil(remaining / self.max_parallel)
+        else:
+            size = self._throughput * _TARGET_SECONDS / (1 + 4 * self._failure_rate)
+            if remaining is not None:
+                size = min(size, ceil(remaining / self.max_parallel))
+        return int(min(max(size, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE))
+
+    def next_parallelism(self, remaining: int | None = None, size: int | None = None) -> int:
+        """
+        :param remaining: The number of bytes left to upload, if known.
+        :param size: The size of the next chunks.
+        :return: The number of chunks to upload concurrently in the next round.
+        """
+        parallel = max(1, round(self.max_parallel * (1 - self._failure_rate)))
+        if remaining is not None and size:
+            parallel = min(parallel, ceil(remaining / size))
+        self.parallelism = max(self.parallelism, parallel)
+        return parallel
+
+    def record(self, size: int, seconds: float, attempts: int) -> None:
+        """
+        Record the outcome of a single chunk upload.
+        :param size: The uncompressed size of the chunk.
+        :param seconds: The time it took to upload the chunk, including retries.
+        :param attempts: The number of requests it took to upload the chunk.
+        """
+        with self._lock:
+            self.chunk_sizes.append(size)
+            self.retries += attempts - 1
+            self._seconds += seconds
+            failed = 1.0 if attempts > 1 else 0.0
+            self._failure_rate += _SMOOTHING * (failed - self._failure_rate)
+            throughput = size / max(seconds, 1e-3)
+            if self._throughput is None:
+                self._throughput = throughput
+            else:
+                self._throughput += _SMOOTHING * (throughput - self._throughput)
+
+    @property
+    def throughput(self) -> float | None:
+        """
+        The mean throughput across all chunks in bytes per second per connection.
+        """
+        return sum(self.chunk_sizes) / self._seconds if self._seconds else None
+
+
+class _Coalescer:
+    """
+    Re-cuts a stream of text and bytes pieces into chunks of a target size. Text is encoded in
+    slices no larger than the target size into a single buffer that is reused for the entire
+    stream, so neither many small pieces nor a few very large strings lead to oversized
+    allocations or a large number of tiny chunks.
+    """
+
+    def __init__(self, size: Callable[[], int]) -> None:
+        self._size = size
+        self._target = size()
+        self._buffer = bytearray()
+
+    def add(self, piece: str | bytes) -> Iterator[bytes]:
+        if isinstance(piece, bytes):
+            yield from self._extend(piece)
+            return
+        for i in range(0, len(piece), self._target):
+            yield from self._extend(piece[i : i + self._target].encode())
+
+    def flush(self) -> Iterator[bytes]:
+        if self._buffer:
+            yield bytes(self._buffer)
+            self._buffer.clear()
+
+    def _extend(self, data: bytes) -> Iterator[bytes]:
+        self._buffer += data
+        while len(self._buffer) >= self._target:
+            yield bytes(self._buffer[: self._target])
+            del self._buffer[: self._target]
+            self._target = self._size()
+
+
+def coalesce_chunks(content: Iterable[str | bytes], size: Callable[[], int]) -> Iterator[bytes]:
+    """
+    Re-cut the pieces of a text or bytes stream into chunks of the target size.
+    :param content: The stream to re-cut.
+    :param size: Called once per chunk to determine the size of the next chunk.
+    :return: A generator yielding the chunks. Only the last chunk may be smaller than the target.
+    """
+    coalescer = _Coalescer(size)
+    for piece in content:
+        yield from coalescer.add(piece)
+    yield from coalescer.flush()
+
+
+async def coalesce_chunks_async(
+    content: AsyncIterator[str | bytes], size: Callable[[], int]
+) -> AsyncIterator[bytes]:
+    """
+    Re-cut the pieces of an asynchronous text or bytes stream into chunks of the target size.
+    :param content: The stream to re-cut.
+    :param size: Called once per chunk to determine the size of the next chunk.
+    :return: An async generator yielding the chunks. Only the last chunk may be smaller than the
+             target.
+    """
+    coalescer = _Coalescer(size)
+    async for piece in content:
+        for chunk in coalescer.add(piece):
+            yield chunk
+    for chunk in coalescer.flush():
+        yield chunk
+
+
+def encoded_chunks(
+    items: Sequence[Any], encode: Callable[[Any], bytes], max_count: int, max_bytes: int
+) -> Iterator[tuple[int, int, bytes]]:
+    """
+    Split the items into encoded JSON arrays of at most `max_count` items and `max_bytes` bytes.
+    If all items fit into a single array, they are encoded at once. Otherwise, each item is encoded
+    individually and the arrays are assembled from the encoded items, so that every item is
+    encoded exactly once. A single item exceeding `max_bytes` is yielded as an array of its own.
+    :param items: The items to split.
+    :param encode: The function to encode an item or the list of all items with.
+    :param max_count: The maximum number of items per array.
+    :param max_bytes: The maximum size of an encoded array in bytes.
+    :return: A generator yielding the index of the first item in each array, the number of
+             items in it and the array.
+    """
+    if len(items) <= max_count:
+        content = encode(items)
+        if len(content) <= max_bytes:
+            yield 0, len(items), content
+            return
+    start, parts, size = 0, list[bytes](), 2
+    for i, item in enumerate(items):
+        part = encode(item)
+        if parts and (len(parts) >= max_count or size + len(part) + 1 > max_bytes):
+            yield start, len(parts), b"[" + b",".join(parts) + b"]"
+            start, parts, size = i, [], 2
+        size += len(part) + (1 if parts else 0)
+        parts.append(part)
+    if parts:
+        yield start, len(parts), b"[" + b",".join(parts) + b"]"
+
+
+def run_bounded(func: Callable[[T], R], args: Iterable[T], max_parallel: int) -> list[R]:
+    """
+    Call the function with each of the arguments on a pool of at most `max_parallel` threads.
+    Arguments are only taken from the iterable once a thread is free, so lazily produced arguments,
+    like encoded chunks, are never all held in memory at once.
+    :param func: The function to call.
+    :param args: The arguments to call the function with.
+    :param max_parallel: The maximum number of concurrent calls.
+    :return: The results in the order of the arguments.
+    """
+    futures: list[Future[R]] = []
+    running: set[Future[R]] = set()
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        try:
+            for arg in args:
+                if len(running) >= max_parallel:
+                    _, running = wait(running, return_when=FIRST_COMPLETED)
+                future = executor.submit(func, arg)
+                futures.append(future)
+                running.add(future)
+            return [f.result() for f in futures]
+        finally:
+            for future in running:
+                future.cancel()
+
+
+async def run_bounded_async(
+    func: Callable[[T], Awaitable[R]], args: Iterable[T], max_parallel: int
+) -> list[R]:
+    """
+    Await the function with each of the arguments, with at most `max_parallel` calls in flight.
+    Arguments are only taken from the iterable once a slot is free.
+    :param func: The function to call.
+    :param args: The arguments to call the function with.
+    :param max_parallel: The maximum number of concurrent calls.
+    :return: The results in the order of the arguments.
+    """
+    semaphore, tasks = Semaphore(max_parallel), list[Task[R]]()
+
+    async def run(arg: T) -> R:
+        try:
+            return await func(arg)
+        finally:
+            semaphore.release()
+
+    try:
+        for arg in args:
+            await semaphore.acquire()
+            tasks.append(create_task(run(arg)))
+        return list(await gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def iter_bounded(func: Callable[[T], R], args: Iterable[T], max_parallel: int) -> Iterator[R]:
+    """
+    Call the function with each of the arguments on a pool of at most `max_parallel` threads and
+    yield the results in the order of the arguments as soon as they are available. At most
+    `max_parallel` results are in flight or waiting to be consumed at any time, so large results,
+    like the slices of a View, are streamed instead of all held in memory at once.
+    :param func: The function to call.
+    :param args: The arguments to call the function with.
+    :param max_parallel: The maximum number of concurrent calls.
+    :return: A generator yielding the results in the order of the arguments.
+    """
+    pending: deque[Future[R]] = deque()
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        try:
+            for arg in args:
+                if len(pending) >= max_parallel:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(func, arg))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def iter_bounded_async(
+    func: Callable[[T], Awaitable[R]], args: Iterable[T], max_parallel: int
+) -> AsyncIterator[R]:
+    """
+    Await the function with each of the arguments, with at most `max_parallel` calls in flight or
+    waiting to be consumed, and yield the results in the order of the arguments.
+    :param func: The function to call.
+    :param args: The arguments to call the function with.
+    :param max_parallel: The maximum number of concurrent calls.
+    :return: An async generator yielding the results in the order of the arguments.
+    """
+    pending: deque[Task[R]] = deque()
+
+    async def run(arg: T) -> R:
+        return await func(arg)
+
+    try:
+        for arg in args:
+            if len(pending) >= max_parallel:
+                yield await pending.popleft()
+            pending.append(create_task(run(arg)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -35,8 +35,10 @@ class _AuditClient:
         params = sort_params(sort_by, descending)
         if search_pattern:
             params["s"] = search_pattern
-        res = self._http.get_paginated("https://api.anaplan.com/2/0/users", "users", params=params)
-        return [User.model_validate(e) for e in res]
+        res = self._http.get_paginated_validated(
+            "https://api.anaplan.com/2/0/users", "users", User, params=params
+        )
+        return list(res)
 
     def get_user(self, user_id: str = "me") -> User:
         """
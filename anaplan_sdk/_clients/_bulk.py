@@ -1,15 +1,25 @@
 # pyright: reportPrivateUsage=false
 import logging
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import copy
-from time import sleep
-from typing import Any, Iterator, Literal, overload
+from functools import partial
+from hashlib import sha256
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Literal, Mapping, Sequence, overload
 
 import httpx
 from typing_extensions import Self
 
 from anaplan_sdk._auth import _create_auth
+from anaplan_sdk._cache import _MetadataSnapshots, _Spool, _UploadDigests, default_cache_dir
+from anaplan_sdk._chunking import _ChunkSizer, coalesce_chunks
+from anaplan_sdk._codec import JsonCodecName, get_json_codec
+from anaplan_sdk._delta import RowChange, _RowDelta, delta_index_path
+from anaplan_sdk._downloads import _OrderedWriter, chunk_urls, write_blocks
+from anaplan_sdk._polling import PollingPolicy, TaskHandle, _TaskPoller, as_delay, as_policy
 from anaplan_sdk._services import _HttpService
 from anaplan_sdk._utils import action_url, models_url, sort_params
 from anaplan_sdk.exceptions import AnaplanActionError, InvalidIdentifierException
@@ -21,11 +31,12 @@ from anaplan_sdk.models import (
     Import,
     Model,
     ModelDeletionResult,
+    ModelMetadata,
     ModelWithTransactionInfo,
     Process,
-    Task,
     TaskStatus,
     TaskSummary,
+    UploadResult,
     Workspace,
 )
 from anaplan_sdk.models._task import _TaskStatusPoll
@@ -63,10 +74,13 @@ class Client:
         backoff: float = 1.0,
         backoff_factor: float = 2.0,
         page_size: int = 5_000,
-        status_poll_delay: int = 1,
+        status_poll_delay: float | PollingPolicy = 1,
         upload_parallel: bool = True,
-        upload_chunk_size: int = 25_000_000,
+        upload_chunk_size: int | Literal["auto"] = 25_000_000,
         allow_file_creation: bool = False,
+        skip_unchanged_uploads: bool = False,
+        cache_dir: str | Path | None = None,
+        json_codec: JsonCodecName = "json",
         **httpx_kwargs: Any,
     ) -> None:
         """
@@ -108,15 +122,30 @@ class Client:
         :param page_size: The number of items to return per page when paginating through results.
                Defaults to 5000. This is the maximum number of items that can be returned per
                request. If you pass a value greater than 5000, it will be capped to 5000.
-        :param status_poll_delay: The delay between polling the status of a task.
+        :param status_poll_delay: The delay in seconds between polling the status of a task, or a
+               `PollingPolicy` for fractional, exponentially growing or progress-driven delays.
+               The policy applies to all waits on Bulk Actions, ALM Tasks and CloudWorks runs.
         :param upload_parallel: Whether to upload chunks in parallel when uploading files.
         :param upload_chunk_size: The size of the chunks to upload. This is the maximum size of
-               each chunk. Defaults to 25MB.
+               each chunk. Defaults to 25MB. If "auto", `upload_file` chooses the chunk size and
+               the number of concurrent chunk uploads from the size of the content, the observed
+               throughput and the number of retries, within Anaplan's limit of 1MB to 50MB per
+               chunk. The choices are reported in the returned `UploadResult`.
         :param allow_file_creation: Whether to allow the creation of new files. Defaults to False
                since this is typically unintentional and may well be unwanted behaviour in the API
                altogether. A file that is created this way will not be referenced by any action in
                anaplan until manually assigned so there is typically no value in dynamically
                creating new files and uploading content to them.
+        :param skip_unchanged_uploads: Whether to skip uploads if the content is identical to the
+               last successful upload to the same file in the same Model. The SHA-256 digest of
+               every upload is stored in `cache_dir` for this purpose. Note that this cannot detect
+               changes made to the file by anyone else in the meantime. Defaults to False.
+        :param cache_dir: The directory for local caches, such as the digests of past uploads.
+               Defaults to `$XDG_CACHE_HOME/anaplan_sdk` or `~/.cache/anaplan_sdk`.
+        :param json_codec: The library to encode request payloads and decode responses with.
+               Defaults to the standard library `json` module. `orjson` and `msgspec` are several
+               times faster for large payloads, such as inserting List Items or writing cells, but
+               require the respective library to be installed.
         :param httpx_kwargs: Additional keyword arguments to pass to the `httpx.Client`.
                This can be used to set additional options such as proxies, headers, etc. See
                https://www.python-httpx.org/api/#client for the full list of arguments.
@@ -136,23 +165,27 @@ class Client:
             backoff=backoff,
             backoff_factor=backoff_factor,
             page_size=page_size,
+            codec=get_json_codec(json_codec),
         )
         self._retry_count = retry_count
         self._workspace_id = workspace_id
         self._model_id = model_id
         self._url = f"https://api.anaplan.com/2/0/workspaces/{workspace_id}/models/{model_id}"
-        self._transactional_client = (
-            _TransactionalClient(self._http, model_id) if model_id else None
-        )
-        self._alm_client = _AlmClient(self._http, model_id, status_poll_delay) if model_id else None
+        self._poller = _TaskPoller(as_policy(status_poll_delay))
+        self._alm_client = _AlmClient(self._http, model_id, self._poller) if model_id else None
         self._audit_client = _AuditClient(self._http)
         self._scim_client = _ScimClient(self._http)
-        self._cloud_works = _CloudWorksClient(self._http)
+        self._cloud_works = _CloudWorksClient(self._http, self._poller)
         self._thread_count = multiprocessing.cpu_count()
-        self.status_poll_delay = status_poll_delay
         self.upload_parallel = upload_parallel
         self.upload_chunk_size = upload_chunk_size
         self.allow_file_creation = allow_file_creation
+        self._cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._transactional_client = (
+            _TransactionalClient(self._http, model_id, self._cache_dir) if model_id else None
+        )
+        self._digests = _UploadDigests(self._cache_dir) if skip_unchanged_uploads else None
+        self._metadata = _MetadataSnapshots(self._cache_dir)
         logger.debug(f"Initialized Client with workspace_id={workspace_id}, model_id={model_id}")
 
     def with_model(self, model_id: str | None = None, workspace_id: str | None = None) -> Self:
@@ -175,15 +208,28 @@ class Client:
             f"/{client._workspace_id}/models/{client._model_id}"
         )
         client._transactional_client = (
-            _TransactionalClient(self._http, client._model_id) if client._model_id else None
-        )
-        client._alm_client = (
-            _AlmClient(self._http, client._model_id, self.status_poll_delay)
+            _TransactionalClient(self._http, client._model_id, self._cache_dir)
             if client._model_id
             else None
         )
+        client._alm_client = (
+            _AlmClient(self._http, client._model_id, self._poller) if client._model_id else None
+        )
         return client
 
+    @property
+    def status_poll_delay(self) -> float | PollingPolicy:
+        """
+        The delay in seconds between polling the status of a task, or the `PollingPolicy` if it
+        is not a fixed delay. This is shared with the ALM and CloudWorks Clients of this Client
+        and with copies created by `with_model`, so changing it here changes it there as well.
+        """
+        return as_delay(self._poller.policy)
+
+    @status_poll_delay.setter
+    def status_poll_delay(self, value: float | PollingPolicy) -> None:
+        self._poller.policy = as_policy(value)
+
     @property
     def audit(self) -> _AuditClient:
         """
@@ -288,10 +334,10 @@ class Client:
         params = {"tenantDetails": "true"} | sort_params(sort_by, descending)
         if search_pattern:
             params["s"] = search_pattern
-        res = self._http.get_paginated(
-            "https://api.anaplan.com/2/0/workspaces", "workspaces", params=params
+        res = self._http.get_paginated_validated(
+            "https://api.anaplan.com/2/0/workspaces", "workspaces", Workspace, params=params
         )
-        return [Workspace.model_validate(e) for e in res]
+        return list(res)
 
     def get_model(self, model_id: str | None = None) -> ModelWithTransactionInfo:
         """
@@ -336,10 +382,10 @@ class Client:
         params = {"modelDetails": "true"} | sort_params(sort_by, descending)
         if search_pattern:
             params["s"] = search_pattern
-        res = self._http.get_paginated(
-            models_url(only_in_workspace, self._workspace_id), "models", params=params
+        res = self._http.get_paginated_validated(
+            models_url(only_in_workspace, self._workspace_id), "models", Model, params=params
         )
-        return [Model.model_validate(e) for e in res]
+        return list(res)
 
     def delete_models(self, model_ids: list[str]) -> ModelDeletionResult:
         """
@@ -364,10 +410,10 @@ class Client:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Files.
         """
-        res = self._http.get_paginated(
-            f"{self._url}/files", "files", params=sort_params(sort_by, descending)
+        res = self._http.get_paginated_validated(
+            f"{self._url}/files", "files", File, params=sort_params(sort_by, descending)
         )
-        return [File.model_validate(e) for e in res]
+        return list(res)
 
     def get_actions(self, sort_by: SortBy = None, descending: bool = False) -> list[Action]:
         """
@@ -378,10 +424,10 @@ class Client:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Actions.
         """
-        res = self._http.get_paginated(
-            f"{self._url}/actions", "actions", params=sort_params(sort_by, descending)
+        res = self._http.get_paginated_validated(
+            f"{self._url}/actions", "actions", Action, params=sort_params(sort_by, descending)
         )
-        return [Action.model_validate(e) for e in res]
+        return list(res)
 
     def get_processes(self, sort_by: SortBy = None, descending: bool = False) -> list[Process]:
         """
@@ -390,10 +436,10 @@ class Client:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Processes.
         """
-        res = self._http.get_paginated(
-            f"{self._url}/processes", "processes", params=sort_params(sort_by, descending)
+        res = self._http.get_paginated_validated(
+            f"{self._url}/processes", "processes", Process, params=sort_params(sort_by, descending)
         )
-        return [Process.model_validate(e) for e in res]
+        return list(res)
 
     def get_imports(self, sort_by: SortBy = None, descending: bool = False) -> list[Import]:
         """
@@ -402,10 +448,10 @@ class Client:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Imports.
         """
-        res = self._http.get_paginated(
-            f"{self._url}/imports", "imports", params=sort_params(sort_by, descending)
+        res = self._http.get_paginated_validated(
+            f"{self._url}/imports", "imports", Import, params=sort_params(sort_by, descending)
         )
-        return [Import.model_validate(e) for e in res]
+        return list(res)
 
     def get_exports(self, sort_by: SortBy = None, descending: bool = False) -> list[Export]:
         """
@@ -414,10 +460,52 @@ class Client:
         :param descending: If True, the results will be sorted in descending order.
         :return: The List of Exports.
         """
-        res = self._http.get_paginated(
-            f"{self._url}/exports", "exports", params=sort_params(sort_by, descending)
+        res = self._http.get_paginated_validated(
+            f"{self._url}/exports", "exports", Export, params=sort_params(sort_by, descending)
         )
-        return [Export.model_validate(e) for e in res]
+        return list(res)
+
+    def snapshot_model_metadata(self, refresh: bool = False) -> ModelMetadata:
+        """
+        Takes a snapshot of the metadata of the Model: its Modules, Line Items, Lists, Views,
+        Imports, Exports, Files, Processes and other Actions, fetched concurrently. The snapshot is
+        stored in the client's `cache_dir` and reused until the Model is saved again, so as long as
+        the Model is unchanged, this only requests the Model itself to compare its
+        `last_saved_serial_number`, even across runs.
+        :param refresh: If True, the metadata is fetched even if the stored snapshot is current.
+        :return: The snapshot, with indexes of Line Items and Views by Module and of Actions by
+                 name.
+        """
+        model = self.get_model()
+        if not refresh and (
+            snapshot := self._metadata.get(model.id, model.last_saved_serial_number)
+        ):
+            logger.debug(
+                f"Using the metadata snapshot of serial number {model.last_saved_serial_number}."
+            )
+            return snapshot
+        tr = self.tr
+        with ThreadPoolExecutor(max_workers=9) as pool:
+            modules, line_items = pool.submit(tr.get_modules), pool.submit(tr.get_line_items)
+            lists, views = pool.submit(tr.get_lists), pool.submit(tr.get_views)
+            imports, exports = pool.submit(self.get_imports), pool.submit(self.get_exports)
+            files, processes = pool.submit(self.get_files), pool.submit(self.get_processes)
+            actions = pool.submit(self.get_actions)
+        snapshot = ModelMetadata(
+            model_id=model.id,
+            last_saved_serial_number=model.last_saved_serial_number,
+            modules=modules.result(),
+            line_items=line_items.result(),
+            lists=lists.result(),
+            views=views.result(),
+            imports=imports.result(),
+            exports=exports.result(),
+            files=files.result(),
+            processes=processes.result(),
+            actions=actions.result(),
+        )
+        self._metadata.put(snapshot)
+        return snapshot
 
     @overload
     def run_action(
@@ -425,9 +513,13 @@ class Client:
     ) -> CompletedTask: ...
 
     @overload
-    def run_action(self, action_id: int, wait_for_completion: Literal[False] = False) -> Task: ...
+    def run_action(
+        self, action_id: int, wait_for_completion: Literal[False]
+    ) -> TaskHandle[TaskStatus, CompletedTask]: ...
 
-    def run_action(self, action_id: int, wait_for_completion: bool = True) -> TaskStatus:
+    def run_action(
+        self, action_id: int, wait_for_completion: bool = True
+    ) -> CompletedTask | TaskHandle[TaskStatus, CompletedTask]:
         """
         Runs the Action and validates the spawned task. If the Action fails or completes with
         errors, this will raise an AnaplanActionError. Failed Tasks are often not something you
@@ -436,24 +528,76 @@ class Client:
         :param action_id: The identifier of the Action to run. Can be any Anaplan Invokable;
                Processes, Imports, Exports, Other Actions.
         :param wait_for_completion: If True, the method will poll the task status and not return
-               until the task is complete. If False, it will spawn the task and return immediately.
+               until the task is complete. If False, it will spawn the task and return a handle
+               immediately. The handle is a `concurrent.futures.Future` that resolves to the
+               completed Task, so you can compose many Tasks with `concurrent.futures.wait()`.
+        :return: The completed Task, or a handle to the running Task.
         """
         body = {"localeName": "en_US"}
         res = self._http.post(f"{self._url}/{action_url(action_id)}/{action_id}/tasks", json=body)
         task_id = res["task"]["taskId"]
         logger.info(f"Invoked Action '{action_id}', spawned Task: '{task_id}'.")
 
+        handle = self._track(self._url, action_id, task_id)
         if not wait_for_completion:
-            return self.get_task_status(action_id, task_id)
-        while (task := self.get_task_status(action_id, task_id)).task_state != "COMPLETE":
-            sleep(self.status_poll_delay)
-        if not task.result.successful:
-            logger.error(f"Task '{task_id}' completed with errors.")
-            raise AnaplanActionError(f"Task '{task_id}' completed with errors.")
-
+            return handle
+        task = handle.result()
         logger.info(f"Task '{task_id}' of Action '{action_id}' completed successfully.")
         return task
 
+    def run_action_many(
+        self, model_ids: list[str], action_id: int, max_parallel: int = 8
+    ) -> Iterator[tuple[str, CompletedTask]]:
+        """
+        Runs the same Action on several Models in the current Workspace. At most `max_parallel`
+        Tasks are running at any given time. The status of all running Tasks is polled together,
+        and the results are yielded as soon as each Model finishes, so the order of the results
+        does not necessarily match the order of `model_ids`. The Tasks are only spawned when you
+        start consuming the returned iterator.
+
+        Unlike `run_action()`, this will not raise an `AnaplanActionError` if a Task completes
+        with errors, since that would abandon the Tasks still running on the other Models.
+        Instead, you should check `task.result.successful` for each result.
+
+        If you stop consuming the iterator early, the client stops tracking the Tasks that are
+        still running, but these Tasks are not cancelled in Anaplan and will run to completion.
+        :param model_ids: The identifiers of the Models to run the Action on.
+        :param action_id: The identifier of the Action to run. Must be the same on all Models.
+        :param max_parallel: The maximum number of Tasks to run concurrently.
+        :return: An iterator yielding tuples of the Model Id and the completed Task.
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}.")
+        return self._run_action_many(model_ids, action_id, max_parallel)
+
+    def _run_action_many(
+        self, model_ids: list[str], action_id: int, max_parallel: int
+    ) -> Iterator[tuple[str, CompletedTask]]:
+        queue, running = deque(model_ids), dict[Future[CompletedTask], str]()
+        logger.info(f"Running Action '{action_id}' on {len(queue)} Models.")
+
+        def spawn(model_id: str) -> tuple[Future[CompletedTask], str]:
+            task_id = self._spawn_task(model_id, action_id)
+            return self._track(self._model_url(model_id), action_id, task_id, False), model_id
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                while queue or running:
+                    count = min(max_parallel - len(running), len(queue))
+                    running.update(executor.map(spawn, [queue.popleft() for _ in range(count)]))
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for handle in done:
+                        model_id, task = running.pop(handle), handle.result()
+                        if not task.result.successful:
+                            logger.error(
+                                f"Task '{task.id}' on Model '{model_id}' completed with errors."
+                            )
+                        yield model_id, task
+        finally:
+            for handle in running:
+                handle.cancel()
+        logger.info(f"Completed Action '{action_id}' on all Models.")
+
     def get_file(self, file_id: int) -> bytes:
         """
         Retrieves the content of the specified file.
@@ -471,6 +615,49 @@ class Client:
             )
             return b"".join(chunks)
 
+    def get_files_content(
+        self,
+        file_ids: Iterable[int],
+        sinks: Mapping[int, IO[bytes]] | None = None,
+        max_parallel: int | None = None,
+    ) -> dict[int, bytes]:
+        """
+        Retrieves the content of several files at once. The file metadata is listed only once and
+        the chunks of all files are fetched on one shared, bounded pool. The chunks are scheduled
+        round-robin across the files, so small files are not queued behind large ones and the
+        pool stays busy until the last chunk. Each file can be streamed to its own sink, e.g. an
+        open file, in which case it is never held in memory in its entirety.
+        :param file_ids: The identifiers of the files to retrieve.
+        :param sinks: Optional mapping of file Ids to writable binary streams. The content of
+               these files is written to the respective stream in order, rather than returned.
+        :param max_parallel: The maximum number of chunks to fetch concurrently. Defaults to the
+               number of CPUs.
+        :return: A dictionary mapping the Ids of all files without a sink to their content.
+        """
+        files = self._files_pre_check(file_ids)
+        sinks, max_parallel = sinks or {}, max(max_parallel or self._thread_count, 1)
+        writers = {f.id: _OrderedWriter(sinks.get(f.id)) for f in files}
+        logger.info(f"Fetching {sum(f.chunk_count for f in files)} chunks of {len(files)} files.")
+        running: dict[Future[bytes], tuple[int, int]] = {}
+
+        def drain(limit: int) -> None:
+            while len(running) > limit:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_id, index = running.pop(future)
+                    writers[file_id].write(index, future.result())
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            try:
+                for file_id, index, url in chunk_urls(self._url, files):
+                    drain(max_parallel - 1)
+                    running[executor.submit(self._http.get_binary, url)] = file_id, index
+                drain(0)
+            finally:
+                for future in running:
+                    future.cancel()
+        return {i: c for i, w in writers.items() if (c := w.getvalue()) is not None}
+
     def get_file_stream(self, file_id: int, batch_size: int = 1) -> Iterator[bytes]:
         """
         Retrieves the content of the specified file as a stream of chunks. The chunks are yielded
@@ -500,36 +687,84 @@ class Client:
                 for chunk in batch_chunks:
                     yield chunk
 
-    def upload_file(self, file_id: int, content: str | bytes) -> None:
+    def get_file_delta(
+        self, file_id: int, key: str | Sequence[str], delimiter: str = ",", batch_size: int = 1
+    ) -> Iterator[RowChange]:
+        """
+        Retrieves the specified file and yields only the rows that changed since the last time
+        this method was called for the same file and key. Each row is identified by the values of
+        the `key` columns and compared to a compact index of row hashes from the previous run,
+        which is kept on disk in the client's `cache_dir`. The index is memory-mapped, so
+        comparing files with tens of millions of rows only requires modest amounts of memory. On
+        the first run, all rows are yielded as inserted. The index is only updated once the
+        generator is exhausted, so an interrupted iteration is compared against the same
+        previous run on the next call. Requires numpy, which is available with the `numpy` extra.
+        :param file_id: The identifier of the file to retrieve.
+        :param key: The name of the column or the names of the columns uniquely identifying a
+               row, e.g. the List Item code or the combination of all dimension columns.
+        :param delimiter: The delimiter used in the file.
+        :param batch_size: Number of chunks to fetch concurrently. Passed on to
+               `get_file_stream`.
+        :return: A generator yielding the inserted, updated and deleted rows. Deleted rows are
+                 yielded last, and only contain the values of the key columns.
+        """
+        key = [key] if isinstance(key, str) else key
+        delta = _RowDelta(
+            delta_index_path(self._cache_dir, self._model_id, file_id, key), key, delimiter
+        )
+        try:
+            for chunk in self.get_file_stream(file_id, batch_size):
+                yield from delta.feed(chunk)
+            yield from delta.close()
+        finally:
+            delta.discard()
+
+    def upload_file(self, file_id: int, content: str | bytes) -> UploadResult:
         """
         Uploads the content to the specified file. If there are several chunks, upload of
-        individual chunks are uploaded concurrently.
+        individual chunks are uploaded concurrently. If `skip_unchanged_uploads` is enabled on the
+        client and the content is identical to the last successful upload to this file, the upload
+        is skipped. In that case, you will typically want to skip the subsequent import as well,
+        which `upload_and_import` does with `skip_unchanged_import=True`.
 
         :param file_id: The identifier of the file to upload to.
         :param content: The content to upload. **This Content will be compressed before uploading.
                If you are passing the Input as bytes, pass it uncompressed.**
+        :return: The result of the upload.
         """
         if isinstance(content, str):
             content = content.encode()
-        chunks = [
-            content[i : i + self.upload_chunk_size]
-            for i in range(0, len(content), self.upload_chunk_size)
-        ]
+        digest = sha256(content).hexdigest() if self._digests else None
+        if self._is_unchanged(file_id, digest):
+            return UploadResult(
+                file_id=file_id, skipped=True, digest=digest, chunk_count=0, size=len(content)
+            )
+        chunk_size = self.upload_chunk_size
+        if isinstance(chunk_size, str):
+            return self._upload_auto(file_id, content, digest)
+        chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
         logger.info(f"Content for file '{file_id}' will be uploaded in {len(chunks)} chunks.")
         self._set_chunk_count(file_id, len(chunks))
         if self.upload_parallel:
             with ThreadPoolExecutor(max_workers=self._thread_count) as executor:
-                executor.map(
-                    self._upload_chunk, (file_id,) * len(chunks), range(len(chunks)), chunks
+                list(
+                    executor.map(
+                        self._upload_chunk, (file_id,) * len(chunks), range(len(chunks)), chunks
+                    )
                 )
         else:
             for index, chunk in enumerate(chunks):
                 self._upload_chunk(file_id, index, chunk)
         logger.info(f"Completed upload for file '{file_id}'.")
+        return self._upload_result(file_id, digest, len(chunks), len(content))
 
     def upload_file_stream(
-        self, file_id: int, content: Iterator[str | bytes], batch_size: int = 1
-    ) -> None:
+        self,
+        file_id: int,
+        content: Iterator[str | bytes],
+        batch_size: int = 1,
+        coalesce: bool = False,
+    ) -> UploadResult:
         """
         Uploads the content to the specified file as a stream of chunks. This is useful either for
         large files where you don't want to or cannot load the entire file into memory at once, or
@@ -537,36 +772,66 @@ class Client:
         on chunks i.e. consumed from a queue until it is exhausted. In this case, you can pass a
         generator that yields the chunks of the file one by one to this method.
 
+        If `skip_unchanged_uploads` is enabled on the client, the stream is consumed and hashed
+        before the first chunk is uploaded, so that unchanged content can be skipped. Streams
+        larger than 64MB are buffered in a temporary file for this purpose.
+
         :param file_id: The identifier of the file to upload to.
         :param content: An Iterator or AsyncIterator yielding the chunks of the file. You can pass
                any Iterator, but you will most likely want to pass a Generator.
         :param batch_size: Number of chunks to upload concurrently. If > 1, n chunks will be
                uploaded concurrently. This can be useful if you either do not control the chunk
                size, or if you want to keep the chunk size small but still want some concurrency.
+        :param coalesce: If True, the pieces yielded by `content` are concatenated and re-cut into
+               chunks of `upload_chunk_size`, so that generators yielding many small pieces, like
+               single rows, are uploaded in a few well-sized chunks rather than one request per
+               piece. With `upload_chunk_size="auto"`, the size of each chunk is adjusted to the
+               observed throughput. Text is encoded incrementally into a reusable buffer.
+        :return: The result of the upload.
         """
+        digest = None
+        if self._digests:
+            spool = _Spool()
+            for chunk in content:
+                spool.write(chunk)
+            digest = spool.digest
+            if self._is_unchanged(file_id, digest):
+                spool.close()
+                return UploadResult(
+                    file_id=file_id, skipped=True, digest=digest, chunk_count=0, size=spool.size
+                )
+            content = spool.chunks()
+        sizer = None
+        if coalesce:
+            chunk_size = self.upload_chunk_size
+            sizer = _ChunkSizer(batch_size) if isinstance(chunk_size, str) else None
+            content = coalesce_chunks(
+                content, sizer.next_size if sizer else lambda: int(chunk_size)
+            )
         logger.info(f"Starting upload stream for file '{file_id}' with batch size {batch_size}.")
         self._set_chunk_count(file_id, -1)
-        indices, chunks = list[int](), list[str | bytes]()
+        upload = partial(self._upload_chunk, sizer=sizer)
+        indices, chunks, count, size = list[int](), list[str | bytes](), 0, 0
         with ThreadPoolExecutor(max_workers=batch_size) as executor:
             for index, chunk in enumerate(content):
                 indices.append(index)
                 chunks.append(chunk)
+                count += 1
                 if len(indices) == max(batch_size, 1):
-                    list(
-                        executor.map(self._upload_chunk, (file_id,) * len(indices), indices, chunks)
-                    )
+                    size += sum(executor.map(upload, (file_id,) * len(indices), indices, chunks))
                     logger.info(
                         f"Completed upload stream batch of size {batch_size} for file {file_id}."
                     )
                     indices, chunks = [], []
 
             if indices:
-                executor.map(self._upload_chunk, (file_id,) * len(indices), indices, chunks)
+                size += sum(executor.map(upload, (file_id,) * len(indices), indices, chunks))
         logger.info(
             f"Completed final upload stream batch of size {len(indices)} for file {file_id}."
         )
         self._http.post(f"{self._url}/files/{file_id}/complete", json={"id": file_id})
         logger.info(f"Completed upload stream for '{file_id}'.")
+        return self._upload_result(file_id, digest, count, size, sizer)
 
     @overload
     def upload_and_import(
@@ -575,6 +840,8 @@ class Client:
         content: str | bytes,
         action_id: int,
         wait_for_completion: Literal[True] = True,
+        *,
+        skip_unchanged_import: Literal[False] = False,
     ) -> CompletedTask: ...
 
     @overload
@@ -583,12 +850,31 @@ class Client:
         file_id: int,
         content: str | bytes,
         action_id: int,
-        wait_for_completion: Literal[False] = False,
-    ) -> Task: ...
+        wait_for_completion: Literal[False],
+        *,
+        skip_unchanged_import: Literal[False] = False,
+    ) -> TaskHandle[TaskStatus, CompletedTask]: ...
 
+    @overload
     def upload_and_import(
-        self, file_id: int, content: str | bytes, action_id: int, wait_for_completion: bool = True
-    ) -> TaskStatus:
+        self,
+        file_id: int,
+        content: str | bytes,
+        action_id: int,
+        wait_for_completion: bool = True,
+        *,
+        skip_unchanged_import: bool,
+    ) -> CompletedTask | TaskHandle[TaskStatus, CompletedTask] | None: ...
+
+    def upload_and_import(
+        self,
+        file_id: int,
+        content: str | bytes,
+        action_id: int,
+        wait_for_completion: bool = True,
+        *,
+        skip_unchanged_import: bool = False,
+    ) -> CompletedTask | TaskHandle[TaskStatus, CompletedTask] | None:
         """
         Convenience wrapper around `upload_file()` and `run_action()` to upload content to a file
         and run an import action in one call.
@@ -599,9 +885,16 @@ class Client:
         :param action_id: The identifier of the action to run after uploading the content.
         :param wait_for_completion: If True, the method will poll the import task status and not
                return until the task is complete. If False, it will spawn the import task and
-               return immediately.
+               return a handle to it immediately.
+        :param skip_unchanged_import: If True and the upload was skipped because the content is
+               unchanged, see `skip_unchanged_uploads`, the import is skipped as well and None is
+               returned.
+        :return: The completed import Task, a handle to it, or None if it was skipped.
         """
-        self.upload_file(file_id, content)
+        result = self.upload_file(file_id, content)
+        if skip_unchanged_import and result.skipped:
+            logger.info(f"Skipping Action '{action_id}', since file '{file_id}' is unchanged.")
+            return None
         return self.run_action(action_id, wait_for_completion)
 
     def export_and_download(self, action_id: int) -> bytes:
@@ -634,8 +927,19 @@ class Client:
         :param task_id: The identifier of the spawned task.
         :return: The status of the task.
         """
-        res = self._http.get(f"{self._url}/{action_url(action_id)}/{action_id}/tasks/{task_id}")
-        return _TaskStatusPoll.model_validate(res).task
+        return self._get_task_status(self._url, action_id, task_id)
+
+    def track_task(self, action_id: int, task_id: str) -> TaskHandle[TaskStatus, CompletedTask]:
+        """
+        Waits for a spawned Task in the background. The status of all Tasks the client is waiting
+        for is polled from a single background thread, sharing the `max_concurrent_polls` budget
+        of the client's `PollingPolicy`. The returned handle resolves to the completed Task, or
+        raises an `AnaplanActionError` if the Task completes with errors.
+        :param action_id: The identifier of the action that was invoked.
+        :param task_id: The identifier of the spawned task.
+        :return: A handle to wait on the Task.
+        """
+        return self._track(self._url, action_id, task_id)
 
     def get_optimizer_log(self, action_id: int, task_id: str) -> bytes:
         """
@@ -648,15 +952,144 @@ class Client:
             f"{self._url}/optimizeActions/{action_id}/tasks/{task_id}/solutionLogs"
         )
 
+    def get_optimizer_log_stream(self, action_id: int, task_id: str) -> Iterator[bytes]:
+        """
+        Retrieves the solution logs of the specified optimization action task as a stream of
+        blocks, so large logs never need to be held in memory in their entirety.
+        :param action_id: The identifier of the optimization action that was invoked.
+        :param task_id: The Task identifier, sometimes also referred to as the Correlation Id.
+        :return: A generator yielding the blocks of the solution logs.
+        """
+        yield from self._http.get_stream(
+            f"{self._url}/optimizeActions/{action_id}/tasks/{task_id}/solutionLogs"
+        )
+
+    def save_optimizer_log(self, action_id: int, task_id: str, path: str | Path) -> int:
+        """
+        Streams the solution logs of the specified optimization action task to a file.
+        :param action_id: The identifier of the optimization action that was invoked.
+        :param task_id: The Task identifier, sometimes also referred to as the Correlation Id.
+        :param path: The path to write the solution logs to.
+        :return: The number of bytes written.
+        """
+        return write_blocks(self.get_optimizer_log_stream(action_id, task_id), path)
+
+    def _spawn_task(self, model_id: str, action_id: int) -> str:
+        res = self._http.post(
+            f"{self._model_url(model_id)}/{action_url(action_id)}/{action_id}/tasks",
+            json={"localeName": "en_US"},
+        )
+        task_id = res["task"]["taskId"]
+        logger.info(
+            f"Invoked Action '{action_id}' on Model '{model_id}', spawned Task: '{task_id}'."
+        )
+        return task_id
+
+    def _get_task_status(self, url: str, action_id: int, task_id: str) -> TaskStatus:
+        res = self._http.get(f"{url}/{action_url(action_id)}/{action_id}/tasks/{task_id}")
+        return _TaskStatusPoll.model_validate(res).task
+
+    def _track(
+        self, url: str, action_id: int, task_id: str, raise_on_error: bool = True
+    ) -> TaskHandle[TaskStatus, CompletedTask]:
+        def fetch() -> TaskStatus:
+            return self._get_task_status(url, action_id, task_id)
+
+        def resolve(task: TaskStatus) -> CompletedTask | None:
+            if task.task_state != "COMPLETE":
+                return None
+            if raise_on_error and not task.result.successful:
+                logger.error(f"Task '{task_id}' completed with errors.")
+                raise AnaplanActionError(f"Task '{task_id}' completed with errors.")
+            return task
+
+        return self._poller.track(task_id, fetch(), fetch, resolve)
+
+    def _model_url(self, model_id: str) -> str:
+        return f"{self._url.rsplit('/', 1)[0]}/{model_id}"
+
     def _file_pre_check(self, file_id: int) -> int:
         file = next((f for f in self.get_files() if f.id == file_id), None)
         if not file:
             raise InvalidIdentifierException(f"File {file_id} not found.")
         return file.chunk_count
 
-    def _upload_chunk(self, file_id: int, index: int, chunk: str | bytes) -> None:
-        self._http.put_binary_gzip(f"{self._url}/files/{file_id}/chunks/{index}", chunk)
+    def _files_pre_check(self, file_ids: Iterable[int]) -> list[File]:
+        file_ids = list(dict.fromkeys(file_ids))
+        files = {f.id: f for f in self.get_files()}
+        for file_id in file_ids:
+            if file_id not in files:
+                raise InvalidIdentifierException(f"File {file_id} not found.")
+        return [files[i] for i in file_ids]
+
+    def _upload_chunk(
+        self, file_id: int, index: int, chunk: str | bytes, sizer: _ChunkSizer | None = None
+    ) -> int:
+        chunk = chunk.encode() if isinstance(chunk, str) else chunk
+        start = time.perf_counter()
+        _, attempts = self._http.put_binary_gzip_with_attempts(
+            f"{self._url}/files/{file_id}/chunks/{index}", chunk
+        )
+        if sizer:
+            sizer.record(len(chunk), time.perf_counter() - start, attempts)
         logger.debug(f"Chunk {index} loaded to file '{file_id}'.")
+        return len(chunk)
+
+    def _upload_auto(self, file_id: int, content: bytes, digest: str | None) -> UploadResult:
+        sizer = _ChunkSizer(self._thread_count if self.upload_parallel else 1)
+        logger.info(f"Content for file '{file_id}' will be uploaded with automatic chunk sizes.")
+        self._set_chunk_count(file_id, -1)
+        offset, index = 0, 0
+        with ThreadPoolExecutor(max_workers=sizer.max_parallel) as executor:
+            while offset < len(content):
+                size = sizer.next_size(len(content) - offset)
+                parallel = sizer.next_parallelism(len(content) - offset, size)
+                chunks = [
+                    content[offset + i * size : offset + (i + 1) * size] for i in range(parallel)
+                ]
+                indices = range(index, index + parallel)
+                upload = partial(self._upload_chunk, sizer=sizer)
+                list(executor.map(upload, (file_id,) * parallel, indices, chunks))
+                offset, index = offset + parallel * size, index + parallel
+                logger.debug(f"Uploading file '{file_id}' with {parallel}x{size} byte chunks.")
+        self._http.post(f"{self._url}/files/{file_id}/complete", json={"id": file_id})
+        logger.info(f"Completed upload for file '{file_id}'.")
+        return self._upload_result(file_id, digest, index, len(content), sizer)
+
+    def _is_unchanged(self, file_id: int, digest: str | None) -> bool:
+        if not (self._digests and digest and self._digests.get(self._model_id, file_id) == digest):
+            return False
+        logger.info(f"Content for file '{file_id}' is unchanged since the last upload, skipping.")
+        return True
+
+    def _upload_result(
+        self,
+        file_id: int,
+        digest: str | None,
+        chunk_count: int,
+        size: int,
+        sizer: _ChunkSizer | None = None,
+    ) -> UploadResult:
+        if self._digests and digest:
+            self._digests.set(self._model_id, file_id, digest)
+        metrics: dict[str, Any] = (
+            {
+                "chunk_sizes": sizer.chunk_sizes,
+                "parallelism": sizer.parallelism or sizer.max_parallel,
+                "retries": sizer.retries,
+                "throughput": sizer.throughput,
+            }
+            if sizer
+            else {}
+        )
+        return UploadResult(
+            file_id=file_id,
+            skipped=False,
+            digest=digest,
+            chunk_count=chunk_count,
+            size=size,
+            **metrics,
+        )
 
     def _set_chunk_count(self, file_id: int, num_chunks: int) -> None:
         logger.debug(f"Setting chunk count for file '{file_id}' to {num_chunks}.")
@@ -1,13 +1,19 @@
 import logging
-from typing import Any, Literal
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, Literal, overload
 
+from anaplan_sdk._downloads import csv_rows, write_blocks
+from anaplan_sdk._polling import _TaskPoller  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._services import _HttpService  # pyright: ignore[reportPrivateUsage]
 from anaplan_sdk._utils import (
     connection_body_payload,
     construct_payload,
+    dump_url,
     integration_payload,
     schedule_payload,
 )
+from anaplan_sdk.exceptions import AnaplanActionError
 from anaplan_sdk.models.cloud_works import (
     Connection,
     ConnectionBody,
@@ -30,8 +36,9 @@ logger = logging.getLogger("anaplan_sdk")
 
 
 class _CloudWorksClient:
-    def __init__(self, http: _HttpService) -> None:
+    def __init__(self, http: _HttpService, poller: _TaskPoller) -> None:
         self._http = http
+        self._poller = poller
         self._url = "https://api.cloudworks.anaplan.com/2/0/integrations"
         self._flow = _FlowClient(self._http)
 
@@ -165,15 +172,45 @@ class _CloudWorksClient:
         json = integration_payload(body)
         self._http.put(f"{self._url}/{integration_id}", json=json)
 
-    def run_integration(self, integration_id: str) -> str:
+    @overload
+    def run_integration(
+        self, integration_id: str, wait_for_completion: Literal[False] = False
+    ) -> str: ...
+
+    @overload
+    def run_integration(
+        self, integration_id: str, wait_for_completion: Literal[True]
+    ) -> RunStatus: ...
+
+    def run_integration(
+        self, integration_id: str, wait_for_completion: bool = False
+    ) -> str | RunStatus:
         """
         Run an integration in CloudWorks.
         :param integration_id: The ID of the integration to run.
-        :return: The ID of the run instance.
+        :param wait_for_completion: If True, the method will poll the run status and not return
+               until the run has finished. If False, it will start the run and return immediately.
+        :return: The ID of the run instance, or the final status of the run if
+                 `wait_for_completion` is True.
         """
         run_id = (self._http.post_empty(f"{self._url}/{integration_id}/run"))["run"]["id"]
         logger.info(f"Started integration run '{run_id}' for integration '{integration_id}'.")
-        return run_id
+        if not wait_for_completion:
+            return run_id
+
+        def resolve(run: RunStatus) -> RunStatus | None:
+            if run.end_date is None:
+                return None
+            if not run.success:
+                msg = f"Integration run '{run_id}' failed: {run.message}"
+                logger.error(msg)
+                raise AnaplanActionError(msg)
+            return run
+
+        fetch = partial(self.get_run_status, run_id)
+        run = self._poller.track(run_id, fetch(), fetch, resolve).result()
+        logger.info(f"Integration run '{run_id}' completed successfully.")
+        return run
 
     def delete_integration(self, integration_id: str) -> None:
         """
@@ -359,3 +396,49 @@ class _CloudWorksClient:
         :return: The error dump.
         """
         return self._http.get_binary(f"{self._url}/run/{run_id}/process/import/{action_id}/dumps")
+
+    def get_import_error_dump_stream(self, run_id: str) -> Iterator[bytes]:
+        """
+        Get the error dump of a specific import run in CloudWorks as a stream of blocks, so large
+        dumps never need to be held in memory in their entirety.
+
+        **Note that if you need the error dump of an action in a process, you must use the
+        `get_process_error_dump_stream` method instead.**
+        :param run_id: The ID of the run to retrieve.
+        :return: A generator yielding the blocks of the error dump.
+        """
+        yield from self._http.get_stream(dump_url(self._url, run_id))
+
+    def get_process_error_dump_stream(self, run_id: str, action_id: int | str) -> Iterator[bytes]:
+        """
+        Get the error dump of a specific import run in CloudWorks, that is part of a process, as a
+        stream of blocks.
+        :param run_id: The ID of the run to retrieve.
+        :param action_id: The ID of the action to retrieve. This can be found in the RunError.
+        :return: A generator yielding the blocks of the error dump.
+        """
+        yield from self._http.get_stream(dump_url(self._url, run_id, action_id))
+
+    def save_error_dump(
+        self, run_id: str, path: str | Path, action_id: int | str | None = None
+    ) -> int:
+        """
+        Streams the error dump of a specific import run in CloudWorks to a file.
+        :param run_id: The ID of the run to retrieve.
+        :param path: The path to write the error dump to.
+        :param action_id: The ID of the action to retrieve, if the run is part of a process.
+        :return: The number of bytes written.
+        """
+        return write_blocks(self._http.get_stream(dump_url(self._url, run_id, action_id)), path)
+
+    def get_error_dump_rows(
+        self, run_id: str, action_id: int | str | None = None
+    ) -> Iterator[list[str]]:
+        """
+        Get the rows of the error dump of a specific import run in CloudWorks. The dump is parsed
+        as it is streamed, so you can inspect the failures of large imports row by row.
+        :param run_id: The ID of the run to retrieve.
+        :param action_id: The ID of the action to retrieve, if the run is part of a process.
+        :return: A generator yielding the rows of the error dump, starting with the header.
+        """
+        yield from csv_rows(self._http.get_stream(dump_url(self._url, run_id, action_id)))
@@ -67,22 +67,21 @@ class _ScimClient:
             _predicate = predicate if isinstance(predicate, str) else str(predicate)
             logger.debug(f"Searching for users with predicate: {_predicate}")
             params["filter"] = _predicate
-        res = self._http.get(f"{self._url}/Users", params=params)
-        users = [User.model_validate(e) for e in res.get("Resources", [])]
-        if (total := res["totalResults"]) <= page_size:
-            return users
+        res = self._http.get_validated(f"{self._url}/Users", "Resources", User, params=params)
+        if (total := res.total_results or 0) <= page_size:
+            return res.items
 
-        def fetch_page(start_index: int) -> dict[str, Any]:
-            return self._http.get(
+        def fetch_page(start_index: int) -> list[User]:
+            return self._http.get_validated(
                 f"{self._url}/Users",
+                "Resources",
+                User,
                 params=(params | {"startIndex": start_index, "count": page_size}),
-            )
+            ).items
 
         with ThreadPoolExecutor() as executor:
             pages = executor.map(fetch_page, range(page_size + 1, total + 1, page_size))
-        for user in chain(*(p.get("Resources", []) for p in pages)):
-            users.append(User.model_validate(user))
-        return users
+        return list(chain(res.items, *pages))
 
     def get_user(self, user_id: str) -> User:
         """
@@ -0,0 +1,58 @@
+import json
+from typing import Any, Callable, Literal
+
+from anaplan_sdk.exceptions import AnaplanException
+
+JsonCodecName = Literal["json", "orjson", "msgspec"]
+
+
+class _JsonCodec:
+    """
+    Encodes request payloads to bytes and decodes response bodies. Payloads are encoded once per
+    request rather than once per attempt, and sent as raw content, so the configured library is
+    used for both directions instead of the standard library `json` module httpx uses internally.
+    """
+
+    def __init__(
+        self, name: JsonCodecName, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Same options as httpx uses for `json=`, so the payloads are byte-identical.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def get_json_codec(name: JsonCodecName = "json") -> _JsonCodec:
+    """
+    Get the codec for the given JSON library.
+    :param name: The name of the library. `json` uses the standard library, `orjson` and `msgspec`
+           use the respective libraries, which are several times faster for large payloads.
+    :return: The codec.
+    """
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError as e:
+            raise AnaplanException(
+                "orjson is not available. Please install anaplan-sdk with the orjson extra "
+                "`pip install anaplan-sdk[orjson]` or install orjson separately."
+            ) from e
+        return _JsonCodec(name, orjson.dumps, orjson.loads)
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError as e:
+            raise AnaplanException(
+                "msgspec is not available. Please install anaplan-sdk with the msgspec extra "
+                "`pip install anaplan-sdk[msgspec]` or install msgspec separately."
+            ) from e
+        return _JsonCodec(name, msgspec.json.encode, msgspec.json.decode)
+    if name != "json":
+        raise ValueError(
+            f"Unknown JSON codec '{name}'. Must be one of 'json', 'orjson', 'msgspec'."
+        )
+    return _JsonCodec(name, _stdlib_dumps, json.loads)
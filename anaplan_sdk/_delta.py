@@ -0,0 +1,184 @@
+import csv
+import os
+from hashlib import blake2b, sha256
+from pathlib import Path
+from typing import Any, Iterator, Literal, NamedTuple, Sequence
+
+from anaplan_sdk._downloads import _RecordSplitter  # pyright: ignore[reportPrivateUsage]
+from anaplan_sdk.exceptions import AnaplanException
+
+_BATCH_ROWS = 100_000
+_DELETE_BLOCK = 1_000_000
+_SEP = "\x1f"
+
+
+class RowChange(NamedTuple):
+    """
+    A single row that changed between two exports of the same file.
+    """
+
+    kind: Literal["inserted", "updated", "deleted"]
+    """The kind of change."""
+
+    row: list[str]
+    """
+    The fields of the row as in the current export. For deleted rows, this only contains the
+    values of the key columns, since the row is no longer part of the export.
+    """
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise AnaplanException(
+            "numpy is not available. Please install anaplan-sdk with the numpy extra "
+            "`pip install anaplan-sdk[numpy]` or install numpy separately."
+        ) from e
+    return numpy
+
+
+def _hash(value: bytes) -> int:
+    return int.from_bytes(blake2b(value, digest_size=8).digest(), "little")
+
+
+def delta_index_path(
+    cache_dir: Path, model_id: str | None, file_id: int, key: Sequence[str]
+) -> Path:
+    spec = sha256(_SEP.join(key).encode()).hexdigest()[:16]
+    return cache_dir / "deltas" / f"{model_id}-{file_id}-{spec}"
+
+
+class _RowDelta:
+    """
+    Compares a CSV export against the index written by the previous export of the same file.
+
+    The index is a flat file of fixed-size records `(key hash, row hash, key offset)` sorted by the
+    key hash, which is memory-mapped and binary searched, so only the current batch of rows is
+    ever held in memory. The raw key values are kept in a sidecar file, so deleted rows can be
+    reported with their keys. The chunks are fed in as they are downloaded, which lets the sync and
+    async Clients share this implementation. The new index only replaces the previous one once the
+    entire export has been consumed, so an interrupted export is compared against the same
+    baseline on the next run.
+    """
+
+    def __init__(self, path: Path, key: Sequence[str], delimiter: str = ",") -> None:
+        self._np = np = _numpy()
+        self._dtype = np.dtype([("key", "<u8"), ("row", "<u8"), ("offset", "<u8")])
+        self._path, self._key, self._delimiter = path, list(key), delimiter
+        self._idx_path = path.with_suffix(".idx")
+        self._keys_path = path.with_suffix(".keys")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._old = self._load(self._idx_path)
+        self._new_idx = open(f"{self._idx_path}.tmp", "wb")
+        self._new_keys = open(f"{self._keys_path}.tmp", "wb")
+        self._offset = 0
+        self._splitter = _RecordSplitter()
+        self._records: list[str] = []
+        self._key_indices: list[int] | None = None
+        self._committed = False
+
+    def feed(self, chunk: bytes) -> list[RowChange]:
+        """
+        Consume the next chunk of the export.
+        :param chunk: The raw bytes of the next chunk.
+        :return: The changes found in the rows completed so far.
+        """
+        self._records.extend(self._splitter.feed(chunk))
+        if len(self._records) < _BATCH_ROWS:
+            return []
+        return self._compare_batch()
+
+    def close(self) -> Iterator[RowChange]:
+        """
+        Flush the remaining rows, yield the deleted rows and commit the new index.
+        """
+        self._records.extend(self._splitter.close())
+        yield from self._compare_batch()
+        self._new_idx.close()
+        self._new_keys.close()
+        new = self._load(Path(f"{self._idx_path}.tmp"), writable=True)
+        if len(new):
+            new.sort(order="key")
+            new.flush()
+        yield from self._deleted(new["key"])
+        del new
+        self._old = self._np.empty(0, dtype=self._dtype)
+        os.replace(f"{self._idx_path}.tmp", self._idx_path)
+        os.replace(f"{self._keys_path}.tmp", self._keys_path)
+        self._committed = True
+
+    def discard(self) -> None:
+        """
+        Remove the partially written index, if the export was not fully consumed.
+        """
+        self._new_idx.close()
+        self._new_keys.close()
+        if not self._committed:
+            for file in (f"{self._idx_path}.tmp", f"{self._keys_path}.tmp"):
+                Path(file).unlink(missing_ok=True)
+
+    def _load(self, path: Path, writable: bool = False) -> Any:
+        if not path.exists() or path.stat().st_size == 0:
+            return self._np.empty(0, dtype=self._dtype)
+        return self._np.memmap(path, dtype=self._dtype, mode="r+" if writable else "r")
+
+    def _compare_batch(self) -> list[RowChange]:
+        np = self._np
+        records, self._records = self._records, []
+        rows = list(csv.reader(records, delimiter=self._delimiter))
+        if self._key_indices is None and rows:
+            self._key_indices = self._resolve_key(rows.pop(0))
+            records.pop(0)
+        pairs = [(record, row) for record, row in zip(records, rows, strict=True) if row]
+        if not pairs:
+            return []
+        rows = [row for _, row in pairs]
+        indices = self._key_indices or []
+        keys = [_SEP.join([row[i] for i in indices]).encode() for row in rows]
+        sizes = np.fromiter((len(k) + 4 for k in keys), dtype="<u8", count=len(keys))
+        self._new_keys.write(b"".join(len(k).to_bytes(4, "little") + k for k in keys))
+        batch = np.empty(len(rows), dtype=self._dtype)
+        batch["key"] = [_hash(k) for k in keys]
+        batch["row"] = [_hash(record.rstrip("\r\n").encode()) for record, _ in pairs]
+        batch["offset"] = self._offset + np.cumsum(sizes) - sizes
+        self._offset += int(sizes.sum())
+        self._new_idx.write(batch.tobytes())
+        if not len(self._old):
+            return [RowChange("inserted", row) for row in rows]
+        found, changed = self._match(self._old, batch["key"], batch["row"])
+        return [
+            RowChange("updated" if found[i] else "inserted", rows[i])
+            for i in np.flatnonzero(~found | changed)
+        ]
+
+    def _match(self, index: Any, keys: Any, hashes: Any) -> tuple[Any, Any]:
+        np = self._np
+        positions = np.minimum(np.searchsorted(index["key"], keys), len(index) - 1)
+        found = index["key"][positions] == keys
+        return found, found & (index["row"][positions] != hashes)
+
+    def _deleted(self, new_keys: Any) -> Iterator[RowChange]:
+        np = self._np
+        if not len(self._old):
+            return
+        with self._keys_path.open("rb") as file:
+            for start in range(0, len(self._old), _DELETE_BLOCK):
+                block = self._old[start : start + _DELETE_BLOCK]
+                if len(new_keys):
+                    positions = np.minimum(
+                        np.searchsorted(new_keys, block["key"]), len(new_keys) - 1
+                    )
+                    missing = new_keys[positions] != block["key"]
+                else:
+                    missing = np.ones(len(block), dtype=bool)
+                for offset in block["offset"][missing]:
+                    file.seek(int(offset))
+                    size = int.from_bytes(file.read(4), "little")
+                    yield RowChange("deleted", file.read(size).decode().split(_SEP))
+
+    def _resolve_key(self, header: list[str]) -> list[int]:
+        missing = [k for k in self._key if k not in header]
+        if missing:
+            raise ValueError(f"Key columns {missing} are not in the header: {header}.")
+        return [header.index(k) for k in self._key]
@@ -0,0 +1,259 @@
+import codecs
+import csv
+import json
+import os
+from io import BytesIO
+from itertools import zip_longest
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Iterable, Iterator
+
+from anaplan_sdk.models import File
+
+
+class _OrderedWriter:
+    """
+    Writes the chunks of a file to its sink in order, buffering chunks that arrive early.
+    """
+
+    def __init__(self, sink: IO[bytes] | None = None) -> None:
+        self._buffer = BytesIO()
+        self._sink = self._buffer if sink is None else sink
+        self._next = 0
+        self._pending: dict[int, bytes] = {}
+
+    def write(self, index: int, chunk: bytes) -> None:
+        self._pending[index] = chunk
+        while self._next in self._pending:
+            self._sink.write(self._pending.pop(self._next))
+            self._next += 1
+
+    def getvalue(self) -> bytes | None:
+        return self._buffer.getvalue() if self._sink is self._buffer else None
+
+
+def chunk_urls(url: str, files: list[File]) -> Iterator[tuple[int, int, str]]:
+    """
+    Yields the chunks of all files round-robin, so that the chunks of small files are not queued
+    behind all the chunks of a large file and every file makes progress.
+    :param url: The base url of the Model.
+    :param files: The files to download.
+    :return: A generator yielding tuples of the file Id, the chunk index and the chunk url.
+    """
+    per_file = [
+        [(f.id, 0, f"{url}/files/{f.id}")]
+        if f.chunk_count <= 1
+        else [(f.id, i, f"{url}/files/{f.id}/chunks/{i}") for i in range(f.chunk_count)]
+        for f in files
+    ]
+    for round_ in zip_longest(*per_file):
+        yield from (chunk for chunk in round_ if chunk)
+
+
+class _RecordSplitter:
+    """
+    Splits a stream of bytes into the records of a CSV file. Lines are joined while they are inside
+    a quoted field, which is the case as long as the record has an odd number of quotes, so line
+    breaks in quoted fields do not split records.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._tail, self._pending, self._odd_quotes = "", "", False
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """
+        :param chunk: The next block of the stream.
+        :return: The records completed by this block.
+        """
+        text = self._tail + self._decoder.decode(chunk)
+        lines = text.split("\n")
+        self._tail = lines.pop()
+        if not self._odd_quotes and '"' not in text:
+            return lines
+        records: list[str] = []
+        for line in lines:
+            self._add_line(line + "\n", records)
+        return records
+
+    def close(self) -> list[str]:
+        """
+        :return: The remaining records at the end of the stream.
+        """
+        records: list[str] = []
+        tail = self._tail + self._decoder.decode(b"", final=True)
+        if tail:
+            self._add_line(tail, records)
+        if self._pending:
+            records.append(self._pending)
+        self._tail, self._pending, self._odd_quotes = "", "", False
+        return records
+
+    def _add_line(self, line: str, records: list[str]) -> None:
+        self._pending += line
+        self._odd_quotes ^= line.count('"') % 2 == 1
+        if not self._odd_quotes:
+            records.append(self._pending)
+            self._pending = ""
+
+
+def csv_rows(blocks: Iterable[bytes]) -> Iterator[list[str]]:
+    """
+    Parse a stream of CSV bytes into rows, without holding more than one block in memory.
+    :param blocks: The blocks of the CSV file.
+    :return: A generator yielding the rows, including the header.
+    """
+    splitter = _RecordSplitter()
+    for block in blocks:
+        yield from csv.reader(splitter.feed(block))
+    yield from csv.reader(splitter.close())
+
+
+async def csv_rows_async(blocks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """
+    Parse an asynchronous stream of CSV bytes into rows, without holding more than one block in
+    memory.
+    :param blocks: The blocks of the CSV file.
+    :return: An async generator yielding the rows, including the header.
+    """
+    splitter = _RecordSplitter()
+    async for block in blocks:
+        for row in csv.reader(splitter.feed(block)):
+            yield row
+    for row in csv.reader(splitter.close()):
+        yield row
+
+
+def write_blocks(blocks: Iterable[bytes], path: str | Path) -> int:
+    """
+    Write a stream of blocks to the given path. The content is written to a temporary file next to
+    the target first, so an interrupted download never leaves a truncated file behind.
+    :param blocks: The blocks to write.
+    :param path: The path to write to.
+    :return: The number of bytes written.
+    """
+    path, size = Path(path), 0
+    partial = path.with_name(f"{path.name}.part")
+    try:
+        with partial.open("wb") as file:
+            for block in blocks:
+                size += file.write(block)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+    return size
+
+
+async def write_blocks_async(blocks: AsyncIterator[bytes], path: str | Path) -> int:
+    """
+    Write an asynchronous stream of blocks to the given path. The content is written to a
+    temporary file next to the target first, so an interrupted download never leaves a truncated
+    file behind.
+    :param blocks: The blocks to write.
+    :param path: The path to write to.
+    :return: The number of bytes written.
+    """
+    path, size = Path(path), 0
+    partial = path.with_name(f"{path.name}.part")
+    try:
+        with partial.open("wb") as file:
+            async for block in blocks:
+                size += file.write(block)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+    return size
+
+
+class _JsonArrayParser:
+    """
+    Incrementally parses the elements of the array under the given key in a streamed JSON object,
+    like `{"meta": {...}, "listItems": [{...}, {...}]}`. Each element is decoded as soon as it is
+    complete and dropped from the buffer afterwards, so memory use is bound by the block size and
+    the size of a single element rather than the size of the response.
+    """
+
+    def __init__(self, key: str) -> None:
+        self._key = f'"{key}"'
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer, self._in_array, self._done = "", False, False
+
+    def feed(self, block: bytes) -> list[Any]:
+        """
+        :param block: The next block of the response.
+        :return: The elements completed by this block.
+        """
+        self._buffer += self._decoder.decode(block)
+        return self._parse()
+
+    def close(self) -> list[Any]:
+        """
+        :return: The remaining elements at the end of the response.
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        elements = self._parse(final=True)
+        if self._in_array and not self._done:
+            raise ValueError(f"Unexpected end of JSON input while parsing {self._key}.")
+        return elements
+
+    def _parse(self, final: bool = False) -> list[Any]:
+        elements: list[Any] = []
+        if self._done or not self._start():
+            return elements
+        buffer, pos, size = self._buffer, 0, len(self._buffer)
+        while pos < size:
+            char = buffer[pos]
+            if char in " \t\r\n,":
+                pos += 1
+            elif char == "]":
+                self._done = True
+                break
+            else:
+                try:
+                    element, end = self._json.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break
+                if end == size and not final and not isinstance(element, (dict, list)):
+                    break  # A number at the end of the buffer may continue in the next block.
+                elements.append(element)
+                pos = end
+        self._buffer = "" if self._done else buffer[pos:]
+        return elements
+
+    def _start(self) -> bool:
+        if self._in_array:
+            return True
+        index = self._buffer.find(self._key)
+        bracket = self._buffer.find("[", index + len(self._key)) if index >= 0 else -1
+        if bracket < 0:
+            return False
+        self._buffer, self._in_array = self._buffer[bracket + 1 :], True
+        return True
+
+
+def json_array_items(blocks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Parse the elements of the array under the given key from a stream of JSON bytes.
+    :param blocks: The blocks of the JSON response.
+    :param key: The key of the array in the top-level object.
+    :return: A generator yielding the elements of the array.
+    """
+    parser = _JsonArrayParser(key)
+    for block in blocks:
+        yield from parser.feed(block)
+    yield from parser.close()
+
+
+async def json_array_items_async(blocks: AsyncIterator[bytes], key: str) -> AsyncIterator[Any]:
+    """
+    Parse the elements of the array under the given key from an asynchronous stream of JSON bytes.
+    :param blocks: The blocks of the JSON response.
+    :param key: The key of the array in the top-level object.
+    :return: An async generator yielding the elements of the array.
+    """
+    parser = _JsonArrayParser(key)
+    async for block in blocks:
+        for element in parser.feed(block):
+            yield element
+    for element in parser.close():
+        yield element
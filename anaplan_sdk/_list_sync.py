@@ -0,0 +1,116 @@
+from typing import Any, Iterable, Literal
+
+_NESTED = ("properties", "subsets")
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _boolean(value: Any) -> bool | str:
+    if isinstance(value, bool):
+        return value
+    text = _text(value).lower()
+    return {"true": True, "false": False}.get(text, text)
+
+
+def _number(value: Any) -> float | str:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(_text(value))
+    except ValueError:
+        return _text(value)
+
+
+def _equal(desired: Any, current: Any) -> bool:
+    """
+    Compare a desired value against the current value returned by the API, which returns most
+    values as strings. If either value is a boolean or a number, both are compared as such, so
+    that e.g. `1` matches `"1.0"` and `True` matches `"true"`. Otherwise, they are compared as
+    text, with None matching the empty string.
+    """
+    if isinstance(desired, bool) or isinstance(current, bool):
+        return _boolean(desired) == _boolean(current)
+    if isinstance(desired, (int, float)) or isinstance(current, (int, float)):
+        return _number(desired) == _number(current)
+    return _text(desired) == _text(current)
+
+
+class _ListDiff:
+    """
+    Computes the minimal set of changes that turn the current items of a List into the desired
+    items. The desired items are indexed by their key up front, while the current items are fed in
+    one by one as they are streamed, so the current items of the List are never held in memory and
+    the sync and async Clients can share this implementation. Each current item is matched in
+    constant time and compared field by field. Only the fields that differ are sent as an update,
+    and properties and subsets are compared and sent individually, so an item with one changed
+    property is updated with only that property. Current items without a key cannot be matched
+    and are skipped rather than deleted.
+    """
+
+    def __init__(self, items: Iterable[dict[str, Any]], key: Literal["code", "name"]) -> None:
+        self._key = key
+        self._desired: dict[str, dict[str, Any]] = {}
+        for item in items:
+            value = item.get(key)
+            if value is None:
+                raise ValueError(f"Item {item} has no '{key}', which is required to match it.")
+            value = str(value)
+            if value in self._desired:
+                raise ValueError(f"Duplicate {key} '{value}' in the desired items.")
+            self._desired[value] = item
+        self.updates: list[dict[str, Any]] = []
+        """The changed fields of the items to update, by the Id of the item."""
+        self.deletes: list[dict[str, Any]] = []
+        """The Ids of the current items that are not in the desired items."""
+        self.unchanged = 0
+        """The number of current items that are already up to date."""
+        self.skipped: list[str] = []
+        """The Ids of the current items without a key, which are neither matched nor deleted."""
+
+    def feed(self, current: dict[str, Any]) -> None:
+        """
+        Compare the next current item of the List against the desired items.
+        :param current: The raw current item, as returned by `iter_list_items`.
+        """
+        value = current.get(self._key)
+        if value is None or value == "":
+            self.skipped.append(current["id"])
+            return
+        desired = self._desired.pop(str(value), None)
+        if desired is None:
+            self.deletes.append({"id": current["id"]})
+            return
+        changes = self._changes(current, desired)
+        if changes:
+            self.updates.append({"id": current["id"], **changes})
+        else:
+            self.unchanged += 1
+
+    @property
+    def adds(self) -> list[dict[str, Any]]:
+        """
+        The desired items that did not match any current item. Only complete once all current
+        items have been fed.
+        """
+        return list(self._desired.values())
+
+    def _changes(self, current: dict[str, Any], desired: dict[str, Any]) -> dict[str, Any]:
+        changes: dict[str, Any] = {}
+        for field, value in desired.items():
+            if field in (self._key, "id"):
+                continue
+            if field in _NESTED:
+                existing: dict[str, Any] = current.get(field) or {}
+                nested = {k: v for k, v in value.items() if not _equal(v, existing.get(k))}
+                if nested:
+                    changes[field] = nested
+            elif field == "parent":
+                if not (
+                    _equal(value, current.get("parent")) or _equal(value, current.get("parentId"))
+                ):
+                    changes[field] = value
+            elif not _equal(value, current.get(field)):
+                changes[field] = value
+        return changes
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Literal, TypeVar
+
+from anaplan_sdk.models import DimensionWithCode
+
+MAX_LOOKUP_VALUES = 5_000
+LOOKUP_CACHE_SIZE = 100_000
+
+F = TypeVar("F")
+_Key = tuple[int, str, str]
+
+
+class _DimensionLookups:
+    """
+    Memoizes the results of dimension lookups in an LRU cache and tracks the values currently being
+    looked up. A value that is already cached is served locally, and a value that another caller is
+    already looking up is awaited instead of requested again, so concurrent lookups of overlapping
+    values are coalesced and only true misses reach the server. The futures are created by the
+    caller, which lets the sync and async Clients share this implementation.
+    """
+
+    def __init__(self, max_size: int = LOOKUP_CACHE_SIZE) -> None:
+        self._max_size = max_size
+        self._items: OrderedDict[_Key, DimensionWithCode] = OrderedDict()
+        self._in_flight: dict[_Key, Any] = {}
+        self._lock = Lock()
+
+    def claim(
+        self,
+        dimension_id: int,
+        field: Literal["code", "name"],
+        values: list[str],
+        new_future: Callable[[], F],
+    ) -> tuple[dict[str, DimensionWithCode], list[str], dict[str, F]]:
+        """
+        Split the values into cache hits, values this caller must look up and values another
+        caller is already looking up. The values to look up are marked as in flight until they are
+        passed to `complete` or `fail`.
+        :return: The cached items by value, the values to look up and the futures of the values
+                 that are already being looked up.
+        """
+        hits: dict[str, DimensionWithCode] = {}
+        owned: list[str] = []
+        pending: dict[str, F] = {}
+        with self._lock:
+            for value in dict.fromkeys(values):
+                key = (dimension_id, field, value)
+                if key in self._items:
+                    self._items.move_to_end(key)
+                    hits[value] = self._items[key]
+                elif key in self._in_flight:
+                    pending[value] = self._in_flight[key]
+                else:
+                    self._in_flight[key] = new_future()
+                    owned.append(value)
+        return hits, owned, pending
+
+    def complete(
+        self,
+        dimension_id: int,
+        field: Literal["code", "name"],
+        owned: list[str],
+        found: list[DimensionWithCode],
+    ) -> dict[str, DimensionWithCode]:
+        """
+        Cache the items found for the claimed values and resolve their futures. Values that were
+        not found are resolved with None and not cached, so they are looked up again next time.
+        :return: The found items by value.
+        """
+        by_value = {getattr(item, field): item for item in found}
+        with self._lock:
+            for item in found:
+                self._put((dimension_id, "code", item.code), item)
+                self._put((dimension_id, "name", item.name), item)
+            for value in owned:
+                self._in_flight.pop((dimension_id, field, value)).set_result(by_value.get(value))
+        return by_value
+
+    def fail(
+        self,
+        dimension_id: int,
+        field: Literal["code", "name"],
+        owned: list[str],
+        error: BaseException,
+    ) -> None:
+        """
+        Release the claimed values after a failed lookup, passing the error on to anyone waiting.
+        """
+        with self._lock:
+            for value in owned:
+                future = self._in_flight.pop((dimension_id, field, value))
+                if isinstance(error, Exception):
+                    future.set_exception(error)
+                    future.exception()  # Mark as retrieved, the owner raises the error itself.
+                else:
+                    future.cancel()
+
+    def _put(self, key: _Key, item: DimensionWithCode) -> None:
+        self._items[key] = item
+        self._items.move_to_end(key)
+        if len(self._items) > self._max_size:
+            self._items.popitem(last=False)
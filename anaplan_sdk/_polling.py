@@ -0,0 +1,390 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from threading import Condition, Thread
+from typing import Any, Generic, TypeVar
+
+from typing_extensions import Self
+
+from .models import Task, TaskSummary
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class PollingPolicy:
+    """
+    Controls how often the status of a running Task is polled while waiting for it to complete.
+    The delay starts at `initial_delay` and is multiplied by `backoff_factor` after each poll, up
+    to `max_delay`. If `estimate_from_progress` is set and the Task reports its progress, the next
+    poll is instead scheduled around the estimated completion time, still bounded by
+    `initial_delay` and `max_delay`. This policy applies to Bulk Actions, ALM Tasks and CloudWorks
+    Integration runs.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        backoff_factor: float = 1.5,
+        estimate_from_progress: bool = True,
+        max_concurrent_polls: int = 8,
+    ) -> None:
+        """
+        :param initial_delay: The delay in seconds before the second poll. Fractions of a second
+               are allowed.
+        :param max_delay: The maximum delay in seconds between two polls.
+        :param backoff_factor: The factor by which the delay is multiplied after each poll. Set
+               this to 1 for a fixed delay.
+        :param estimate_from_progress: Whether to estimate the remaining time from the progress
+               and creation time of the Task, if available.
+        :param max_concurrent_polls: The maximum number of status requests the client's poller
+               sends at the same time, shared across all Tasks it is waiting for.
+        """
+        if initial_delay <= 0:
+            raise ValueError("`initial_delay` must be greater than 0.")
+        if max_delay < initial_delay:
+            raise ValueError("`max_delay` must be greater than or equal to `initial_delay`.")
+        if backoff_factor < 1:
+            raise ValueError("`backoff_factor` must be greater than or equal to 1.")
+        if max_concurrent_polls < 1:
+            raise ValueError("`max_concurrent_polls` must be greater than or equal to 1.")
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.estimate_from_progress = estimate_from_progress
+        self.max_concurrent_polls = max_concurrent_polls
+
+    @classmethod
+    def fixed(cls, delay: float) -> Self:
+        """
+        Create a policy that always waits the same amount of time between two polls.
+        :param delay: The delay in seconds between two polls.
+        :return: The fixed polling policy.
+        """
+        return cls(delay, delay, 1.0, False)
+
+    def next_delay(
+        self, attempt: int, progress: float | None = None, elapsed: float | None = None
+    ) -> float:
+        """
+        Compute the delay before the next poll.
+        :param attempt: The number of polls that have already been made for this Task, minus one.
+        :param progress: The progress of the Task as a float between 0 and 1, if known.
+        :param elapsed: The number of seconds since the Task was created, if known.
+        :return: The delay in seconds.
+        """
+        delay = min(self.initial_delay * self.backoff_factor**attempt, self.max_delay)
+        if not (self.estimate_from_progress and progress and elapsed and 0 < progress < 1):
+            return delay
+        remaining = elapsed * (1 - progress) / progress
+        return min(max(remaining, self.initial_delay), self.max_delay)
+
+    def __repr__(self) -> str:
+        return (
+            f"PollingPolicy(initial_delay={self.initial_delay}, max_delay={self.max_delay}, "
+            f"backoff_factor={self.backoff_factor}, "
+            f"estimate_from_progress={self.estimate_from_progress}, "
+            f"max_concurrent_polls={self.max_concurrent_polls})"
+        )
+
+
+def as_policy(status_poll_delay: float | PollingPolicy) -> PollingPolicy:
+    if isinstance(status_poll_delay, PollingPolicy):
+        return status_poll_delay
+    return PollingPolicy.fixed(status_poll_delay)
+
+
+def as_delay(policy: PollingPolicy) -> float | PollingPolicy:
+    """
+    The inverse of `as_policy`: fixed policies are reported as their delay in seconds, so that a
+    delay passed as a number reads back as that number.
+    """
+    fixed = PollingPolicy.fixed(policy.initial_delay)
+    if all(getattr(policy, k) == getattr(fixed, k) for k in vars(fixed)):
+        return policy.initial_delay
+    return policy
+
+
+def task_delay(policy: PollingPolicy, attempt: int, task: TaskSummary) -> float:
+    """
+    Compute the delay before the next poll of a Bulk or ALM Task.
+    :param policy: The polling policy to apply.
+    :param attempt: The number of polls that have already been made for this Task, minus one.
+    :param task: The last known status of the Task.
+    :return: The delay in seconds.
+    """
+    progress = task.progress if isinstance(task, Task) else None
+    created = task.creation_time / 1000 if task.creation_time > 1e11 else task.creation_time
+    return policy.next_delay(attempt, progress, max(time.time() - created, 0))
+
+
+class TaskHandle(Future[T], Generic[S, T]):
+    """
+    A handle to a Task that the client is waiting for in the background. This is a regular
+    `concurrent.futures.Future`, so you can block on it with `result()`, attach callbacks with
+    `add_done_callback()` or compose several handles with `concurrent.futures.wait()`.
+
+    Cancelling the handle stops the client from polling the Task and makes all waiters raise
+    `CancelledError`. It does not cancel the Task in Anaplan.
+    """
+
+    def __init__(self, task_id: str, status: S) -> None:
+        super().__init__()
+        self.id = task_id
+        self._status = status
+
+    def poll(self) -> S:
+        """
+        Return the last known status of the Task without blocking. The status is refreshed by the
+        client's poller in the background.
+        :return: The last known status of the Task.
+        """
+        return self._status
+
+    @property
+    def progress(self) -> float | None:
+        """
+        The last known progress of the Task as a float between 0 and 1, or None if the Task does
+        not report any.
+        """
+        return self._status.progress if isinstance(self._status, Task) else None
+
+
+class AsyncTaskHandle(asyncio.Future[T], Generic[S, T]):
+    """
+    A handle to a Task that the client is waiting for in the background. This is a regular
+    `asyncio.Future`, so you can `await` it, attach callbacks with `add_done_callback()` or
+    compose several handles with `asyncio.wait()`. To wait with a timeout, use
+    `asyncio.wait_for()`.
+
+    Cancelling the handle stops the client from polling the Task and makes all waiters raise
+    `CancelledError`. It does not cancel the Task in Anaplan.
+    """
+
+    def __init__(self, task_id: str, status: S) -> None:
+        super().__init__(loop=asyncio.get_running_loop())
+        self.id = task_id
+        self._status = status
+
+    def poll(self) -> S:
+        """
+        Return the last known status of the Task without blocking. The status is refreshed by the
+        client's poller in the background.
+        :return: The last known status of the Task.
+        """
+        return self._status
+
+    @property
+    def progress(self) -> float | None:
+        """
+        The last known progress of the Task as a float between 0 and 1, or None if the Task does
+        not report any.
+        """
+        return self._status.progress if isinstance(self._status, Task) else None
+
+
+@dataclass(eq=False)
+class _Pending:
+    handle: "Future[Any] | asyncio.Future[Any]"
+    step: Callable[[], Any]
+    due: float
+
+
+class _TaskPoller:
+    """
+    Polls the status of all Tasks a client is waiting for from a single background thread. Status
+    checks that are due at about the same time are sent together, with at most
+    `max_concurrent_polls` requests in flight, and each handle is resolved as soon as its Task
+    completes. The thread is started on demand and exits once there is nothing left to poll.
+    """
+
+    def __init__(self, policy: PollingPolicy) -> None:
+        self.policy = policy
+        self._pending: list[_Pending] = []
+        self._condition = Condition()
+        self._thread: Thread | None = None
+
+    def track(
+        self, task_id: str, status: S, fetch: Callable[[], S], resolve: Callable[[S], T | None]
+    ) -> TaskHandle[S, T]:
+        """
+        Start waiting for a Task.
+        :param task_id: The identifier of the Task.
+        :param status: The current status of the Task.
+        :param fetch: Retrieves the current status of the Task.
+        :param resolve: Returns the result of the Task given its status, or None if it is not
+               complete yet. Exceptions raised here are set on the handle.
+        :return: A handle that resolves once the Task is complete.
+        """
+        handle = TaskHandle[S, T](task_id, status)
+        if _settle(handle, resolve, status):
+            return handle
+        attempt = 0
+
+        def step() -> float | None:
+            nonlocal attempt
+            handle._status = current = fetch()
+            if _settle(handle, resolve, current):
+                return None
+            attempt += 1
+            return _delay(self.policy, attempt, current)
+
+        with self._condition:
+            self._pending.append(
+                _Pending(handle, step, time.monotonic() + _delay(self.policy, 0, status))
+            )
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="anaplan-sdk-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return handle
+
+    def _run(self) -> None:
+        with ThreadPoolExecutor(self.policy.max_concurrent_polls) as executor:
+            while batch := self._next_batch():
+                list(executor.map(self._step, batch))
+
+    def _next_batch(self) -> list[_Pending]:
+        with self._condition:
+            while True:
+                self._pending = [p for p in self._pending if not p.handle.cancelled()]
+                if not self._pending:
+                    self._thread = None
+                    return []
+                now = time.monotonic()
+                if batch := _due(self._pending, now, self.policy):
+                    return batch
+                self._condition.wait(min(p.due for p in self._pending) - now)
+
+    def _step(self, pending: _Pending) -> None:
+        try:
+            delay: float | None = pending.step()
+        except Exception as error:
+            with suppress(InvalidStateError):
+                pending.handle.set_exception(error)
+            delay = None
+        with self._condition:
+            if delay is None:
+                self._pending.remove(pending)
+            else:
+                pending.due = time.monotonic() + delay
+
+
+class _AsyncTaskPoller:
+    """
+    Polls the status of all Tasks a client is waiting for from a single asyncio Task. Status
+    checks that are due at about the same time are sent together, with at most
+    `max_concurrent_polls` requests in flight, and each handle is resolved as soon as its Task
+    completes. The asyncio Task is started on demand and exits once there is nothing left to poll.
+    """
+
+    def __init__(self, policy: PollingPolicy) -> None:
+        self.policy = policy
+        self._pending: list[_Pending] = []
+        self._wakeup = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+
+    def track(
+        self,
+        task_id: str,
+        status: S,
+        fetch: Callable[[], Awaitable[S]],
+        resolve: Callable[[S], T | None],
+    ) -> AsyncTaskHandle[S, T]:
+        """
+        Start waiting for a Task.
+        :param task_id: The identifier of the Task.
+        :param status: The current status of the Task.
+        :param fetch: Retrieves the current status of the Task.
+        :param resolve: Returns the result of the Task given its status, or None if it is not
+               complete yet. Exceptions raised here are set on the handle.
+        :return: A handle that resolves once the Task is complete.
+        """
+        handle = AsyncTaskHandle[S, T](task_id, status)
+        if _settle(handle, resolve, status):
+            return handle
+        attempt = 0
+
+        async def step() -> float | None:
+            nonlocal attempt
+            handle._status = current = await fetch()
+            if _settle(handle, resolve, current):
+                return None
+            attempt += 1
+            return _delay(self.policy, attempt, current)
+
+        loop = handle.get_loop()
+        self._pending.append(
+            _Pending(handle, step, time.monotonic() + _delay(self.policy, 0, status))
+        )
+        if self._runner is None or self._runner.done() or self._runner.get_loop() is not loop:
+            self._pending = [
+                p
+                for p in self._pending
+                if isinstance(p.handle, asyncio.Future) and p.handle.get_loop() is loop
+            ]
+            self._wakeup = asyncio.Event()
+            self._runner = loop.create_task(self._run())
+        else:
+            self._wakeup.set()
+        return handle
+
+    async def _run(self) -> None:
+        while True:
+            self._pending = [p for p in self._pending if not p.handle.cancelled()]
+            if not self._pending:
+                return
+            now = time.monotonic()
+            if batch := _due(self._pending, now, self.policy):
+                await asyncio.gather(*(self._step(p) for p in batch))
+                continue
+            with suppress(asyncio.TimeoutError):
+                timeout = min(p.due for p in self._pending) - now
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            self._wakeup.clear()
+
+    async def _step(self, pending: _Pending) -> None:
+        try:
+            delay: float | None = await pending.step()
+        except Exception as error:
+            with suppress(asyncio.InvalidStateError):
+                pending.handle.set_exception(error)
+            delay = None
+        if delay is None:
+            self._pending.remove(pending)
+        else:
+            pending.due = time.monotonic() + delay
+
+
+def _settle(
+    handle: "Future[T] | asyncio.Future[T]", resolve: Callable[[S], T | None], status: S
+) -> bool:
+    try:
+        result = resolve(status)
+    except Exception as error:
+        with suppress(InvalidStateError, asyncio.InvalidStateError):
+            handle.set_exception(error)
+        return True
+    if result is None:
+        return False
+    with suppress(InvalidStateError, asyncio.InvalidStateError):
+        handle.set_result(result)
+    return True
+
+
+def _delay(policy: PollingPolicy, attempt: int, status: object) -> float:
+    if isinstance(status, TaskSummary):
+        return task_delay(policy, attempt, status)
+    return policy.next_delay(attempt)
+
+
+def _due(pending: list[_Pending], now: float, policy: PollingPolicy) -> list[_Pending]:
+    # Checks due within half the initial delay are pulled forward to share a round.
+    horizon = now + policy.initial_delay / 2
+    due = sorted((p for p in pending if p.due <= horizon), key=lambda p: p.due)
+    return due[: policy.max_concurrent_polls]
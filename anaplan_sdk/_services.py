@@ -3,23 +3,49 @@ import logging
 import time
 from asyncio import gather
 from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from gzip import compress
 from itertools import chain
 from math import ceil
-from typing import Any, Callable, Coroutine, Iterator, TypeAlias
+from typing import Any, AsyncIterator, Callable, Coroutine, Generic, Iterator, TypeAlias, TypeVar
 
 import httpx
 from httpx import HTTPError, Response
+from pydantic import BaseModel, Field, create_model
 
+from ._codec import _JsonCodec, get_json_codec  # pyright: ignore[reportPrivateUsage]
 from .exceptions import AnaplanException, AnaplanTimeoutException, InvalidIdentifierException
 
 logger = logging.getLogger("anaplan_sdk")
 
 _json_header = {"Content-Type": "application/json"}
 _gzip_header = {"Content-Type": "application/x-gzip"}
+_stream_block_size = 1_000_000
 
 
 AnyJson: TypeAlias = dict[str, Any] | list[dict[str, Any]]
+T = TypeVar("T", bound=BaseModel)
+
+
+class _Page(BaseModel, Generic[T]):
+    meta: dict[str, Any] = {}
+    total_results: int | None = Field(default=None, alias="totalResults")
+    items: list[T] = []
+
+
+@cache
+def _page_model(model: type[T], result_key: str) -> type[_Page[T]]:
+    """
+    Creates the model for a response holding a page of the given model under the given key. The
+    model is created once per model and key, so the validator is built only once, and lets
+    pydantic-core parse and validate the raw response bytes in a single pass, instead of first
+    decoding them into Python objects and then validating each of them.
+    """
+    return create_model(
+        f"{model.__name__}Page",
+        __base__=_Page[model],
+        items=(list[model], Field(default=[], alias=result_key)),  # pyright: ignore[reportInvalidTypeForm]
+    )
 
 
 class _HttpService:
@@ -31,56 +57,122 @@ class _HttpService:
         backoff: float,
         backoff_factor: float,
         page_size: int,
+        codec: _JsonCodec | None = None,
     ):
         logger.debug(
             f"Initializing HttpService with retry_count={retry_count}, page_size={page_size}."
         )
         self._client = client
+        self._codec = codec or get_json_codec()
         self._retry_count = retry_count
         self._backoff = backoff
         self._backoff_factor = backoff_factor
         self._page_size = min(page_size, 5_000)
 
     def get(self, url: str, **kwargs: Any) -> dict[str, Any]:
-        return self.__run_with_retry(self._client.get, url, **kwargs).json()
+        return self._codec.loads(self.__run_with_retry(self._client.get, url, **kwargs).content)
 
     def get_binary(self, url: str, **kwargs: Any) -> bytes:
         return self.__run_with_retry(self._client.get, url, **kwargs).content
 
+    def get_validated(self, url: str, result_key: str, model: type[T], **kwargs: Any) -> _Page[T]:
+        content = self.get_binary(url, **kwargs)
+        return _page_model(model, result_key).model_validate_json(content)
+
+    def get_stream(self, url: str, **kwargs: Any) -> Iterator[bytes]:
+        """
+        Stream the response body in blocks of about 1MB, without loading it into memory. Failed
+        requests are retried until the first block has been yielded, and rate limited requests
+        are retried with the same backoff as all other requests.
+        """
+        started = False
+        for i in range(max(self._retry_count, 1)):
+            try:
+                with self._client.stream("GET", url, **kwargs) as response:
+                    if response.status_code != 429:
+                        if response.is_error:
+                            response.read()
+                            response.raise_for_status()
+                        for block in response.iter_bytes(_stream_block_size):
+                            started = True
+                            yield block
+                        return
+            except HTTPError as error:
+                if started or i >= self._retry_count - 1:
+                    _raise_error(error)
+                logger.info(f"Retrying for: {url}")
+                continue
+            time.sleep(self._rate_limit_backoff(i))
+
     def post(self, url: str, json: AnyJson) -> dict[str, Any]:
-        return self.__run_with_retry(self._client.post, url, headers=_json_header, json=json).json()
+        return self.post_encoded(url, self._codec.dumps(json))
+
+    def post_encoded(self, url: str, content: bytes) -> dict[str, Any]:
+        return self.post_encoded_with_attempts(url, content)[0]
+
+    def post_encoded_with_attempts(self, url: str, content: bytes) -> tuple[dict[str, Any], int]:
+        res, attempts = self._run_with_attempts(
+            self._client.post, url, headers=_json_header, content=content
+        )
+        return self._codec.loads(res.content), attempts
+
+    def put_encoded_with_attempts(self, url: str, content: bytes) -> tuple[dict[str, Any], int]:
+        res, attempts = self._run_with_attempts(
+            self._client.put, url, headers=_json_header, content=content
+        )
+        return (self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}), attempts
+
+    def encode(self, obj: Any) -> bytes:
+        return self._codec.dumps(obj)
 
     def put(self, url: str, json: AnyJson) -> dict[str, Any]:
-        res = self.__run_with_retry(self._client.put, url, headers=_json_header, json=json)
-        return res.json() if res.num_bytes_downloaded > 0 else {}
+        content = self._codec.dumps(json)
+        res = self.__run_with_retry(self._client.put, url, headers=_json_header, content=content)
+        return self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}
 
     def patch(self, url: str, json: AnyJson) -> dict[str, Any]:
-        return (
-            self.__run_with_retry(self._client.patch, url, headers=_json_header, json=json)
-        ).json()
+        content = self._codec.dumps(json)
+        res = self.__run_with_retry(self._client.patch, url, headers=_json_header, content=content)
+        return self._codec.loads(res.content)
 
     def delete(self, url: str) -> dict[str, Any]:
-        return (self.__run_with_retry(self._client.delete, url, headers=_json_header)).json()
+        res = self.__run_with_retry(self._client.delete, url, headers=_json_header)
+        return self._codec.loads(res.content)
 
     def post_empty(self, url: str, **kwargs: Any) -> dict[str, Any]:
         res = self.__run_with_retry(self._client.post, url, **kwargs)
-        return res.json() if res.num_bytes_downloaded > 0 else {}
+        return self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}
 
     def put_binary_gzip(self, url: str, content: str | bytes) -> Response:
+        return self.put_binary_gzip_with_attempts(url, content)[0]
+
+    def put_binary_gzip_with_attempts(self, url: str, content: str | bytes) -> tuple[Response, int]:
         content = compress(content.encode() if isinstance(content, str) else content)
-        return self.__run_with_retry(self._client.put, url, headers=_gzip_header, content=content)
+        return self._run_with_attempts(self._client.put, url, headers=_gzip_header, content=content)
 
     def get_paginated(self, url: str, result_key: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        return self._paginate(url, result_key, None, **kwargs)
+
+    def get_paginated_validated(
+        self, url: str, result_key: str, model: type[T], **kwargs: Any
+    ) -> Iterator[T]:
+        return self._paginate(url, result_key, model, **kwargs)
+
+    def _paginate(
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> Iterator[Any]:
         logger.debug(f"Starting paginated fetch from {url} with page_size={self._page_size}.")
-        first_page, total_items, actual_size = self._get_first_page(url, result_key, **kwargs)
+        first_page, total_items, actual_size = self._get_first_page(
+            url, result_key, model, **kwargs
+        )
         if total_items <= actual_size:
             logger.debug("All items fit in first page, no additional requests needed.")
             return iter(first_page)
         pages_needed = ceil(total_items / actual_size)
         logger.debug(f"Fetching {pages_needed - 1} additional pages with {actual_size} items each.")
 
-        def get_page_wrapper(n: int) -> list[dict[str, Any]]:
-            return self._get_page(url, actual_size, n * actual_size, result_key, **kwargs)
+        def get_page_wrapper(n: int) -> list[Any]:
+            return self._get_page(url, actual_size, n * actual_size, result_key, model, **kwargs)
 
         with ThreadPoolExecutor() as executor:
             pages = executor.map(get_page_wrapper, range(1, pages_needed))
@@ -88,35 +180,49 @@ class _HttpService:
         return chain(first_page, *pages)
 
     def _get_page(
-        self, url: str, limit: int, offset: int, result_key: str, **kwargs: Any
-    ) -> list[dict[str, Any]]:
+        self,
+        url: str,
+        limit: int,
+        offset: int,
+        result_key: str,
+        model: type[BaseModel] | None,
+        **kwargs: Any,
+    ) -> list[Any]:
         logger.debug(f"Fetching page: offset={offset}, limit={limit} from {url}.")
         kwargs["params"] = (kwargs.get("params") or {}) | {"limit": limit, "offset": offset}
-        return self.get(url, **kwargs).get(result_key, [])
+        return self._get_result(url, result_key, model, **kwargs).get(result_key, [])
 
     def _get_first_page(
-        self, url: str, result_key: str, **kwargs: Any
-    ) -> tuple[list[dict[str, Any]], int, int]:
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> tuple[list[Any], int, int]:
         logger.debug(f"Fetching first page with limit={self._page_size} from {url}.")
         kwargs["params"] = (kwargs.get("params") or {}) | {"limit": self._page_size}
-        res = self.get(url, **kwargs)
+        res = self._get_result(url, result_key, model, **kwargs)
         return _extract_first_page(res, result_key, self._page_size)
 
+    def _get_result(
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> dict[str, Any]:
+        if model is None:
+            return self.get(url, **kwargs)
+        return _page_result(self.get_validated(url, result_key, model, **kwargs), result_key)
+
     def __run_with_retry(
         self, func: Callable[..., Response], *args: Any, **kwargs: Any
     ) -> Response:
+        return self._run_with_attempts(func, *args, **kwargs)[0]
+
+    def _run_with_attempts(
+        self, func: Callable[..., Response], *args: Any, **kwargs: Any
+    ) -> tuple[Response, int]:
         for i in range(max(self._retry_count, 1)):
             try:
                 response = func(*args, **kwargs)
                 if response.status_code == 429:
-                    if i >= self._retry_count - 1:
-                        raise AnaplanException("Rate limit exceeded.")
-                    backoff_time = self._backoff * (self._backoff_factor if i > 0 else 1)
-                    logger.warning(f"Rate limited. Retrying in {backoff_time} seconds.")
-                    time.sleep(backoff_time)
+                    time.sleep(self._rate_limit_backoff(i))
                     continue
                 response.raise_for_status()
-                return response
+                return response, i + 1
             except HTTPError as error:
                 if i >= self._retry_count - 1:
                     _raise_error(error)
@@ -125,6 +231,13 @@ class _HttpService:
 
         raise AnaplanException("Exhausted all retries without a successful response or Error.")
 
+    def _rate_limit_backoff(self, attempt: int) -> float:
+        if attempt >= self._retry_count - 1:
+            raise AnaplanException("Rate limit exceeded.")
+        backoff_time = self._backoff * (self._backoff_factor if attempt > 0 else 1)
+        logger.warning(f"Rate limited. Retrying in {backoff_time} seconds.")
+        return backoff_time
+
 
 class _AsyncHttpService:
     def __init__(
@@ -135,60 +248,137 @@ class _AsyncHttpService:
         backoff: float,
         backoff_factor: float,
         page_size: int,
+        codec: _JsonCodec | None = None,
     ):
         logger.debug(
             f"Initializing AsyncHttpService with retry_count={retry_count}, page_size={page_size}."
         )
         self._client = client
+        self._codec = codec or get_json_codec()
         self._retry_count = retry_count
         self._backoff = backoff
         self._backoff_factor = backoff_factor
         self._page_size = min(page_size, 5_000)
 
     async def get(self, url: str, **kwargs: Any) -> dict[str, Any]:
-        return (await self._run_with_retry(self._client.get, url, **kwargs)).json()
+        res = await self._run_with_retry(self._client.get, url, **kwargs)
+        return self._codec.loads(res.content)
 
     async def get_binary(self, url: str, **kwargs: Any) -> bytes:
         return (await self._run_with_retry(self._client.get, url, **kwargs)).content
 
+    async def get_validated(
+        self, url: str, result_key: str, model: type[T], **kwargs: Any
+    ) -> _Page[T]:
+        content = await self.get_binary(url, **kwargs)
+        return _page_model(model, result_key).model_validate_json(content)
+
+    async def get_stream(self, url: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """
+        Stream the response body in blocks of about 1MB, without loading it into memory. Failed
+        requests are retried until the first block has been yielded, and rate limited requests
+        are retried with the same backoff as all other requests.
+        """
+        started = False
+        for i in range(max(self._retry_count, 1)):
+            try:
+                async with self._client.stream("GET", url, **kwargs) as response:
+                    if response.status_code != 429:
+                        if response.is_error:
+                            await response.aread()
+                            response.raise_for_status()
+                        async for block in response.aiter_bytes(_stream_block_size):
+                            started = True
+                            yield block
+                        return
+            except HTTPError as error:
+                if started or i >= self._retry_count - 1:
+                    _raise_error(error)
+                logger.info(f"Retrying for: {url}")
+                continue
+            await asyncio.sleep(self._rate_limit_backoff(i))
+
     async def post(self, url: str, json: AnyJson) -> dict[str, Any]:
-        return (
-            await self._run_with_retry(self._client.post, url, headers=_json_header, json=json)
-        ).json()
+        return await self.post_encoded(url, self._codec.dumps(json))
+
+    async def post_encoded(self, url: str, content: bytes) -> dict[str, Any]:
+        return (await self.post_encoded_with_attempts(url, content))[0]
+
+    async def post_encoded_with_attempts(
+        self, url: str, content: bytes
+    ) -> tuple[dict[str, Any], int]:
+        res, attempts = await self._run_with_attempts(
+            self._client.post, url, headers=_json_header, content=content
+        )
+        return self._codec.loads(res.content), attempts
+
+    async def put_encoded_with_attempts(
+        self, url: str, content: bytes
+    ) -> tuple[dict[str, Any], int]:
+        res, attempts = await self._run_with_attempts(
+            self._client.put, url, headers=_json_header, content=content
+        )
+        return (self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}), attempts
+
+    def encode(self, obj: Any) -> bytes:
+        return self._codec.dumps(obj)
 
     async def put(self, url: str, json: AnyJson) -> dict[str, Any]:
-        res = await self._run_with_retry(self._client.put, url, headers=_json_header, json=json)
-        return res.json() if res.num_bytes_downloaded > 0 else {}
+        content = self._codec.dumps(json)
+        res = await self._run_with_retry(
+            self._client.put, url, headers=_json_header, content=content
+        )
+        return self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}
 
     async def patch(self, url: str, json: AnyJson) -> dict[str, Any]:
-        return (
-            await self._run_with_retry(self._client.patch, url, headers=_json_header, json=json)
-        ).json()
+        content = self._codec.dumps(json)
+        res = await self._run_with_retry(
+            self._client.patch, url, headers=_json_header, content=content
+        )
+        return self._codec.loads(res.content)
 
     async def delete(self, url: str) -> dict[str, Any]:
-        return (await self._run_with_retry(self._client.delete, url, headers=_json_header)).json()
+        res = await self._run_with_retry(self._client.delete, url, headers=_json_header)
+        return self._codec.loads(res.content)
 
     async def post_empty(self, url: str, **kwargs: Any) -> dict[str, Any]:
         res = await self._run_with_retry(self._client.post, url, **kwargs)
-        return res.json() if res.num_bytes_downloaded > 0 else {}
+        return self._codec.loads(res.content) if res.num_bytes_downloaded > 0 else {}
 
     async def put_binary_gzip(self, url: str, content: str | bytes) -> Response:
+        return (await self.put_binary_gzip_with_attempts(url, content))[0]
+
+    async def put_binary_gzip_with_attempts(
+        self, url: str, content: str | bytes
+    ) -> tuple[Response, int]:
         content = compress(content.encode() if isinstance(content, str) else content)
-        return await self._run_with_retry(
+        return await self._run_with_attempts(
             self._client.put, url, headers=_gzip_header, content=content
         )
 
     async def get_paginated(
         self, url: str, result_key: str, **kwargs: Any
     ) -> Iterator[dict[str, Any]]:
+        return await self._paginate(url, result_key, None, **kwargs)
+
+    async def get_paginated_validated(
+        self, url: str, result_key: str, model: type[T], **kwargs: Any
+    ) -> Iterator[T]:
+        return await self._paginate(url, result_key, model, **kwargs)
+
+    async def _paginate(
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> Iterator[Any]:
         logger.debug(f"Starting paginated fetch from {url} with page_size={self._page_size}.")
-        first_page, total_items, actual_size = await self._get_first_page(url, result_key, **kwargs)
+        first_page, total_items, actual_size = await self._get_first_page(
+            url, result_key, model, **kwargs
+        )
         if total_items <= actual_size:
             logger.debug("All items fit in first page, no additional requests needed.")
             return iter(first_page)
         pages = await gather(
             *(
-                self._get_page(url, actual_size, n * actual_size, result_key, **kwargs)
+                self._get_page(url, actual_size, n * actual_size, result_key, model, **kwargs)
                 for n in range(1, ceil(total_items / actual_size))
             )
         )
@@ -196,35 +386,50 @@ class _AsyncHttpService:
         return chain(first_page, *pages)
 
     async def _get_page(
-        self, url: str, limit: int, offset: int, result_key: str, **kwargs: Any
-    ) -> list[dict[str, Any]]:
+        self,
+        url: str,
+        limit: int,
+        offset: int,
+        result_key: str,
+        model: type[BaseModel] | None,
+        **kwargs: Any,
+    ) -> list[Any]:
         logger.debug(f"Fetching page: offset={offset}, limit={limit} from {url}.")
         kwargs["params"] = (kwargs.get("params") or {}) | {"limit": limit, "offset": offset}
-        return (await self.get(url, **kwargs)).get(result_key, [])
+        return (await self._get_result(url, result_key, model, **kwargs)).get(result_key, [])
 
     async def _get_first_page(
-        self, url: str, result_key: str, **kwargs: Any
-    ) -> tuple[list[dict[str, Any]], int, int]:
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> tuple[list[Any], int, int]:
         logger.debug(f"Fetching first page with limit={self._page_size} from {url}.")
         kwargs["params"] = (kwargs.get("params") or {}) | {"limit": self._page_size}
-        res = await self.get(url, **kwargs)
+        res = await self._get_result(url, result_key, model, **kwargs)
         return _extract_first_page(res, result_key, self._page_size)
 
+    async def _get_result(
+        self, url: str, result_key: str, model: type[BaseModel] | None, **kwargs: Any
+    ) -> dict[str, Any]:
+        if model is None:
+            return await self.get(url, **kwargs)
+        page = await self.get_validated(url, result_key, model, **kwargs)
+        return _page_result(page, result_key)
+
     async def _run_with_retry(
         self, func: Callable[..., Coroutine[Any, Any, Response]], *args: Any, **kwargs: Any
     ) -> Response:
+        return (await self._run_with_attempts(func, *args, **kwargs))[0]
+
+    async def _run_with_attempts(
+        self, func: Callable[..., Coroutine[Any, Any, Response]], *args: Any, **kwargs: Any
+    ) -> tuple[Response, int]:
         for i in range(max(self._retry_count, 1)):
             try:
                 response = await func(*args, **kwargs)
                 if response.status_code == 429:
-                    if i >= self._retry_count - 1:
-                        raise AnaplanException("Rate limit exceeded.")
-                    backoff_time = self._backoff * (self._backoff_factor if i > 0 else 1)
-                    logger.warning(f"Rate limited. Retrying in {backoff_time} seconds.")
-                    await asyncio.sleep(backoff_time)
+                    await asyncio.sleep(self._rate_limit_backoff(i))
                     continue
                 response.raise_for_status()
-                return response
+                return response, i + 1
             except HTTPError as error:
                 if i >= self._retry_count - 1:
                     _raise_error(error)
@@ -233,10 +438,21 @@ class _AsyncHttpService:
 
         raise AnaplanException("Exhausted all retries without a successful response or Error.")
 
+    def _rate_limit_backoff(self, attempt: int) -> float:
+        if attempt >= self._retry_count - 1:
+            raise AnaplanException("Rate limit exceeded.")
+        backoff_time = self._backoff * (self._backoff_factor if attempt > 0 else 1)
+        logger.warning(f"Rate limited. Retrying in {backoff_time} seconds.")
+        return backoff_time
+
+
+def _page_result(page: _Page[Any], result_key: str) -> dict[str, Any]:
+    return {"meta": page.meta, result_key: page.items}
+
 
 def _extract_first_page(
     res: dict[str, Any], result_key: str, page_size: int
-) -> tuple[list[dict[str, Any]], int, int]:
+) -> tuple[list[Any], int, int]:
     total_items, first_page = res["meta"]["paging"]["totalSize"], res.get(result_key, [])
     actual_page_size = res["meta"]["paging"]["currentPageSize"]
     if actual_page_size < page_size and not actual_page_size == total_items:
@@ -1,5 +1,6 @@
-from itertools import chain
-from typing import Any, Literal, Type, TypeVar
+from itertools import chain, product
+from math import prod
+from typing import Any, Iterator, Literal, Type, TypeVar
 
 from pydantic.alias_generators import to_camel
 
@@ -7,9 +8,14 @@ from anaplan_sdk._services import logger
 from anaplan_sdk.exceptions import AnaplanException, InvalidIdentifierException
 from anaplan_sdk.models import (
     AnaplanModel,
+    ChunkStats,
+    Dimension,
     InsertionResult,
+    ListDeletionResult,
+    ListUpdateResult,
     ModelCalendar,
     MonthsQuartersYearsCalendar,
+    ViewInfo,
     WeeksGeneralCalendar,
     WeeksGroupingCalendar,
     WeeksPeriodsCalendar,
@@ -132,6 +138,19 @@ def action_url(action_id: int) -> Literal["imports", "exports", "actions", "proc
     raise InvalidIdentifierException(f"Action '{action_id}' is not a valid identifier.")
 
 
+def dump_url(url: str, run_id: str, action_id: int | str | None = None) -> str:
+    """
+    Construct the url of the error dump of a CloudWorks run.
+    :param url: The base url of the CloudWorks integrations.
+    :param run_id: The ID of the run.
+    :param action_id: The ID of the import action, if the run is part of a process.
+    :return: The url of the error dump.
+    """
+    if action_id is None:
+        return f"{url}/run/{run_id}/dump"
+    return f"{url}/run/{run_id}/process/import/{action_id}/dumps"
+
+
 def parse_calendar_response(data: dict[str, Any]) -> ModelCalendar:
     """
     Parse calendar response and return appropriate calendar model.
@@ -154,19 +173,102 @@ def parse_calendar_response(data: dict[str, Any]) -> ModelCalendar:
     )
 
 
-def parse_insertion_response(data: list[dict[str, Any]]) -> InsertionResult:
+def parse_insertion_response(data: list[tuple[ChunkStats, dict[str, Any]]]) -> InsertionResult:
     failures, added, ignored, total = list[Any](), int(0), int(0), int(0)
-    for res in data:
-        failures.append(res.get("failures", []))
+    for chunk, res in data:
+        failures.append(_offset_failures(res, chunk.start))
         added += res.get("added", 0)
         total += res.get("total", 0)
         ignored += res.get("ignored", 0)
     return InsertionResult(
-        added=added, ignored=ignored, total=total, failures=list(chain.from_iterable(failures))
+        added=added,
+        ignored=ignored,
+        total=total,
+        failures=list(chain.from_iterable(failures)),
+        chunks=[chunk for chunk, _ in data],
+    )
+
+
+def parse_deletion_response(data: list[tuple[ChunkStats, dict[str, Any]]]) -> ListDeletionResult:
+    return ListDeletionResult(
+        deleted=sum(res.get("deleted", 0) for _, res in data),
+        failures=list(chain.from_iterable(_offset_failures(r, c.start) for c, r in data)),
+        chunks=[chunk for chunk, _ in data],
+    )
+
+
+def parse_update_response(data: list[tuple[ChunkStats, dict[str, Any]]]) -> ListUpdateResult:
+    return ListUpdateResult(
+        updated=sum(res.get("updated", 0) for _, res in data),
+        failures=list(chain.from_iterable(_offset_failures(r, c.start) for c, r in data)),
+        chunks=[chunk for chunk, _ in data],
+    )
+
+
+def _offset_failures(res: dict[str, Any], start: int) -> list[Any]:
+    return [
+        f | {"requestIndex": f["requestIndex"] + start} if "requestIndex" in f else f
+        for f in res.get("failures", [])
+    ]
+
+
+def parse_module_write_response(
+    responses: list[tuple[int, dict[str, Any]]],
+) -> int | dict[str, Any]:
+    """
+    Aggregate the responses of a chunked module write into the shape of a single response. The
+    indices of failures are offset by the start of their chunk, so they refer to the full data.
+    :param responses: The index of the first cell of each chunk and its response.
+    :return: The number of cells changed, or the aggregated response if there are failures.
+    """
+    if len(responses) == 1:
+        res = responses[0][1]
+        return res if "failures" in res else res["numberOfCellsChanged"]
+    changed, failures = 0, list[dict[str, Any]]()
+    for start, res in responses:
+        changed += res.get("numberOfCellsChanged", 0)
+        failures.extend(_offset_failures(res, start))
+    if not failures:
+        return changed
+    return {"numberOfCellsChanged": changed, "failures": failures}
+
+
+def view_page_selections(
+    info: ViewInfo, dimension_items: list[list[Dimension]], max_cells: int
+) -> Iterator[list[tuple[int, int]]]:
+    """
+    Yield every combination of page items of a View, so that each request for a single page
+    combination holds at most the cells of the row and column dimensions.
+    :param info: The information about the View.
+    :param dimension_items: The items of the row, column and page dimensions of the View, in
+           this order.
+    :param max_cells: The maximum number of cells per request.
+    :return: A generator yielding the page selections as `(dimension_id, item_id)` tuples.
+    """
+    grid = len(info.rows) + len(info.columns)
+    cells = prod(len(items) for items in dimension_items[:grid])
+    if cells > max_cells:
+        raise AnaplanException(
+            f"A single page of View {info.view_id} holds {cells:,} cells, which exceeds the "
+            f"limit of {max_cells:,}. Move some of the row or column dimensions to the pages."
+        )
+    pages = [
+        [(dimension.id, item.id) for item in items]
+        for dimension, items in zip(info.pages, dimension_items[grid:], strict=True)
+    ]
+    return map(list, product(*pages))
+
+
+def is_lookup_dimension(dimension_id: int) -> bool:
+    return (
+        dimension_id == 101999999999
+        or 101_000_000_000 <= dimension_id < 102_000_000_000
+        or dimension_id == 20000000003
+        or dimension_id == 20000000020
     )
 
 
-def validate_dimension_id(dimension_id: int) -> int:
+def validate_dimension_id(dimension_id: int, warn: bool = True) -> int:
     if not (
         dimension_id == 101999999999
         or 101_000_000_000 <= dimension_id < 102_000_000_000
@@ -181,8 +283,8 @@ def validate_dimension_id(dimension_id: int) -> int:
         "Using `get_dimension_items` for {} is discouraged. "
         "Prefer `{}` for better performance and more details on the members."
     )
-    if dimension_id == 101999999999:
+    if warn and dimension_id == 101999999999:
         logger.warning(msg.format("Users", "get_users"))
-    if 101000000000 <= dimension_id < 102000000000:
+    if warn and 101000000000 <= dimension_id < 102000000000:
         logger.warning(msg.format("Lists", "get_list_items"))
     return dimension_id
@@ -0,0 +1,239 @@
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, Timer
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, TypeVar, cast
+
+from anaplan_sdk.exceptions import BufferedWriteError
+
+logger = logging.getLogger("anaplan_sdk")
+
+_Cells = dict[str, Any] | Iterable[dict[str, Any]]
+_Result = int | dict[str, Any]
+F = TypeVar("F", Future[_Result], asyncio.Task[_Result])
+
+
+def _cell_key(cell: dict[str, Any]) -> Hashable:
+    dimensions = (tuple(sorted(d.items())) for d in cell.get("dimensions", ()))
+    return (cell.get("lineItemId"), cell.get("lineItemName"), tuple(sorted(dimensions, key=repr)))
+
+
+class _CellBuffer(Generic[F]):
+    """
+    The state shared by the sync and async write buffers: the pending cells, keyed by their
+    coordinates so that repeated writes to the same cell are merged and only the last value is
+    sent, and the outcome of the completed flushes.
+    """
+
+    def __init__(self, max_cells: int, max_age: float) -> None:
+        self._max_cells, self._max_age = max(max_cells, 1), max_age
+        self._cells: dict[Hashable, dict[str, Any]] = {}
+        self._closed = False
+        self.cells_written = 0
+        """The number of cells changed by the completed flushes."""
+        self._pending: deque[tuple[list[dict[str, Any]], F]] = deque()
+        self.failures: list[dict[str, Any]] = []
+        """
+        The flushes that failed or were only partially successful, each with the written `cells`
+        and either the `error` raised or the `response` of `update_module_data`. The `requestIndex`
+        of the failures in a response refers to the position in `cells`, the merged batch, and
+        each of these failures carries the according `cell` as well.
+        """
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _add(self, cells: _Cells) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed buffer.")
+        for cell in [cast(dict[str, Any], cells)] if isinstance(cells, dict) else cells:
+            self._cells[_cell_key(cell)] = cell
+
+    def _take(self) -> list[dict[str, Any]]:
+        cells, self._cells = list(self._cells.values()), {}
+        return cells
+
+    def _collect(self) -> None:
+        errors: list[Exception] = []
+        while self._pending and self._pending[0][1].done():
+            cells, future = self._pending.popleft()
+            try:
+                result = future.result()
+            except Exception as error:
+                logger.warning(f"Buffered write of {len(cells)} cells failed: {error!r}")
+                self.failures.append({"cells": cells, "error": error})
+                errors.append(error)
+                continue
+            self._record(cells, result)
+        if errors:
+            raise BufferedWriteError(errors) from errors[0]
+
+    def _record(self, cells: list[dict[str, Any]], result: _Result) -> None:
+        if isinstance(result, int):
+            self.cells_written += result
+            return
+        logger.warning(f"Buffered write was not fully successful: {result}")
+        self.cells_written += result.get("numberOfCellsChanged", 0)
+        failures: list[dict[str, Any]] = [
+            {**f, "cell": cells[f["requestIndex"]]} if "requestIndex" in f else f
+            for f in result.get("failures", [])
+        ]
+        self.failures.append({"cells": cells, "response": {**result, "failures": failures}})
+
+
+class ModuleWriteBuffer(_CellBuffer[Future[_Result]]):
+    """
+    Buffers cell writes to a Module and writes them in batches in the background. Repeated writes
+    to the same cell are merged, so only the last value is sent. The buffer is flushed once it
+    holds `max_cells` cells, once the oldest pending cell is `max_age` seconds old and when the
+    buffer is closed. Flushes run on a background thread one after another, so writes to the same
+    cell are applied in order. Exceptions raised by flushes are re-raised by the next call to
+    `write`, `flush` or `close` as a `BufferedWriteError` holding all of them, and the failed and
+    partially failed flushes are collected in `failures` together with their cells.
+
+    Use this as a context manager, which closes the buffer and waits for all flushes on exit.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[dict[str, Any]]], int | dict[str, Any]],
+        max_cells: int,
+        max_age: float,
+    ) -> None:
+        super().__init__(max_cells, max_age)
+        self._write = write
+        self._lock = Lock()
+        self._timer: Timer | None = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="anaplan_sdk_write_buffer")
+
+    def write(self, cells: _Cells) -> None:
+        """
+        Add cells to the buffer, in the format of `update_module_data`.
+        :param cells: A single cell or an iterable of cells.
+        """
+        with self._lock:
+            self._collect()
+            self._add(cells)
+            if len(self._cells) >= self._max_cells:
+                self._flush()
+            elif self._timer is None and self._cells:
+                self._timer = Timer(self._max_age, self._flush_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Write all pending cells in the background, regardless of the thresholds.
+        """
+        with self._lock:
+            self._collect()
+            self._flush()
+
+    def close(self) -> None:
+        """
+        Flush the pending cells and wait for all flushes to complete. Raises a `BufferedWriteError`
+        holding the exceptions of all flushes that failed and were not re-raised before.
+        """
+        with self._lock:
+            self._flush()
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        self._collect()
+
+    def _flush_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._cells and not self._closed:
+            cells = self._take()
+            self._pending.append((cells, self._executor.submit(self._write, cells)))
+
+    def __enter__(self) -> "ModuleWriteBuffer":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class AsyncModuleWriteBuffer(_CellBuffer[asyncio.Task[_Result]]):
+    """
+    Buffers cell writes to a Module and writes them in batches in the background. Repeated writes
+    to the same cell are merged, so only the last value is sent. The buffer is flushed once it
+    holds `max_cells` cells, once the oldest pending cell is `max_age` seconds old and when the
+    buffer is closed. Flushes run as background tasks one after another, so writes to the same
+    cell are applied in order. Exceptions raised by flushes are re-raised by the next call to
+    `write`, `flush` or `close` as a `BufferedWriteError` holding all of them, and the failed and
+    partially failed flushes are collected in `failures` together with their cells.
+
+    Use this as an async context manager, which closes the buffer and waits for all flushes on
+    exit.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[dict[str, Any]]], Awaitable[int | dict[str, Any]]],
+        max_cells: int,
+        max_age: float,
+    ) -> None:
+        super().__init__(max_cells, max_age)
+        self._write = write
+        self._timer: asyncio.TimerHandle | None = None
+
+    def write(self, cells: _Cells) -> None:
+        """
+        Add cells to the buffer, in the format of `update_module_data`. This never waits for the
+        network, the cells are written by a background task.
+        :param cells: A single cell or an iterable of cells.
+        """
+        self._collect()
+        self._add(cells)
+        if len(self._cells) >= self._max_cells:
+            self._flush()
+        elif self._timer is None and self._cells:
+            self._timer = asyncio.get_running_loop().call_later(self._max_age, self._flush)
+
+    def flush(self) -> None:
+        """
+        Write all pending cells in the background, regardless of the thresholds.
+        """
+        self._collect()
+        self._flush()
+
+    async def close(self) -> None:
+        """
+        Flush the pending cells and wait for all flushes to complete. Raises a `BufferedWriteError`
+        holding the exceptions of all flushes that failed and were not re-raised before.
+        """
+        self._flush()
+        self._closed = True
+        if self._pending:
+            await asyncio.wait([task for _, task in self._pending])
+        self._collect()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._cells and not self._closed:
+            previous = self._pending[-1][1] if self._pending else None
+            cells = self._take()
+            self._pending.append((cells, asyncio.create_task(self._run(cells, previous))))
+
+    async def _run(
+        self, cells: list[dict[str, Any]], previous: asyncio.Task[_Result] | None
+    ) -> _Result:
+        if previous is not None:
+            await asyncio.wait((previous,))
+        return await self._write(cells)
+
+    async def __aenter__(self) -> "AsyncModuleWriteBuffer":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
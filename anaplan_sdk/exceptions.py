@@ -62,3 +62,18 @@ class AnaplanTimeoutException(AnaplanException):
     ):
         self.message = message
         super().__init__(self.message)
+
+
+class BufferedWriteError(AnaplanException):
+    """
+    Exception raised by a write buffer when one or more of its flushes failed. The exceptions of
+    all failed flushes are collected in `exceptions`, in the order the flushes were made, and the
+    cells of the failed flushes are kept in the `failures` of the buffer.
+    """
+
+    def __init__(self, exceptions: list[Exception]):
+        self.exceptions = exceptions
+        self.message = f"{len(exceptions)} buffered write(s) failed: {exceptions[0]!r}" + (
+            f" and {len(exceptions) - 1} more." if len(exceptions) > 1 else "."
+        )
+        super().__init__(self.message)
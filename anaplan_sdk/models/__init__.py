@@ -13,8 +13,12 @@ from ._bulk import (
     ModelDeletionResult,
     ModelWithTransactionInfo,
     Process,
+    UploadResult,
     Workspace,
 )
+from ._columnar import ListItemsFrame
+from ._index import DimensionIndex, LineItemDimensionIndex
+from ._metadata import ModelMetadata
 from ._task import (
     CompletedReportTask,
     CompletedSyncTask,
@@ -31,6 +35,7 @@ from ._task import (
     TaskSummary,
 )
 from ._transactional import (
+    ChunkStats,
     CurrentPeriod,
     Dimension,
     DimensionWithCode,
@@ -40,6 +45,8 @@ from ._transactional import (
     LineItem,
     ListDeletionResult,
     ListItem,
+    ListSyncResult,
+    ListUpdateResult,
     ModelCalendar,
     ModelStatus,
     Module,
@@ -51,6 +58,7 @@ from ._transactional import (
     WeeksGroupingCalendar,
     WeeksPeriodsCalendar,
 )
+from ._view_array import ViewArray
 
 __all__ = [
     "AnaplanModel",
@@ -62,8 +70,14 @@ __all__ = [
     "ModelStatus",
     "ModelRevision",
     "File",
+    "UploadResult",
     "List",
     "ListItem",
+    "ListItemsFrame",
+    "DimensionIndex",
+    "LineItemDimensionIndex",
+    "ModelMetadata",
+    "ViewArray",
     "ListMetadata",
     "Action",
     "Import",
@@ -88,6 +102,7 @@ __all__ = [
     "User",
     "Failure",
     "InsertionResult",
+    "ChunkStats",
     "Revision",
     "CurrentPeriod",
     "FiscalYear",
@@ -102,4 +117,6 @@ __all__ = [
     "ModelDeletionResult",
     "DimensionWithCode",
     "ListDeletionResult",
+    "ListUpdateResult",
+    "ListSyncResult",
 ]
@@ -78,6 +78,50 @@ class File(AnaplanModel):
     separator: str | None = Field(None, description="The separator used in this file.")
 
 
+class UploadResult(AnaplanModel):
+    file_id: int = Field(description="The unique identifier of the file that was uploaded to.")
+    skipped: bool = Field(
+        description=(
+            "Whether the upload was skipped, because the content was identical to the last "
+            "successful upload to this file."
+        )
+    )
+    digest: str | None = Field(
+        default=None,
+        description="The SHA-256 digest of the content, if skipping unchanged uploads is enabled.",
+    )
+    chunk_count: int = Field(description="The number of chunks that were uploaded.")
+    size: int = Field(description="The uncompressed size of the content in bytes.")
+    chunk_sizes: list[int] = Field(
+        default=[],
+        description=(
+            "The uncompressed sizes of the uploaded chunks in bytes, in order of completion. Only "
+            "reported for uploads with `upload_chunk_size='auto'`."
+        ),
+    )
+    parallelism: int | None = Field(
+        default=None,
+        description=(
+            "The highest number of chunks uploaded concurrently. Only reported for uploads with "
+            "`upload_chunk_size='auto'`."
+        ),
+    )
+    retries: int | None = Field(
+        default=None,
+        description=(
+            "The number of chunk requests that were retried. Only reported for uploads with "
+            "`upload_chunk_size='auto'`."
+        ),
+    )
+    throughput: float | None = Field(
+        default=None,
+        description=(
+            "The observed throughput per connection in uncompressed bytes per second. Only "
+            "reported for uploads with `upload_chunk_size='auto'`."
+        ),
+    )
+
+
 class List(AnaplanModel):
     id: int = Field(description="The unique identifier of this list.")
     name: str = Field(description="The name of this list.")
@@ -0,0 +1,202 @@
+from array import array
+from sys import intern
+from typing import Any, Iterable, Iterator
+
+from anaplan_sdk.exceptions import AnaplanException
+
+from ._transactional import ListItem
+
+
+def _intern(value: Any) -> str | None:
+    return None if value is None else intern(str(value))
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise AnaplanException(
+            "pyarrow is not available. Please install anaplan-sdk with the arrow extra "
+            "`pip install anaplan-sdk[arrow]` or install pyarrow separately."
+        ) from e
+    return pyarrow
+
+
+class ListItemsFrame:
+    """
+    The items of a List in a columnar layout. Instead of one object per item, every field is held
+    in a single column: Ids in an `array("q")`, names, codes and parents as lists of interned
+    strings and every property and subset in a column of its own. This takes a fraction of the
+    memory of a list of `ListItem` objects or dictionaries for Lists with millions of items, and
+    the Id columns can be handed to NumPy or Arrow without copying.
+    """
+
+    def __init__(self) -> None:
+        self.ids: array[int] = array("q")
+        """The Ids of the items."""
+        self.names: list[str] = []
+        """The names of the items."""
+        self.codes: list[str | None] = []
+        """The codes of the items."""
+        self.parents: list[str | None] = []
+        """The names of the parents of the items."""
+        self.parent_ids: array[int] = array("q")
+        """The Ids of the parents of the items, or -1 for items without a parent."""
+        self.properties: dict[str, list[str | None]] = {}
+        """The property columns by property name."""
+        self.subsets: dict[str, array[int]] = {}
+        """The subset columns by subset name, with 1 for members of the subset and 0 otherwise."""
+        self._by_code: dict[str, int] = {}
+        self._frozen = False
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> "ListItemsFrame":
+        """
+        Build a frame from the raw items of a List, as returned by `get_list_items` or
+        `iter_list_items` with `return_raw=True`. The items are consumed one by one, so passing
+        a generator never holds more than one item in memory.
+        :param items: The raw items.
+        :return: The frame.
+        """
+        frame = cls()
+        for item in items:
+            frame.append(item)
+        return frame
+
+    def append(self, item: dict[str, Any]) -> None:
+        """
+        Append a single raw item to the frame.
+        :param item: The raw item.
+        """
+        if self._frozen:
+            raise RuntimeError(
+                "Cannot append to a frame after `to_numpy` or `to_arrow` returned zero-copy views "
+                "of its columns. Pass `copy=True` to these methods to keep the frame writable."
+            )
+        row = len(self.ids)
+        self.ids.append(int(item["id"]))
+        self.names.append(intern(item["name"]))
+        code = _intern(item.get("code"))
+        self.codes.append(code)
+        if code is not None:
+            self._by_code[code] = row
+        self.parents.append(_intern(item.get("parent")))
+        parent_id = item.get("parentId")
+        self.parent_ids.append(-1 if parent_id is None else int(parent_id))
+        properties: dict[str, Any] = item.get("properties") or {}
+        for name in properties.keys() - self.properties.keys():
+            self.properties[name] = [None] * row
+        for name, column in self.properties.items():
+            column.append(_intern(properties.get(name)))
+        subsets: dict[str, Any] = item.get("subsets") or {}
+        for name in subsets.keys() - self.subsets.keys():
+            self.subsets[name] = array("b", bytes(row))
+        for name, column in self.subsets.items():
+            column.append(1 if subsets.get(name) else 0)
+
+    def index(self, code: str) -> int:
+        """
+        Get the row of the item with the given code in constant time.
+        :param code: The code of the item.
+        :return: The row of the item.
+        :raises KeyError: If there is no item with the given code.
+        """
+        return self._by_code[code]
+
+    def get(self, code: str) -> ListItem | None:
+        """
+        Get the item with the given code in constant time.
+        :param code: The code of the item.
+        :return: The item, or None if there is no item with the given code.
+        """
+        row = self._by_code.get(code)
+        return None if row is None else self[row]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._by_code
+
+    def __getitem__(self, row: int) -> ListItem:
+        parent_id = self.parent_ids[row]
+        return ListItem(
+            id=self.ids[row],
+            name=self.names[row],
+            code=self.codes[row],
+            properties={k: v[row] for k, v in self.properties.items() if v[row] is not None},
+            subsets={k: bool(v[row]) for k, v in self.subsets.items()},
+            parent=self.parents[row],
+            parent_id=None if parent_id < 0 else str(parent_id),
+        )
+
+    def __iter__(self) -> Iterator[ListItem]:
+        return (self[row] for row in range(len(self)))
+
+    def to_numpy(self, copy: bool = False) -> dict[str, Any]:
+        """
+        Convert the frame to a dictionary of NumPy arrays. String columns are converted to arrays
+        of Python objects. By default, the Id and subset columns are views on the underlying
+        buffers and are not copied, so they share memory with the frame. Since the buffers cannot
+        be resized while they are shared, this freezes the frame, and any later `append` raises a
+        `RuntimeError`. Properties and subsets are named `properties.<name>` and `subsets.<name>`,
+        so that they cannot collide with each other or with the fields. Requires NumPy.
+        :param copy: If True, all columns are copied and the frame stays writable.
+        :return: A dictionary of column names to NumPy arrays.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise AnaplanException(
+                "numpy is not available. Please install anaplan-sdk with the numpy extra "
+                "`pip install anaplan-sdk[numpy]` or install numpy separately."
+            ) from e
+
+        def ints(column: "array[int]", dtype: Any) -> Any:
+            values = np.frombuffer(column, dtype=dtype)
+            return values.copy() if copy else values
+
+        self._frozen = self._frozen or not copy
+        columns: dict[str, Any] = {
+            "id": ints(self.ids, np.int64),
+            "name": np.array(self.names, dtype=object),
+            "code": np.array(self.codes, dtype=object),
+            "parent": np.array(self.parents, dtype=object),
+            "parent_id": ints(self.parent_ids, np.int64),
+        }
+        columns.update(
+            {f"properties.{k}": np.array(v, dtype=object) for k, v in self.properties.items()}
+        )
+        columns.update({f"subsets.{k}": ints(v, np.bool_) for k, v in self.subsets.items()})
+        return columns
+
+    def to_arrow(self, copy: bool = False) -> Any:
+        """
+        Convert the frame to an Arrow Table. By default, the Id columns wrap the underlying
+        buffers and are not copied, which freezes the frame like `to_numpy`. Properties and subsets
+        are named like in `to_numpy`. Requires PyArrow.
+        :param copy: If True, all columns are copied and the frame stays writable.
+        :return: A `pyarrow.Table` with one column per field, property and subset.
+        """
+        pa = _pyarrow()
+
+        def ints(column: "array[int]", type_: Any) -> Any:
+            buffer = pa.py_buffer(column.tobytes() if copy else column)
+            return pa.Array.from_buffers(type_, len(column), [None, buffer])
+
+        self._frozen = self._frozen or not copy
+
+        columns: dict[str, Any] = {
+            "id": ints(self.ids, pa.int64()),
+            "name": pa.array(self.names, pa.string()),
+            "code": pa.array(self.codes, pa.string()),
+            "parent": pa.array(self.parents, pa.string()),
+            "parent_id": ints(self.parent_ids, pa.int64()),
+        }
+        columns.update(
+            {f"properties.{k}": pa.array(v, pa.string()) for k, v in self.properties.items()}
+        )
+        columns.update(
+            {f"subsets.{k}": ints(v, pa.int8()).cast(pa.bool_()) for k, v in self.subsets.items()}
+        )
+        return pa.table(columns)
@@ -0,0 +1,171 @@
+import time
+from threading import Lock
+from typing import Any, Iterable, Literal
+
+from ._transactional import Dimension
+
+
+class DimensionIndex:
+    """
+    Maps the codes and names of the items of a dimension to their Ids in hash tables, so that
+    items can be resolved locally in constant time instead of with a request per lookup. The index
+    is built once from all items of the dimension and can be extended with individual items as
+    they are looked up. Names are only unique within some dimensions, so if several items share a
+    name, the index holds the Id of the last one.
+    """
+
+    def __init__(self, dimension_id: int, loaded_at: float | None = None) -> None:
+        self.dimension_id = dimension_id
+        """The Id of the dimension."""
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        """The time the index was loaded, in seconds since the epoch."""
+        self.codes: dict[str, int] = {}
+        """The Ids of the items by code."""
+        self.names: dict[str, int] = {}
+        """The Ids of the items by name."""
+        self._lock = Lock()
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the index was loaded."""
+        return time.time() - self.loaded_at
+
+    def add(self, items: Iterable[dict[str, Any]]) -> None:
+        """
+        Add items to the index.
+        :param items: The raw items, each with an `id`, a `name` and optionally a `code`.
+        """
+        items = list(items)
+        with self._lock:
+            for item in items:
+                id_ = int(item["id"])
+                self.names[item["name"]] = id_
+                if code := item.get("code"):
+                    self.codes[code] = id_
+
+    def get(self, value: str, by: Literal["code", "name"] = "code") -> int | None:
+        """
+        Get the Id of the item with the given code or name.
+        :param value: The code or name of the item.
+        :param by: Whether `value` is a code or a name.
+        :return: The Id of the item, or None if it is not in the index.
+        """
+        return (self.codes if by == "code" else self.names).get(value)
+
+    def resolve(
+        self, values: Iterable[str], by: Literal["code", "name"] = "code"
+    ) -> dict[str, int]:
+        """
+        Get the Ids of the items with the given codes or names.
+        :param values: The codes or names of the items.
+        :param by: Whether `values` are codes or names.
+        :return: The Ids by code or name. Values that are not in the index are omitted.
+        """
+        table = self.codes if by == "code" else self.names
+        return {v: table[v] for v in values if v in table}
+
+    def missing(self, values: Iterable[str], by: Literal["code", "name"] = "code") -> list[str]:
+        """
+        Get the given codes or names that are not in the index.
+        :param values: The codes or names of the items.
+        :param by: Whether `values` are codes or names.
+        :return: The codes or names that are not in the index, without duplicates.
+        """
+        table = self.codes if by == "code" else self.names
+        return list(dict.fromkeys(v for v in values if v not in table))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The index as a JSON-serializable dictionary, holding copies of the tables, so that
+                 items can be added to the index while the dictionary is serialized.
+        """
+        with self._lock:
+            codes, names = dict(self.codes), dict(self.names)
+        return {
+            "dimension_id": self.dimension_id,
+            "loaded_at": self.loaded_at,
+            "codes": codes,
+            "names": names,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DimensionIndex":
+        """
+        Restore an index from the dictionary returned by `to_dict`.
+        :param data: The dictionary.
+        :return: The index.
+        """
+        index = cls(int(data["dimension_id"]), float(data["loaded_at"]))
+        index.codes = {str(k): int(v) for k, v in data.get("codes", {}).items()}
+        index.names = {str(k): int(v) for k, v in data.get("names", {}).items()}
+        return index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self.codes
+
+
+class LineItemDimensionIndex:
+    """
+    Holds the dimensions of the Line Items of a Model at one revision, together with the inverted
+    index from each dimension to the Line Items that use it. The dimensionality of a Line Item can
+    only change when the Model is saved, so the index is valid for as long as the Model's
+    `last_saved_serial_number` is unchanged.
+    """
+
+    def __init__(self, serial_number: int) -> None:
+        self.serial_number = serial_number
+        """The serial number of the last save of the Model this index is valid for."""
+        self.dimensions: dict[int, list[Dimension]] = {}
+        """The dimensions by the Id of the Line Item."""
+        self.line_items: dict[int, list[int]] = {}
+        """The Ids of the Line Items by the Id of the dimension they use."""
+
+    def add(self, line_item_id: int, dimensions: list[Dimension]) -> None:
+        """
+        Add the dimensions of a Line Item to the index.
+        :param line_item_id: The ID of the Line Item.
+        :param dimensions: The dimensions of the Line Item.
+        """
+        for dimension in self.dimensions.get(line_item_id, []):
+            self.line_items[dimension.id].remove(line_item_id)
+        self.dimensions[line_item_id] = dimensions
+        for dimension in dimensions:
+            self.line_items.setdefault(dimension.id, []).append(line_item_id)
+
+    def missing(self, line_item_ids: Iterable[int]) -> list[int]:
+        """
+        Get the given Line Items that are not in the index.
+        :param line_item_ids: The IDs of the Line Items.
+        :return: The IDs of the Line Items that are not in the index, without duplicates.
+        """
+        return list(dict.fromkeys(i for i in line_item_ids if i not in self.dimensions))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The index as a JSON-serializable dictionary.
+        """
+        return {
+            "serial_number": self.serial_number,
+            "dimensions": {str(k): [d.model_dump() for d in v] for k, v in self.dimensions.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LineItemDimensionIndex":
+        """
+        Restore an index from the dictionary returned by `to_dict`.
+        :param data: The dictionary.
+        :return: The index.
+        """
+        index = cls(int(data["serial_number"]))
+        for line_item_id, dimensions in data.get("dimensions", {}).items():
+            index.add(int(line_item_id), [Dimension.model_validate(d) for d in dimensions])
+        return index
+
+    def __len__(self) -> int:
+        return len(self.dimensions)
+
+    def __contains__(self, line_item_id: object) -> bool:
+        return line_item_id in self.dimensions
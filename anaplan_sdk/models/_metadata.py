@@ -0,0 +1,61 @@
+from functools import cached_property
+
+from pydantic import Field
+
+from ._base import AnaplanModel
+from ._bulk import Action, Export, File, Import, List, Process
+from ._transactional import LineItem, Module, View
+
+
+class ModelMetadata(AnaplanModel):
+    """
+    A snapshot of the metadata of a Model, with indexes for the most common lookups. The indexes
+    are built on first access and are not part of the serialized snapshot.
+    """
+
+    model_id: str = Field(description="The unique identifier of the model.")
+    last_saved_serial_number: int = Field(
+        description="The serial number of the last save of the model when this snapshot was taken."
+    )
+    modules: list[Module] = Field(description="The Modules of the model.")
+    line_items: list[LineItem] = Field(description="The Line Items of all Modules of the model.")
+    lists: list[List] = Field(description="The Lists of the model.")
+    views: list[View] = Field(description="The Views of all Modules of the model.")
+    imports: list[Import] = Field(description="The Imports of the model.")
+    exports: list[Export] = Field(description="The Exports of the model.")
+    files: list[File] = Field(description="The Files of the model.")
+    processes: list[Process] = Field(description="The Processes of the model.")
+    actions: list[Action] = Field(
+        description="The Actions of the model listed under `Other Actions` in Anaplan."
+    )
+
+    @cached_property
+    def line_items_by_module(self) -> dict[int, list[LineItem]]:
+        """The Line Items by the Id of their Module."""
+        index: dict[int, list[LineItem]] = {}
+        for line_item in self.line_items:
+            index.setdefault(line_item.module_id, []).append(line_item)
+        return index
+
+    @cached_property
+    def views_by_module(self) -> dict[int, list[View]]:
+        """The Views by the Id of their Module."""
+        index: dict[int, list[View]] = {}
+        for view in self.views:
+            index.setdefault(view.moduleId, []).append(view)
+        return index
+
+    @cached_property
+    def actions_by_name(self) -> dict[str, Import | Export | Process | Action]:
+        """
+        The Imports, Exports, Processes and other Actions by name. If several of them share a name,
+        Processes take precedence over Imports and Exports, which take precedence over other
+        Actions.
+        """
+        actions: list[Import | Export | Process | Action] = [
+            *self.actions,
+            *self.exports,
+            *self.imports,
+            *self.processes,
+        ]
+        return {action.name: action for action in actions}
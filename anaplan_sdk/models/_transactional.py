@@ -228,16 +228,54 @@ class ModelStatus(AnaplanModel):
     export_task_type: str | None = Field(description="The export task type of this model.")
 
 
+class ChunkStats(AnaplanModel):
+    start: int = Field(description="The index of the first item in this chunk.")
+    items: int = Field(description="The number of items in this chunk.")
+    size: int = Field(description="The size of the encoded request in bytes.")
+    seconds: float = Field(description="The time it took to send this chunk, including retries.")
+    attempts: int = Field(description="The number of requests it took to send this chunk.")
+
+
 class InsertionResult(AnaplanModel):
     added: int = Field(description="The number of items successfully added.")
     ignored: int = Field(description="The number of items ignored, or items that failed.")
     total: int = Field(description="The total number of items.")
     failures: list[Failure] = Field([], description="The list of failures.")
+    chunks: list[ChunkStats] = Field(
+        default=[], description="The statistics of each request, in the order of the items."
+    )
 
 
 class ListDeletionResult(AnaplanModel):
     deleted: int = Field(description="The number of items successfully deleted.")
     failures: list[Failure] = Field([], description="The list of failures.")
+    chunks: list[ChunkStats] = Field(
+        default=[], description="The statistics of each request, in the order of the items."
+    )
+
+
+class ListUpdateResult(AnaplanModel):
+    updated: int = Field(description="The number of items successfully updated.")
+    failures: list[Failure] = Field([], description="The list of failures.")
+    chunks: list[ChunkStats] = Field(
+        default=[], description="The statistics of each request, in the order of the items."
+    )
+
+
+class ListSyncResult(AnaplanModel):
+    inserted: InsertionResult = Field(description="The result of inserting the new items.")
+    updated: ListUpdateResult = Field(description="The result of updating the changed items.")
+    deleted: ListDeletionResult = Field(
+        description="The result of deleting the items that are no longer desired."
+    )
+    unchanged: int = Field(description="The number of items that were already up to date.")
+    skipped: list[str] = Field(
+        [],
+        description=(
+            "The Ids of the current items that have no value for the key. These cannot be matched "
+            "and are neither updated nor deleted."
+        ),
+    )
 
 
 class PartialCurrentPeriod(AnaplanModel):
@@ -0,0 +1,186 @@
+import csv
+from io import StringIO
+from typing import Any
+
+from anaplan_sdk.exceptions import AnaplanException
+
+from ._transactional import ViewInfo
+
+_BOOLEANS = {"true": "1", "false": "0"}
+_LINE_ITEMS = 20000000000
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise AnaplanException(
+            "numpy is not available. Please install anaplan-sdk with the numpy extra "
+            "`pip install anaplan-sdk[numpy]` or install numpy separately."
+        ) from e
+    return numpy
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(_BOOLEANS.get(value.lower(), value) or "nan")
+    except ValueError:
+        return float("nan")
+
+
+class ViewArray:
+    """
+    The cell values of a View as a float64 NumPy array, with label vectors for each axis. The
+    first axis holds the rows and the second axis the columns of the View, followed by one axis
+    per page dimension. Empty cells and cells that are neither numbers nor booleans are NaN, and
+    booleans are 1.0 and 0.0. The cells that held a boolean are marked in `booleans`, so that they
+    are written back as booleans.
+    """
+
+    def __init__(
+        self,
+        info: ViewInfo,
+        values: Any,
+        rows: Any,
+        columns: Any,
+        pages: list[Any],
+        booleans: Any = None,
+    ) -> None:
+        self.info = info
+        """The information about the View, including its row, column and page dimensions."""
+        self.values = values
+        """The cell values, shaped `(rows, columns, *pages)`."""
+        self.rows = rows
+        """The labels of the rows, with one column per row dimension."""
+        self.columns = columns
+        """The labels of the columns, with one column per column dimension."""
+        self.pages = pages
+        """The labels of the items of each page dimension, in the order of `info.pages`."""
+        self.booleans = _numpy().zeros(values.shape, dtype=bool) if booleans is None else booleans
+        """A boolean NumPy array that is True for every cell that holds a boolean."""
+
+    @classmethod
+    def from_grids(cls, info: ViewInfo, grids: list[bytes], pages: list[list[str]]) -> "ViewArray":
+        """
+        Build the array from the CSV grids of every combination of page items of a View.
+        :param info: The information about the View.
+        :param grids: The CSV grids, one per combination of page items, in the order of the
+               cartesian product of the page items.
+        :param pages: The names of the items of each page dimension.
+        :return: The array.
+        """
+        np = _numpy()
+        parsed = [
+            _parse_grid(np, grid, len(info.columns) or 1, len(info.rows) or 1) for grid in grids
+        ]
+        rows, columns, first, _ = parsed[0]
+        if any(values.shape != first.shape for _, _, values, _ in parsed):
+            raise AnaplanException(f"The pages of View {info.view_id} differ in shape.")
+        values = np.stack([values for _, _, values, _ in parsed], axis=-1)
+        booleans = np.stack([booleans for _, _, _, booleans in parsed], axis=-1)
+        shape = (*first.shape, *(len(items) for items in pages))
+        return cls(
+            info,
+            values.reshape(shape),
+            rows,
+            columns,
+            [np.array(p, dtype=object) for p in pages],
+            booleans.reshape(shape),
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape of the values."""
+        return self.values.shape
+
+    def changed(self, values: Any) -> Any:
+        """
+        Compare the given values against the values of this array in a single vectorized pass.
+        Cells that are NaN in `values` are never considered changed, since they cannot be written.
+        :param values: The new values, in the same shape as `values`.
+        :return: A boolean NumPy array that is True for every changed cell.
+        """
+        np = _numpy()
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != self.values.shape:
+            raise ValueError(f"Expected values of shape {self.values.shape}, got {values.shape}.")
+        return (values != self.values) & ~np.isnan(values)
+
+    def apply(self, values: Any, mask: Any) -> None:
+        """
+        Copy the selected cells of the given values into this array, e.g. after they have been
+        written to the Model.
+        :param values: The new values, in the same shape as `values`.
+        :param mask: A boolean NumPy array selecting the cells to copy.
+        """
+        self.values[mask] = _numpy().asarray(values, dtype=self.values.dtype)[mask]
+
+    def to_module_data(
+        self, values: Any, mask: Any, line_item_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Translate the selected cells into the payload of `update_module_data`. Each cell is
+        addressed by the Ids of the dimensions of the View and the names of its items. Cells that
+        held a boolean are written as booleans, all others as numbers. If the Line Items are not a
+        dimension of the View, `line_item_id` must be passed.
+        :param values: The new values, in the same shape as `values`.
+        :param mask: A boolean NumPy array selecting the cells to write, e.g. from `changed`.
+        :param line_item_id: The ID of the Line Item, if the View has no Line Items dimension.
+        :return: The data to pass to `update_module_data`.
+        """
+        np = _numpy()
+        values = np.asarray(values, dtype=np.float64)
+        dimensions = [*self.info.rows, *self.info.columns, *self.info.pages]
+        line_item = next((i for i, d in enumerate(dimensions) if d.id == _LINE_ITEMS), None)
+        if line_item is None and line_item_id is None:
+            raise ValueError(
+                f"View {self.info.view_id} has no Line Items dimension, pass `line_item_id`."
+            )
+        n_rows, n_columns = len(self.info.rows), len(self.info.columns)
+        data: list[dict[str, Any]] = []
+        for cell in zip(*(axis.tolist() for axis in np.nonzero(mask)), strict=True):
+            names = [
+                *self.rows[cell[0], :n_rows],
+                *self.columns[cell[1], :n_columns],
+                *(page[item] for page, item in zip(self.pages, cell[2:], strict=True)),
+            ]
+            target = (
+                {"lineItemId": line_item_id}
+                if line_item is None
+                else {"lineItemName": names[line_item]}
+            )
+            data.append(
+                target
+                | {
+                    "dimensions": [
+                        {"dimensionId": d.id, "itemName": name}
+                        for k, (d, name) in enumerate(zip(dimensions, names, strict=True))
+                        if k != line_item
+                    ],
+                    "value": bool(values[cell]) if self.booleans[cell] else values[cell].item(),
+                }
+            )
+        return data
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        return self.values if dtype is None else self.values.astype(dtype)
+
+
+def _parse_grid(np: Any, content: bytes, header_rows: int, label_columns: int) -> tuple[Any, ...]:
+    records = list(csv.reader(StringIO(content.decode("utf-8-sig"))))
+    header, body = records[:header_rows], [r for r in records[header_rows:] if r]
+    columns = np.array([h[label_columns:] for h in header], dtype=object).T
+    rows = np.array([r[:label_columns] for r in body], dtype=object).reshape(-1, label_columns)
+    cells = [value or "nan" for record in body for value in record[label_columns:]]
+    if len(cells) != len(body) * len(columns):
+        raise AnaplanException("The rows of the View differ in length from its header.")
+    try:
+        values = np.array(cells, dtype=np.float64)
+        booleans = np.zeros(len(cells), dtype=bool)
+    except ValueError:
+        values = np.fromiter(map(_to_float, cells), dtype=np.float64, count=len(cells))
+        booleans = np.fromiter(
+            (c.lower() in _BOOLEANS for c in cells), dtype=bool, count=len(cells)
+        )
+    shape = (len(body), len(columns))
+    return rows, columns, values.reshape(shape), booleans.reshape(shape)
@@ -1,4 +1,5 @@
-from asyncio import gather
+from asyncio import gather, wait
+from io import BytesIO
 
 import pytest
 
@@ -8,6 +9,7 @@ from anaplan_sdk.exceptions import (
     InvalidCredentialsException,
     InvalidIdentifierException,
 )
+from tests.conftest import PyVersionConfig
 
 test_file = 113000000073
 test_action = 118000000027
@@ -116,6 +118,15 @@ async def test_list_exports(client: AsyncClient) -> None:
     assert len(exports) > 0
 
 
+async def test_snapshot_model_metadata(client: AsyncClient) -> None:
+    snapshot = await client.snapshot_model_metadata(refresh=True)
+    assert isinstance(snapshot, models.ModelMetadata)
+    assert len(snapshot.modules) > 0 and len(snapshot.line_items) > 0
+    assert sum(map(len, snapshot.line_items_by_module.values())) == len(snapshot.line_items)
+    assert snapshot.actions_by_name[snapshot.processes[0].name].id == snapshot.processes[0].id
+    assert await client.snapshot_model_metadata() == snapshot
+
+
 async def test_upload_file_stream(client: AsyncClient) -> None:
     await client.upload_file_stream(test_file, (str(i) for i in range(10)))
     out = await client.get_file(test_file)
@@ -128,6 +139,14 @@ async def test_upload_file_async_stream(client: AsyncClient) -> None:
     assert out == b"0123456789"
 
 
+async def test_upload_file_async_stream_coalesced(client: AsyncClient) -> None:
+    result = await client.upload_file_stream(
+        test_file, (i async for i in _async_range(10)), coalesce=True
+    )
+    assert result.chunk_count == 1
+    assert await client.get_file(test_file) == b"0123456789"
+
+
 async def test_get_file_stream(client: AsyncClient) -> None:
     async for chunk in client.get_file_stream(test_file):
         assert isinstance(chunk, bytes)
@@ -139,10 +158,34 @@ async def test_upload_and_download_file(client: AsyncClient) -> None:
     assert out == b"Hi!"
 
 
+async def test_get_files_content(client: AsyncClient) -> None:
+    await client.upload_file(test_file, "Hi!")
+    sink = BytesIO()
+    assert await client.get_files_content([test_file]) == {test_file: b"Hi!"}
+    assert await client.get_files_content([test_file], sinks={test_file: sink}) == {}
+    assert sink.getvalue() == b"Hi!"
+
+
+async def test_upload_file_auto_chunk_size(client: AsyncClient) -> None:
+    auto = client.with_model()
+    auto.upload_chunk_size = "auto"
+    result = await auto.upload_file(test_file, "Hi!")
+    assert result.chunk_sizes == [3]
+    assert result.retries == 0
+    assert await auto.get_file(test_file) == b"Hi!"
+
+
 async def test_run_process(client: AsyncClient) -> None:
     await client.run_action(test_action)
 
 
+async def test_run_action_many(client: AsyncClient, config: PyVersionConfig) -> None:
+    results = [r async for r in client.run_action_many([config.model_id], test_action)]
+    assert len(results) == 1
+    assert results[0][0] == config.model_id
+    assert isinstance(results[0][1], models.CompletedTask)
+
+
 async def test_list_task_statuses(client: AsyncClient) -> None:
     task_statuses = await client.get_task_summaries(test_action)
     assert isinstance(task_statuses, list)
@@ -157,6 +200,21 @@ async def test_get_task_status(client: AsyncClient) -> None:
     assert isinstance(task_status, models.TaskStatus)
 
 
+async def test_run_action_without_waiting(client: AsyncClient) -> None:
+    handle = await client.run_action(test_action, False)
+    done, _ = await wait([handle], timeout=300)
+    assert handle in done
+    assert isinstance(handle.result(), models.CompletedTask)
+    assert handle.progress is not None
+
+
+async def test_track_task(client: AsyncClient) -> None:
+    task = await client.run_action(test_action, False)
+    handle = await client.track_task(test_action, task.id)
+    assert isinstance(await handle, models.CompletedTask)
+    assert handle.done()
+
+
 async def test_invalid_file_id_raises_exception(client: AsyncClient) -> None:
     with pytest.raises(InvalidIdentifierException):
         await client.get_file(1)
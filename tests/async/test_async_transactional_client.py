@@ -77,6 +77,7 @@ async def test_long_list_insertion(
     assert result.failures == []
     assert result.added == 200_000
     assert result.total == 200_000
+    assert [c.items for c in result.chunks] == [100_000, 100_000]
 
 
 async def test_long_list_deletion(
@@ -111,6 +112,46 @@ async def test_get_list_items_raw(client: AsyncClient) -> None:
     assert all(isinstance(item, dict) for item in items)
 
 
+async def test_iter_list_items(client: AsyncClient) -> None:
+    items = [item async for item in client.tr.iter_list_items(test_list)]
+    assert len(items) == 1_000
+    assert all(isinstance(item, ListItem) for item in items)
+
+
+async def test_iter_list_items_raw(client: AsyncClient) -> None:
+    items = [item async for item in client.tr.iter_list_items(test_list, True)]
+    assert items == await client.tr.get_list_items(test_list, True)
+
+
+async def test_get_list_items_frame(client: AsyncClient) -> None:
+    frame = await client.tr.get_list_items_frame(test_list)
+    items = await client.tr.get_list_items(test_list)
+    assert len(frame) == len(items)
+    assert list(frame.ids) == [i.id for i in items]
+
+
+async def test_sync_list_unchanged(
+    client: AsyncClient, list_items_short: list[dict[str, Any]]
+) -> None:
+    result = await client.tr.sync_list(test_list, list_items_short)
+    assert result.unchanged == 1_000
+    assert result.inserted.added == 0
+    assert result.updated.updated == 0
+    assert result.deleted.deleted == 0
+
+
+async def test_sync_list_changes(
+    client: AsyncClient, list_items_short: list[dict[str, Any]]
+) -> None:
+    renamed = [{**i, "name": f"{i['name']}_new"} if i["code"] < 10 else i for i in list_items_short]
+    result = await client.tr.sync_list(test_list, renamed)
+    assert result.unchanged == 990
+    assert result.updated.updated == 10
+    result = await client.tr.sync_list(test_list, list_items_short)
+    assert result.updated.updated == 10
+    assert [c.items for c in result.updated.chunks] == [10]
+
+
 async def test_short_list_deletion(
     client: AsyncClient, list_items_short: list[dict[str, Any]]
 ) -> None:
@@ -135,6 +176,21 @@ async def test_get_view_info(client: AsyncClient) -> None:
     assert isinstance(info, ViewInfo)
 
 
+async def test_iter_view_data(client: AsyncClient) -> None:
+    info = await client.tr.get_view_info(102000000204)
+    slices = [s async for s in client.tr.iter_view_data(102000000204)]
+    assert len(slices) >= 1
+    assert all(len(pages) == len(info.pages) for pages, _ in slices)
+    assert all(isinstance(data, dict) for _, data in slices)
+
+
+async def test_get_view_array(client: AsyncClient) -> None:
+    info = await client.tr.get_view_info(102000000204)
+    array = await client.tr.get_view_array(102000000204)
+    assert array.values.ndim == 2 + len(info.pages)
+    assert array.shape[:2] == (len(array.rows), len(array.columns))
+
+
 async def test_get_current_period(client: AsyncClient) -> None:
     period = await client.tr.get_current_period()
     assert isinstance(period, CurrentPeriod)
@@ -166,6 +222,14 @@ async def test_get_dimension_items(client: AsyncClient) -> None:
     assert all(isinstance(item, DimensionWithCode) for item in items)
 
 
+async def test_resolve_dimension_items(client: AsyncClient) -> None:
+    items = await client.tr.get_dimension_items(test_list)
+    index = await client.tr.get_dimension_index(test_list, refresh=True)
+    assert len(index) == len(items)
+    resolved = await client.tr.resolve_dimension_items(test_list, [i.code for i in items])
+    assert resolved == {i.code: i.id for i in items}
+
+
 async def test_get_dimension_items_with_list_warns(client: AsyncClient, caplog: Any) -> None:
     items = await client.tr.get_dimension_items(test_list)
     assert isinstance(items, list)
@@ -190,3 +254,10 @@ async def test_get_line_item_dimensions(client: AsyncClient) -> None:
     items = await client.tr.get_line_item_dimensions(1248000000000)
     assert isinstance(items, list)
     assert all(isinstance(item, Dimension) for item in items)
+
+
+async def test_get_line_item_dimension_index(client: AsyncClient) -> None:
+    items = await client.tr.get_line_item_dimensions(1248000000000)
+    index = await client.tr.get_line_item_dimension_index([1248000000000])
+    assert index.dimensions[1248000000000] == items
+    assert all(1248000000000 in index.line_items[item.id] for item in items)
@@ -1,3 +1,6 @@
+from concurrent.futures import wait
+from io import BytesIO
+
 import pytest
 
 from anaplan_sdk import Client, models
@@ -6,6 +9,7 @@ from anaplan_sdk.exceptions import (
     InvalidCredentialsException,
     InvalidIdentifierException,
 )
+from tests.conftest import PyVersionConfig
 
 test_file = 113000000074
 test_action = 118000000028
@@ -114,12 +118,27 @@ def test_list_exports(client: Client) -> None:
     assert len(exports) > 0
 
 
+def test_snapshot_model_metadata(client: Client) -> None:
+    snapshot = client.snapshot_model_metadata(refresh=True)
+    assert isinstance(snapshot, models.ModelMetadata)
+    assert len(snapshot.modules) > 0 and len(snapshot.line_items) > 0
+    assert sum(map(len, snapshot.line_items_by_module.values())) == len(snapshot.line_items)
+    assert snapshot.actions_by_name[snapshot.processes[0].name].id == snapshot.processes[0].id
+    assert client.snapshot_model_metadata() == snapshot
+
+
 def test_upload_file_stream(client: Client) -> None:
     client.upload_file_stream(test_file, (str(i) for i in range(10)))
     out = client.get_file(test_file)
     assert out == b"0123456789"
 
 
+def test_upload_file_stream_coalesced(client: Client) -> None:
+    result = client.upload_file_stream(test_file, (str(i) for i in range(10)), coalesce=True)
+    assert result.chunk_count == 1
+    assert client.get_file(test_file) == b"0123456789"
+
+
 def test_upload_file_async_stream(client: Client) -> None:
     client.upload_file_stream(test_file, (i for i in _async_range(10)))
     out = client.get_file(test_file)
@@ -137,10 +156,34 @@ def test_upload_and_download_file(client: Client) -> None:
     assert out == b"Hi!"
 
 
+def test_get_files_content(client: Client) -> None:
+    client.upload_file(test_file, "Hi!")
+    sink = BytesIO()
+    assert client.get_files_content([test_file]) == {test_file: b"Hi!"}
+    assert client.get_files_content([test_file], sinks={test_file: sink}) == {}
+    assert sink.getvalue() == b"Hi!"
+
+
+def test_upload_file_auto_chunk_size(client: Client) -> None:
+    auto = client.with_model()
+    auto.upload_chunk_size = "auto"
+    result = auto.upload_file(test_file, "Hi!")
+    assert result.chunk_sizes == [3]
+    assert result.retries == 0
+    assert auto.get_file(test_file) == b"Hi!"
+
+
 def test_run_process(client: Client) -> None:
     client.run_action(test_action)
 
 
+def test_run_action_many(client: Client, config: PyVersionConfig) -> None:
+    results = list(client.run_action_many([config.model_id], test_action))
+    assert len(results) == 1
+    assert results[0][0] == config.model_id
+    assert isinstance(results[0][1], models.CompletedTask)
+
+
 def test_list_task_statuses(client: Client) -> None:
     task_statuses = client.get_task_summaries(test_action)
     assert isinstance(task_statuses, list)
@@ -153,6 +196,20 @@ def test_get_task_status(client: Client) -> None:
     assert isinstance(task_status, models.TaskStatus)
 
 
+def test_run_action_without_waiting(client: Client) -> None:
+    handle = client.run_action(test_action, False)
+    done, _ = wait([handle], timeout=300)
+    assert handle in done
+    assert isinstance(handle.result(), models.CompletedTask)
+    assert handle.progress is not None
+
+
+def test_track_task(client: Client) -> None:
+    handle = client.track_task(test_action, client.run_action(test_action, False).id)
+    assert isinstance(handle.result(), models.CompletedTask)
+    assert handle.done()
+
+
 def test_invalid_file_id_raises_exception(client: Client) -> None:
     with pytest.raises(InvalidIdentifierException):
         client.get_file(1)
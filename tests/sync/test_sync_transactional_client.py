@@ -75,6 +75,7 @@ def test_long_list_insertion(client: Client, list_items_long: list[dict[str, Any
     assert result.failures == []
     assert result.added == 200_000
     assert result.total == 200_000
+    assert [c.items for c in result.chunks] == [100_000, 100_000]
 
 
 def test_long_list_deletion(client: Client, list_items_long: list[dict[str, Any]]) -> None:
@@ -105,6 +106,46 @@ def test_get_list_items_raw(client: Client) -> None:
     assert all(isinstance(item, dict) for item in items)
 
 
+def test_iter_list_items(client: Client) -> None:
+    items = list(client.tr.iter_list_items(test_list))
+    assert len(items) == 1_000
+    assert all(isinstance(item, ListItem) for item in items)
+    assert [i.model_dump() for i in items] == [
+        i.model_dump() for i in client.tr.get_list_items(test_list)
+    ]
+
+
+def test_iter_list_items_raw(client: Client) -> None:
+    items = list(client.tr.iter_list_items(test_list, True))
+    assert items == client.tr.get_list_items(test_list, True)
+
+
+def test_get_list_items_frame(client: Client) -> None:
+    frame = client.tr.get_list_items_frame(test_list)
+    items = client.tr.get_list_items(test_list)
+    assert len(frame) == len(items)
+    assert list(frame.ids) == [i.id for i in items]
+    assert all(i.code is None or frame.get(i.code) == i for i in items)
+
+
+def test_sync_list_unchanged(client: Client, list_items_short: list[dict[str, Any]]) -> None:
+    result = client.tr.sync_list(test_list, list_items_short)
+    assert result.unchanged == 1_000
+    assert result.inserted.added == 0
+    assert result.updated.updated == 0
+    assert result.deleted.deleted == 0
+
+
+def test_sync_list_changes(client: Client, list_items_short: list[dict[str, Any]]) -> None:
+    renamed = [{**i, "name": f"{i['name']}_new"} if i["code"] < 10 else i for i in list_items_short]
+    result = client.tr.sync_list(test_list, renamed)
+    assert result.unchanged == 990
+    assert result.updated.updated == 10
+    result = client.tr.sync_list(test_list, list_items_short)
+    assert result.updated.updated == 10
+    assert [c.items for c in result.updated.chunks] == [10]
+
+
 def test_short_list_deletion(client: Client, list_items_short: list[dict[str, Any]]) -> None:
     result = client.tr.delete_list_items(test_list, list_items_short)
     assert result.deleted == 1_000
@@ -127,6 +168,21 @@ def test_get_view_info(client: Client) -> None:
     assert isinstance(info, ViewInfo)
 
 
+def test_iter_view_data(client: Client) -> None:
+    info = client.tr.get_view_info(102000000204)
+    slices = list(client.tr.iter_view_data(102000000204))
+    assert len(slices) >= 1
+    assert all(len(pages) == len(info.pages) for pages, _ in slices)
+    assert all(isinstance(data, dict) for _, data in slices)
+
+
+def test_get_view_array(client: Client) -> None:
+    info = client.tr.get_view_info(102000000204)
+    array = client.tr.get_view_array(102000000204)
+    assert array.values.ndim == 2 + len(info.pages)
+    assert array.shape[:2] == (len(array.rows), len(array.columns))
+
+
 def test_get_current_period(client: Client) -> None:
     period = client.tr.get_current_period()
     assert isinstance(period, CurrentPeriod)
@@ -158,6 +214,14 @@ def test_get_dimension_items(client: Client) -> None:
     assert all(isinstance(item, DimensionWithCode) for item in items)
 
 
+def test_resolve_dimension_items(client: Client) -> None:
+    items = client.tr.get_dimension_items(test_list)
+    index = client.tr.get_dimension_index(test_list, refresh=True)
+    assert len(index) == len(items)
+    resolved = client.tr.resolve_dimension_items(test_list, [i.code for i in items])
+    assert resolved == {i.code: i.id for i in items}
+
+
 def test_get_dimension_items_with_list_warns(client: Client, caplog: Any) -> None:
     items = client.tr.get_dimension_items(test_list)
     assert isinstance(items, list)
@@ -182,3 +246,10 @@ def test_get_line_item_dimensions(client: Client) -> None:
     items = client.tr.get_line_item_dimensions(1248000000000)
     assert isinstance(items, list)
     assert all(isinstance(item, Dimension) for item in items)
+
+
+def test_get_line_item_dimension_index(client: Client) -> None:
+    items = client.tr.get_line_item_dimensions(1248000000000)
+    index = client.tr.get_line_item_dimension_index([1248000000000])
+    assert index.dimensions[1248000000000] == items
+    assert all(1248000000000 in index.line_items[item.id] for item in items)
@@ -0,0 +1,146 @@
+from hashlib import sha256
+from pathlib import Path
+
+from anaplan_sdk._cache import (
+    _DimensionIndexes,  # pyright: ignore[reportPrivateUsage]
+    _LineItemDimensionIndexes,  # pyright: ignore[reportPrivateUsage]
+    _MetadataSnapshots,  # pyright: ignore[reportPrivateUsage]
+    _Spool,  # pyright: ignore[reportPrivateUsage]
+    _UploadDigests,  # pyright: ignore[reportPrivateUsage]
+)
+from anaplan_sdk.models import (
+    Dimension,
+    DimensionIndex,
+    LineItemDimensionIndex,
+    ModelMetadata,
+    Module,
+    View,
+)
+
+
+def test_upload_digests_persist(tmp_path: Path):
+    _UploadDigests(tmp_path).set("model", 113000000000, "abc")
+    digests = _UploadDigests(tmp_path)
+    assert digests.get("model", 113000000000) == "abc"
+    assert digests.get("other_model", 113000000000) is None
+    assert digests.get("model", 113000000001) is None
+
+
+def test_upload_digests_are_independent(tmp_path: Path):
+    first, second = _UploadDigests(tmp_path), _UploadDigests(tmp_path)
+    first.set("model", 113000000000, "abc")
+    second.set("model", 113000000001, "def")
+    first.set("model", 113000000000, "ghi")
+    assert second.get("model", 113000000000) == "ghi"
+    assert first.get("model", 113000000001) == "def"
+
+
+def test_upload_digests_ignore_corrupt_cache(tmp_path: Path):
+    (tmp_path / "upload_digests.json").write_text("{")
+    digests = _UploadDigests(tmp_path)
+    assert digests.get("model", 113000000000) is None
+    digests.set("model", 113000000000, "abc")
+    assert digests.get("model", 113000000000) == "abc"
+
+
+def test_dimension_index_resolves_locally():
+    index = DimensionIndex(101000000000)
+    index.add([{"id": "1", "name": "A", "code": "a"}, {"id": "2", "name": "B"}])
+    assert index.resolve(["a", "b"]) == {"a": 1}
+    assert index.resolve(["A", "B"], by="name") == {"A": 1, "B": 2}
+    assert index.missing(["a", "b", "b"]) == ["b"]
+    assert "a" in index and len(index) == 2
+
+
+def test_dimension_indexes_persist_and_expire(tmp_path: Path):
+    index = DimensionIndex(101000000000)
+    index.add([{"id": 1, "name": "A", "code": "a"}])
+    _DimensionIndexes(tmp_path, "model").put(index)
+    restored = _DimensionIndexes(tmp_path, "model").get(101000000000, max_age=60)
+    assert restored is not None and restored.codes == {"a": 1}
+    assert _DimensionIndexes(tmp_path, "other_model").get(101000000000, max_age=60) is None
+    index.loaded_at -= 120
+    _DimensionIndexes(tmp_path, "model").put(index)
+    assert _DimensionIndexes(tmp_path, "model").get(101000000000, max_age=60) is None
+
+
+def test_dimension_index_changes_are_written_at_most_once_per_interval(tmp_path: Path):
+    indexes, index = _DimensionIndexes(tmp_path, "model"), DimensionIndex(101000000000)
+    indexes.put(index)
+    index.add([{"id": 1, "name": "A", "code": "a"}])
+    indexes.changed(index)
+    assert indexes.get(101000000000, max_age=60) is index
+    restored = _DimensionIndexes(tmp_path, "model").get(101000000000, max_age=60)
+    assert restored is not None and len(restored) == 0
+
+
+def test_unwritten_dimension_index_changes_are_written_on_collection(tmp_path: Path):
+    indexes, index = _DimensionIndexes(tmp_path, "model"), DimensionIndex(101000000000)
+    indexes.put(index)
+    index.add([{"id": 1, "name": "A", "code": "a"}])
+    indexes.changed(index)
+    del indexes
+    restored = _DimensionIndexes(tmp_path, "model").get(101000000000, max_age=60)
+    assert restored is not None and restored.get("a") == 1
+
+
+def test_line_item_dimension_index_inverts_dimensions():
+    time, product = Dimension(id=20000000003, name="Time"), Dimension(id=101000000001, name="P")
+    index = LineItemDimensionIndex(7)
+    index.add(1, [time, product])
+    index.add(2, [time])
+    assert index.line_items == {20000000003: [1, 2], 101000000001: [1]}
+    index.add(1, [time])
+    assert index.line_items[101000000001] == [] and index.dimensions[1] == [time]
+    assert index.missing([1, 3, 3]) == [3] and 2 in index and len(index) == 2
+
+
+def test_line_item_dimension_indexes_persist_until_saved(tmp_path: Path):
+    index = LineItemDimensionIndex(7)
+    index.add(1, [Dimension(id=20000000003, name="Time")])
+    _LineItemDimensionIndexes(tmp_path, "model").put(index)
+    restored = _LineItemDimensionIndexes(tmp_path, "model").get(7)
+    assert restored is not None and restored.dimensions == index.dimensions
+    assert restored.line_items == {20000000003: [1]}
+    assert _LineItemDimensionIndexes(tmp_path, "model").get(8) is None
+    assert _LineItemDimensionIndexes(tmp_path, "other_model").get(7) is None
+
+
+def _snapshot(serial_number: int) -> ModelMetadata:
+    return ModelMetadata(
+        model_id="model",
+        last_saved_serial_number=serial_number,
+        modules=[Module(id=102000000001, name="Module")],
+        line_items=[],
+        lists=[],
+        views=[View(code="", id=102000000002, name="View", moduleId=102000000001)],
+        imports=[],
+        exports=[],
+        files=[],
+        processes=[],
+        actions=[],
+    )
+
+
+def test_metadata_snapshots_persist_until_saved(tmp_path: Path):
+    _MetadataSnapshots(tmp_path).put(_snapshot(7))
+    restored = _MetadataSnapshots(tmp_path).get("model", 7)
+    assert restored is not None and restored == _snapshot(7)
+    assert restored.views_by_module == {102000000001: restored.views}
+    assert _MetadataSnapshots(tmp_path).get("model", 8) is None
+    assert _MetadataSnapshots(tmp_path).get("other_model", 7) is None
+
+
+def test_metadata_snapshots_ignore_corrupt_cache(tmp_path: Path):
+    (tmp_path / "metadata").mkdir()
+    (tmp_path / "metadata" / "model.json.gz").write_bytes(b"not gzip")
+    assert _MetadataSnapshots(tmp_path).get("model", 7) is None
+
+
+def test_spool_replays_chunks():
+    spool = _Spool()
+    for chunk in ("a,b\n", b"1,2\n", "3,4\n"):
+        spool.write(chunk)
+    assert spool.digest == sha256(b"a,b\n1,2\n3,4\n").hexdigest()
+    assert spool.size == 12
+    assert list(spool.chunks()) == [b"a,b\n", b"1,2\n", b"3,4\n"]
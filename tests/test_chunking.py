@@ -0,0 +1,189 @@
+import asyncio
+import json
+import time
+from threading import Lock
+
+import pytest
+
+from anaplan_sdk._chunking import (
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    _ChunkSizer,  # pyright: ignore[reportPrivateUsage]
+    coalesce_chunks,
+    coalesce_chunks_async,
+    encoded_chunks,
+    iter_bounded,
+    iter_bounded_async,
+    run_bounded,
+    run_bounded_async,
+)
+from anaplan_sdk._utils import (
+    parse_deletion_response,
+    parse_insertion_response,
+    parse_module_write_response,
+    view_page_selections,
+)
+from anaplan_sdk.exceptions import AnaplanException
+from anaplan_sdk.models import ChunkStats, Dimension, ViewInfo
+
+
+def test_initial_round_uses_all_connections():
+    sizer = _ChunkSizer(max_parallel=8)
+    assert sizer.next_size(80_000_000) == 10_000_000
+    assert sizer.next_parallelism(80_000_000, 10_000_000) == 8
+
+
+def test_sizes_stay_within_limits():
+    assert _ChunkSizer(max_parallel=8).next_size(1_000) == MIN_CHUNK_SIZE
+    assert _ChunkSizer(max_parallel=8).next_size(10_000_000_000) == MAX_CHUNK_SIZE
+    sizer = _ChunkSizer(max_parallel=1)
+    sizer.record(10_000_000, 0.01, 1)
+    assert sizer.next_size() == MAX_CHUNK_SIZE
+
+
+def test_fast_link_grows_chunks():
+    sizer = _ChunkSizer(max_parallel=4)
+    sizer.record(10_000_000, 5, 1)
+    assert sizer.next_size() == 20_000_000
+
+
+def test_retries_shrink_chunks_and_parallelism():
+    sizer = _ChunkSizer(max_parallel=8)
+    for _ in range(4):
+        sizer.record(10_000_000, 5, 1)
+    before = sizer.next_size(), sizer.next_parallelism()
+    for _ in range(4):
+        sizer.record(10_000_000, 5, 2)
+    assert sizer.next_size() < before[0]
+    assert sizer.next_parallelism() < before[1]
+    assert sizer.retries == 4
+    assert sizer.chunk_sizes == [10_000_000] * 8
+    assert sizer.throughput == 2_000_000
+
+
+def test_coalesce_small_pieces():
+    chunks = list(coalesce_chunks((f"{i}\n" for i in range(10)), lambda: 8))
+    assert chunks == [b"0\n1\n2\n3\n", b"4\n5\n6\n7\n", b"8\n9\n"]
+
+
+def test_coalesce_large_and_mixed_pieces():
+    chunks = list(coalesce_chunks(["äbc" * 4, b"xyz"], lambda: 5))
+    assert b"".join(chunks) == ("äbc" * 4).encode() + b"xyz"
+    assert all(len(c) == 5 for c in chunks[:-1])
+
+
+async def test_coalesce_async():
+    async def pieces():
+        for i in range(5):
+            yield str(i)
+
+    chunks = [c async for c in coalesce_chunks_async(pieces(), lambda: 2)]
+    assert chunks == [b"01", b"23", b"4"]
+
+
+def test_encoded_chunks_single():
+    assert list(encoded_chunks([1, 2, 3], _encode, 3, 100)) == [(0, 3, b"[1,2,3]")]
+
+
+def test_encoded_chunks_by_count_and_size():
+    items = ["a", "bb", "ccc", "d", "e"]
+    chunks = list(encoded_chunks(items, _encode, 2, 12))
+    assert chunks == [(0, 2, b'["a","bb"]'), (2, 2, b'["ccc","d"]'), (4, 1, b'["e"]')]
+    assert [json.loads(c) for _, _, c in encoded_chunks(items, _encode, 10, 9)] == [
+        ["a"],
+        ["bb"],
+        ["ccc"],
+        ["d", "e"],
+    ]
+
+
+def test_run_bounded_keeps_order():
+    running, peak = 0, 0
+    lock = Lock()
+
+    def work(i: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01 * (i % 3))
+        with lock:
+            running -= 1
+        return i * 2
+
+    assert run_bounded(work, range(20), 3) == [i * 2 for i in range(20)]
+    assert peak <= 3
+
+
+async def test_run_bounded_async_keeps_order():
+    async def work(i: int) -> int:
+        await asyncio.sleep(0.001 * (i % 3))
+        return i * 2
+
+    assert await run_bounded_async(work, range(20), 3) == [i * 2 for i in range(20)]
+
+
+def test_iter_bounded_streams_in_order():
+    started: list[int] = []
+
+    def work(i: int) -> int:
+        started.append(i)
+        time.sleep(0.01 * (i % 3))
+        return i * 2
+
+    results = iter_bounded(work, range(20), 3)
+    assert next(results) == 0
+    assert len(started) <= 4
+    assert list(results) == [i * 2 for i in range(1, 20)]
+
+
+async def test_iter_bounded_async_streams_in_order():
+    async def work(i: int) -> int:
+        await asyncio.sleep(0.001 * (i % 3))
+        return i * 2
+
+    assert [r async for r in iter_bounded_async(work, range(20), 3)] == [i * 2 for i in range(20)]
+
+
+def test_view_page_selections():
+    dims = [Dimension(id=i, name=str(i)) for i in range(4)]
+    info = ViewInfo(view_id=1, view_name="V", rows=dims[:1], columns=dims[1:2], pages=dims[2:])
+    items = [
+        [Dimension(id=d * 10 + i, name="") for i in range(n)] for d, n in enumerate((5, 4, 3, 2))
+    ]
+    selections = list(view_page_selections(info, items, 20))
+    assert len(selections) == 6
+    assert selections[0] == [(2, 20), (3, 30)] and selections[-1] == [(2, 22), (3, 31)]
+    with pytest.raises(AnaplanException):
+        view_page_selections(info, items, 19)
+
+
+def test_parse_module_write_response():
+    failure = {"requestIndex": 1, "failureType": "x", "failureMessageDetails": "y"}
+    assert parse_module_write_response([(0, {"numberOfCellsChanged": 2})]) == 2
+    assert parse_module_write_response(
+        [(0, {"numberOfCellsChanged": 2}), (2, {"numberOfCellsChanged": 1, "failures": [failure]})]
+    ) == {"numberOfCellsChanged": 3, "failures": [failure | {"requestIndex": 3}]}
+
+
+def test_parse_list_write_responses():
+    failure = {"requestIndex": 1, "failureType": "x", "failureMessageDetails": "y"}
+    chunks = [ChunkStats(start=s, items=2, size=10, seconds=0.1, attempts=1) for s in (0, 2)]
+    insertion = parse_insertion_response(
+        [
+            (chunks[0], {"added": 2, "ignored": 0, "total": 2}),
+            (chunks[1], {"added": 1, "ignored": 1, "total": 2, "failures": [failure]}),
+        ]
+    )
+    assert (insertion.added, insertion.ignored, insertion.total) == (3, 1, 4)
+    assert [f.index for f in insertion.failures] == [3]
+    assert insertion.chunks == chunks
+    deletion = parse_deletion_response(
+        [(chunks[0], {"deleted": 2}), (chunks[1], {"deleted": 1, "failures": [failure]})]
+    )
+    assert deletion.deleted == 3
+    assert [f.index for f in deletion.failures] == [3]
+
+
+def _encode(obj: object) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -0,0 +1,132 @@
+from hashlib import sha256
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from anaplan_sdk import AsyncClient, Client, PollingPolicy
+from anaplan_sdk._cache import (
+    _LineItemDimensionIndexes,  # pyright: ignore[reportPrivateUsage]
+    _UploadDigests,  # pyright: ignore[reportPrivateUsage]
+)
+from anaplan_sdk.models import File, LineItemDimensionIndex
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    raise AssertionError(f"Unexpected request: {request.method} {request.url}")
+
+
+def _client(**kwargs: Any) -> Client:
+    return Client("w", "m", token="t", transport=httpx.MockTransport(_handler), backoff=0, **kwargs)
+
+
+def _async_client(**kwargs: Any) -> AsyncClient:
+    return AsyncClient(
+        "w", "m", token="t", transport=httpx.MockTransport(_handler), backoff=0, **kwargs
+    )
+
+
+def test_run_action_many_rejects_invalid_parallelism():
+    with pytest.raises(ValueError):
+        _client().run_action_many(["m1", "m2"], 118000000000, max_parallel=0)
+
+
+async def test_async_run_action_many_rejects_invalid_parallelism():
+    with pytest.raises(ValueError):
+        _async_client().run_action_many(["m1", "m2"], 118000000000, max_parallel=0)
+
+
+def _files() -> list[File]:
+    return [
+        File(id=i, name=f"{i}.csv", chunk_count=1, first_data_row=2, header_row=1)
+        for i in (113000000000, 113000000001)
+    ]
+
+
+def test_get_files_content_accepts_generator(monkeypatch: pytest.MonkeyPatch):
+    client = _client()
+    monkeypatch.setattr(client, "get_files", _files)
+    monkeypatch.setattr(client._http, "get_binary", lambda url: url[-1:].encode())  # pyright: ignore[reportPrivateUsage]
+    content = client.get_files_content(f.id for f in _files())
+    assert content == {113000000000: b"0", 113000000001: b"1"}
+
+
+async def test_async_get_files_content_accepts_generator(monkeypatch: pytest.MonkeyPatch):
+    async def get_files() -> list[File]:
+        return _files()
+
+    async def get_binary(url: str) -> bytes:
+        return url[-1:].encode()
+
+    client = _async_client()
+    monkeypatch.setattr(client, "get_files", get_files)
+    monkeypatch.setattr(client._http, "get_binary", get_binary)  # pyright: ignore[reportPrivateUsage]
+    content = await client.get_files_content(f.id for f in _files())
+    assert content == {113000000000: b"0", 113000000001: b"1"}
+
+
+def test_model_url_uses_client_url():
+    client = _client()
+    assert client._model_url("other") == (  # pyright: ignore[reportPrivateUsage]
+        "https://api.anaplan.com/2/0/workspaces/w/models/other"
+    )
+
+
+def test_status_poll_delay_can_be_changed():
+    client = _client()
+    assert client.status_poll_delay == 1 and client.alm.poll_delay == 1
+    client.status_poll_delay = 0.25
+    assert client.status_poll_delay == 0.25 and client.alm.poll_delay == 0.25
+    assert client._poller.policy.next_delay(3) == 0.25  # pyright: ignore[reportPrivateUsage]
+    policy = PollingPolicy(initial_delay=0.1)
+    client.alm.poll_delay = policy
+    assert client.status_poll_delay is policy
+
+
+async def test_async_status_poll_delay_can_be_changed():
+    client = _async_client()
+    client.status_poll_delay = 2
+    assert client.status_poll_delay == 2 and client.alm.poll_delay == 2
+
+
+def test_unchanged_upload_skips_import(tmp_path: Path):
+    _UploadDigests(tmp_path).set("m", 113000000000, sha256(b"a,b").hexdigest())
+    client = _client(skip_unchanged_uploads=True, cache_dir=tmp_path)
+    assert (
+        client.upload_and_import(113000000000, "a,b", 112000000000, skip_unchanged_import=True)
+        is None
+    )
+
+
+async def test_async_unchanged_upload_skips_import(tmp_path: Path):
+    _UploadDigests(tmp_path).set("m", 113000000000, sha256(b"a,b").hexdigest())
+    client = _async_client(skip_unchanged_uploads=True, cache_dir=tmp_path)
+    result = await client.upload_and_import(
+        113000000000, b"a,b", 112000000000, skip_unchanged_import=True
+    )
+    assert result is None
+
+
+def test_empty_line_item_dimension_index_is_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _LineItemDimensionIndexes(tmp_path, "m").put(LineItemDimensionIndex(7))
+    client = _client(cache_dir=tmp_path)
+    monkeypatch.setattr(
+        client.tr, "get_model_details", lambda: SimpleNamespace(last_saved_serial_number=7)
+    )
+    index = client.tr.get_line_item_dimension_index([])
+    assert index is client.tr.get_line_item_dimension_index([]) and len(index) == 0
+
+
+async def test_async_empty_line_item_dimension_index_is_reused(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    async def get_model_details() -> SimpleNamespace:
+        return SimpleNamespace(last_saved_serial_number=7)
+
+    _LineItemDimensionIndexes(tmp_path, "m").put(LineItemDimensionIndex(7))
+    client = _async_client(cache_dir=tmp_path)
+    monkeypatch.setattr(client.tr, "get_model_details", get_model_details)
+    index = await client.tr.get_line_item_dimension_index([])
+    assert index is await client.tr.get_line_item_dimension_index([]) and len(index) == 0
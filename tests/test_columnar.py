@@ -0,0 +1,82 @@
+import pytest
+
+from anaplan_sdk.models import ListItem, ListItemsFrame
+
+_items = [
+    {"id": "1", "name": "A", "code": "a", "properties": {"Color": "Red"}},
+    {
+        "id": "2",
+        "name": "B",
+        "code": "b",
+        "parent": "A",
+        "parentId": "1",
+        "properties": {"Size": "L"},
+        "subsets": {"Active": True},
+    },
+    {"id": "3", "name": "C"},
+]
+
+
+def test_columns():
+    frame = ListItemsFrame.from_items(_items)
+    assert len(frame) == 3
+    assert list(frame.ids) == [1, 2, 3]
+    assert frame.codes == ["a", "b", None]
+    assert list(frame.parent_ids) == [-1, 1, -1]
+    assert frame.properties == {"Color": ["Red", None, None], "Size": [None, "L", None]}
+    assert {k: list(v) for k, v in frame.subsets.items()} == {"Active": [0, 1, 0]}
+
+
+def test_lookup_by_code():
+    frame = ListItemsFrame.from_items(_items)
+    assert "b" in frame and "c" not in frame
+    assert frame.index("b") == 1
+    assert frame.get("c") is None
+    assert frame.get("b") == ListItem(
+        id=2,
+        name="B",
+        code="b",
+        parent="A",
+        parent_id="1",
+        properties={"Size": "L"},
+        subsets={"Active": True},
+    )
+    with pytest.raises(KeyError):
+        frame.index("c")
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    frame = ListItemsFrame.from_items(_items)
+    columns = frame.to_numpy()
+    assert columns["id"].dtype == np.int64
+    assert np.shares_memory(columns["id"], np.frombuffer(frame.ids, dtype=np.int64))
+    assert columns["subsets.Active"].tolist() == [False, True, False]
+    with pytest.raises(RuntimeError):
+        frame.append({"id": "4", "name": "D"})
+
+
+def test_to_numpy_copy_keeps_frame_writable():
+    pytest.importorskip("numpy")
+    frame = ListItemsFrame.from_items(_items)
+    columns = frame.to_numpy(copy=True)
+    frame.append({"id": "4", "name": "D", "subsets": {"Active": True}})
+    assert columns["id"].tolist() == [1, 2, 3]
+    assert frame.to_numpy()["subsets.Active"].tolist() == [False, True, False, True]
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = ListItemsFrame.from_items(_items).to_arrow()
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.column("code").to_pylist() == ["a", "b", None]
+    assert table.column("subsets.Active").to_pylist() == [False, True, False]
+
+
+def test_exported_columns_do_not_collide():
+    pytest.importorskip("numpy")
+    item = {"id": "1", "name": "A", "properties": {"name": "X"}, "subsets": {"name": True}}
+    columns = ListItemsFrame.from_items([item]).to_numpy()
+    assert columns["name"].tolist() == ["A"]
+    assert columns["properties.name"].tolist() == ["X"]
+    assert columns["subsets.name"].tolist() == [True]
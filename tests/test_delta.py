@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from anaplan_sdk import RowChange
+from anaplan_sdk._delta import _RowDelta  # pyright: ignore[reportPrivateUsage]
+
+pytest.importorskip("numpy")
+
+
+def _export(path: Path, content: bytes, chunk_size: int = 7) -> list[RowChange]:
+    delta = _RowDelta(path, ["Code"])
+    try:
+        changes = [
+            c
+            for i in range(0, len(content), chunk_size)
+            for c in delta.feed(content[i : i + chunk_size])
+        ]
+        return changes + list(delta.close())
+    finally:
+        delta.discard()
+
+
+def test_first_export_inserts_all(tmp_path: Path):
+    changes = _export(tmp_path / "index", b"Code,Value\na,1\nb,2\n")
+    assert changes == [RowChange("inserted", ["a", "1"]), RowChange("inserted", ["b", "2"])]
+
+
+def test_delta(tmp_path: Path):
+    _export(tmp_path / "index", b"Code,Value\na,1\nb,2\nc,3\n")
+    changes = _export(tmp_path / "index", b"Code,Value\nd,4\na,1\nc,30")
+    assert changes == [
+        RowChange("inserted", ["d", "4"]),
+        RowChange("updated", ["c", "30"]),
+        RowChange("deleted", ["b"]),
+    ]
+    assert _export(tmp_path / "index", b"Code,Value\nd,4\na,1\nc,30") == []
+
+
+def test_quoted_line_breaks(tmp_path: Path):
+    _export(tmp_path / "index", b'Code,Value\na,"x\ny"\n')
+    changes = _export(tmp_path / "index", b'Code,Value\na,"x\n""y"""\n', chunk_size=3)
+    assert changes == [RowChange("updated", ["a", 'x\n"y"'])]
+
+
+def test_interrupted_export_keeps_index(tmp_path: Path):
+    _export(tmp_path / "index", b"Code,Value\na,1\n")
+    delta = _RowDelta(tmp_path / "index", ["Code"])
+    delta.feed(b"Code,Value\nb,2\n")
+    delta.discard()
+    assert _export(tmp_path / "index", b"Code,Value\na,1\n") == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.idx", "index.keys"]
+
+
+def test_missing_key_column(tmp_path: Path):
+    with pytest.raises(ValueError):
+        _export(tmp_path / "index", b"Name,Value\na,1\n")
@@ -0,0 +1,82 @@
+import json
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from anaplan_sdk._downloads import (
+    _OrderedWriter,  # pyright: ignore[reportPrivateUsage]
+    chunk_urls,
+    csv_rows,
+    json_array_items,
+    write_blocks,
+)
+from anaplan_sdk.models import File
+
+
+def _file(file_id: int, chunk_count: int) -> File:
+    return File(
+        id=file_id, name=str(file_id), chunk_count=chunk_count, first_data_row=2, header_row=1
+    )
+
+
+def test_chunks_are_scheduled_round_robin():
+    urls = list(chunk_urls("url", [_file(1, 3), _file(2, 0), _file(3, 2)]))
+    assert [(f, i) for f, i, _ in urls] == [(1, 0), (2, 0), (3, 0), (1, 1), (3, 1), (1, 2)]
+    assert urls[1][2] == "url/files/2"
+    assert urls[3][2] == "url/files/1/chunks/1"
+
+
+def test_ordered_writer():
+    sink = BytesIO()
+    writer = _OrderedWriter(sink)
+    writer.write(2, b"c")
+    writer.write(0, b"a")
+    assert sink.getvalue() == b"a"
+    writer.write(1, b"b")
+    assert sink.getvalue() == b"abc"
+    assert writer.getvalue() is None
+    buffered = _OrderedWriter()
+    buffered.write(0, b"a")
+    assert buffered.getvalue() == b"a"
+
+
+def test_csv_rows_across_blocks():
+    content = 'Line,Error\n1,"bad\nvalue"\n2,"with ""quotes"""\n3,last'.encode()
+    blocks = [content[i : i + 4] for i in range(0, len(content), 4)]
+    assert list(csv_rows(blocks)) == [
+        ["Line", "Error"],
+        ["1", "bad\nvalue"],
+        ["2", 'with "quotes"'],
+        ["3", "last"],
+    ]
+
+
+def test_write_blocks(tmp_path: Path):
+    assert write_blocks([b"a", b"bc"], tmp_path / "out") == 3
+    assert (tmp_path / "out").read_bytes() == b"abc"
+
+
+def test_write_blocks_interrupted(tmp_path: Path):
+    def blocks():
+        yield b"a"
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_blocks(blocks(), tmp_path / "out")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_json_array_items_across_blocks():
+    items = [{"id": i, "name": f'n"]{i}', "properties": {"a": [1, 2]}} for i in range(50)]
+    content = json.dumps({"meta": {"paging": {}}, "listItems": items, "status": {}}).encode()
+    blocks = [content[i : i + 5] for i in range(0, len(content), 5)]
+    assert list(json_array_items(blocks, "listItems")) == items
+
+
+def test_json_array_items_scalars_and_empty():
+    assert list(json_array_items([b'{"values": [1', b"2, 3", b"4]}"], "values")) == [12, 34]
+    assert list(json_array_items([b'{"values": []}'], "values")) == []
+    assert list(json_array_items([b'{"meta": {}}'], "values")) == []
+    with pytest.raises(ValueError):
+        list(json_array_items([b'{"values": [{"a": 1}, {"b"'], "values"))
@@ -0,0 +1,79 @@
+from typing import Any, Literal
+
+import pytest
+
+from anaplan_sdk._list_sync import _ListDiff  # pyright: ignore[reportPrivateUsage]
+
+_current = [
+    {"id": "1", "name": "A", "code": "a", "properties": {"Color": "Red"}},
+    {"id": "2", "name": "B", "code": "b", "parent": "A", "parentId": "1", "subsets": {"S": True}},
+    {"id": "3", "name": "C", "code": "c"},
+]
+
+
+def _diff(desired: list[dict[str, Any]], key: Literal["code", "name"] = "code") -> _ListDiff:
+    diff = _ListDiff(desired, key)
+    for item in _current:
+        diff.feed(item)
+    return diff
+
+
+def test_only_changed_fields_are_sent():
+    diff = _diff(
+        [
+            {"code": "a", "name": "A", "properties": {"Color": "Blue", "Size": None}},
+            {"code": "b", "name": "B", "parent": "A", "subsets": {"S": False}},
+            {"code": "d", "name": "D"},
+        ]
+    )
+    assert diff.updates == [
+        {"id": "1", "properties": {"Color": "Blue"}},
+        {"id": "2", "subsets": {"S": False}},
+    ]
+    assert diff.deletes == [{"id": "3"}]
+    assert diff.adds == [{"code": "d", "name": "D"}]
+    assert diff.unchanged == 0
+
+
+def test_unchanged_items_are_not_sent():
+    diff = _diff(
+        [
+            {"code": "a", "name": "A", "properties": {"Color": "Red"}},
+            {"code": "b", "name": "B", "parent": "1", "subsets": {"S": True}},
+            {"code": "c", "name": "C"},
+        ]
+    )
+    assert diff.updates == diff.deletes == diff.adds == []
+    assert diff.unchanged == 3
+
+
+def test_match_by_name():
+    diff = _diff([{"name": "C", "code": "x"}], key="name")
+    assert diff.updates == [{"id": "3", "code": "x"}]
+    assert diff.deletes == [{"id": "1"}, {"id": "2"}]
+
+
+def test_invalid_keys():
+    with pytest.raises(ValueError):
+        _ListDiff([{"code": "a"}, {"code": "a"}], "code")
+    with pytest.raises(ValueError):
+        _ListDiff([{"name": "a"}], "code")
+
+
+def test_values_are_compared_by_type():
+    diff = _ListDiff(
+        [{"code": "a", "properties": {"Price": 1, "Flag": True, "Text": "01"}}], "code"
+    )
+    diff.feed({"id": "1", "code": "a", "properties": {"Price": "1.0", "Flag": "true", "Text": "1"}})
+    assert diff.updates == [{"id": "1", "properties": {"Text": "01"}}]
+    diff = _ListDiff([{"code": "a", "properties": {"Price": 1.5}}], "code")
+    diff.feed({"id": "1", "code": "a", "properties": {"Price": "1.5"}})
+    assert diff.updates == [] and diff.unchanged == 1
+
+
+def test_items_without_key_are_skipped():
+    diff = _ListDiff([{"code": "a", "name": "A"}], "code")
+    diff.feed({"id": "1", "name": "A", "code": "a"})
+    diff.feed({"id": "2", "name": "B"})
+    diff.feed({"id": "3", "name": "C", "code": ""})
+    assert diff.deletes == [] and diff.skipped == ["2", "3"]
@@ -0,0 +1,54 @@
+from concurrent.futures import Future
+
+import pytest
+
+from anaplan_sdk._lookups import _DimensionLookups  # pyright: ignore[reportPrivateUsage]
+from anaplan_sdk.models import DimensionWithCode
+
+
+def _item(i: int) -> DimensionWithCode:
+    return DimensionWithCode(id=i, name=f"N{i}", code=f"c{i}")
+
+
+def test_only_misses_are_claimed():
+    lookups = _DimensionLookups()
+    _, owned, _ = lookups.claim(1, "code", ["c1", "c2", "c1"], Future)
+    assert owned == ["c1", "c2"]
+    lookups.complete(1, "code", owned, [_item(1)])
+    hits, owned, pending = lookups.claim(1, "code", ["c1", "c2"], Future)
+    assert hits == {"c1": _item(1)} and owned == ["c2"] and pending == {}
+    hits, owned, _ = lookups.claim(1, "name", ["N1"], Future)
+    assert hits == {"N1": _item(1)} and owned == []
+    _, owned, _ = lookups.claim(2, "code", ["c1"], Future)
+    assert owned == ["c1"]
+
+
+def test_concurrent_lookups_are_coalesced():
+    lookups = _DimensionLookups()
+    _, owned, _ = lookups.claim(1, "code", ["c1", "c2"], Future)
+    _, other, pending = lookups.claim(1, "code", ["c2", "c3"], Future)
+    assert other == ["c3"] and list(pending) == ["c2"]
+    lookups.complete(1, "code", owned, [_item(2)])
+    assert pending["c2"].result() == _item(2)
+
+
+def test_failures_are_passed_to_waiters():
+    lookups = _DimensionLookups()
+    _, owned, _ = lookups.claim(1, "code", ["c1"], Future)
+    _, _, pending = lookups.claim(1, "code", ["c1"], Future)
+    lookups.fail(1, "code", owned, ValueError("boom"))
+    with pytest.raises(ValueError):
+        pending["c1"].result()
+    _, owned, _ = lookups.claim(1, "code", ["c1"], Future)
+    assert owned == ["c1"]
+
+
+def test_least_recently_used_items_are_evicted():
+    lookups = _DimensionLookups(max_size=4)
+    _, owned, _ = lookups.claim(1, "code", ["c1", "c2"], Future)
+    lookups.complete(1, "code", owned, [_item(1), _item(2)])
+    lookups.claim(1, "code", ["c1"], Future)
+    _, owned, _ = lookups.claim(1, "code", ["c3"], Future)
+    lookups.complete(1, "code", owned, [_item(3)])
+    hits, owned, _ = lookups.claim(1, "code", ["c1", "c2", "c3"], Future)
+    assert list(hits) == ["c1", "c3"] and owned == ["c2"]
@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import CancelledError
+from typing import Any
+
+import pytest
+
+from anaplan_sdk import PollingPolicy, TaskHandle, models
+from anaplan_sdk._polling import _AsyncTaskPoller, _TaskPoller  # pyright: ignore[reportPrivateUsage]
+
+
+def test_backoff():
+    policy = PollingPolicy(initial_delay=0.5, max_delay=4, backoff_factor=2)
+    assert [policy.next_delay(i) for i in range(5)] == [0.5, 1, 2, 4, 4]
+
+
+def test_fixed():
+    policy = PollingPolicy.fixed(0.25)
+    assert all(policy.next_delay(i, 0.5, 10) == 0.25 for i in range(5))
+
+
+def test_estimate_from_progress():
+    policy = PollingPolicy(initial_delay=1, max_delay=30)
+    assert policy.next_delay(0, 0.5, 10) == 10
+    assert policy.next_delay(0, 0.99, 10) == 1
+    assert policy.next_delay(0, 0.01, 10) == 30
+
+
+def test_estimate_ignores_unknown_progress():
+    policy = PollingPolicy(initial_delay=1, max_delay=30, backoff_factor=2)
+    assert policy.next_delay(2, None, 10) == 4
+    assert policy.next_delay(2, 0, 10) == 4
+    assert policy.next_delay(2, 1, 10) == 4
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"initial_delay": 0}, {"initial_delay": 2, "max_delay": 1}, {"backoff_factor": 0.5}]
+)
+def test_invalid_policy_raises(kwargs: dict[str, Any]):
+    with pytest.raises(ValueError):
+        PollingPolicy(**kwargs)
+
+
+def _counter(completes_at: int):
+    count = 0
+
+    def fetch() -> int:
+        nonlocal count
+        count += 1
+        return count
+
+    def resolve(status: int) -> str | None:
+        if status == -1:
+            raise ValueError("Task failed.")
+        return f"done after {status}" if status >= completes_at else None
+
+    return fetch, resolve
+
+
+def test_poller_resolves_all_handles():
+    poller = _TaskPoller(PollingPolicy(0.01, 0.05))
+    handles = [poller.track(str(i), 0, *_counter(i)) for i in range(1, 6)]
+    assert [h.result(5) for h in handles] == [f"done after {i}" for i in range(1, 6)]
+    assert [h.poll() for h in handles] == [1, 2, 3, 4, 5]
+
+
+def test_poller_sets_exception():
+    poller = _TaskPoller(PollingPolicy(0.01, 0.05))
+    handle = poller.track("1", -1, *_counter(1))
+    with pytest.raises(ValueError):
+        handle.result(5)
+
+
+def test_poller_drops_cancelled_handles():
+    poller = _TaskPoller(PollingPolicy(0.01, 0.05))
+    handle = poller.track("1", 0, *_counter(1_000_000))
+    assert handle.cancel()
+    with pytest.raises(CancelledError):
+        handle.result(5)
+
+
+async def test_async_poller_resolves_all_handles():
+    poller = _AsyncTaskPoller(PollingPolicy(0.01, 0.05))
+
+    def async_counter(completes_at: int):
+        fetch, resolve = _counter(completes_at)
+
+        async def async_fetch() -> int:
+            return fetch()
+
+        return async_fetch, resolve
+
+    handles = [poller.track(str(i), 0, *async_counter(i)) for i in range(1, 6)]
+    assert await asyncio.gather(*handles) == [f"done after {i}" for i in range(1, 6)]
+
+
+def test_handle_progress():
+    task = models.Task.model_validate(
+        {"taskId": "1", "taskState": "IN_PROGRESS", "creationTime": 0, "progress": 0.4}
+    )
+    assert TaskHandle[models.Task, None](task.id, task).progress == 0.4
+    assert TaskHandle[int, None]("2", 0).progress is None
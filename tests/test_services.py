@@ -0,0 +1,95 @@
+import json
+
+import httpx
+import pytest
+
+from anaplan_sdk._codec import JsonCodecName, get_json_codec
+from anaplan_sdk._services import (
+    _AsyncHttpService,  # pyright: ignore[reportPrivateUsage]
+    _HttpService,  # pyright: ignore[reportPrivateUsage]
+)
+from anaplan_sdk.exceptions import AnaplanException
+from anaplan_sdk.models import Module
+
+_modules = [{"id": str(i), "name": f"Module {i}"} for i in range(12)]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    limit, offset = 5, int(request.url.params.get("offset", 0))
+    return httpx.Response(
+        200,
+        json={
+            "meta": {"paging": {"totalSize": len(_modules), "currentPageSize": limit}},
+            "modules": _modules[offset : offset + limit],
+        },
+    )
+
+
+def _http() -> _HttpService:
+    client = httpx.Client(transport=httpx.MockTransport(_handler))
+    return _HttpService(client, retry_count=1, backoff=0, backoff_factor=1, page_size=5)
+
+
+def test_get_validated():
+    page = _http().get_validated("https://example.com/modules", "modules", Module)
+    assert page.meta["paging"]["totalSize"] == 12
+    assert page.items == [Module.model_validate(m) for m in _modules[:5]]
+
+
+def test_get_paginated_validated():
+    http = _http()
+    modules = list(http.get_paginated_validated("https://example.com/modules", "modules", Module))
+    assert modules == [Module.model_validate(m) for m in _modules]
+    assert list(http.get_paginated("https://example.com/modules", "modules")) == _modules
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_json_codec(name: JsonCodecName):
+    pytest.importorskip(name)
+    payload = {"items": [{"code": "ä", "name": "Item", "properties": {"Value": 1.5}}]}
+    sent: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        return httpx.Response(200, content=request.content)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    http = _HttpService(
+        client, retry_count=1, backoff=0, backoff_factor=1, page_size=5, codec=get_json_codec(name)
+    )
+    assert http.post("https://example.com/items", json=payload) == payload
+    assert json.loads(sent[0]) == payload
+
+
+def _rate_limited(limited: int) -> httpx.MockTransport:
+    responses = [httpx.Response(429) for _ in range(limited)]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return responses.pop() if responses else httpx.Response(200, content=b"content")
+
+    return httpx.MockTransport(handler)
+
+
+def test_get_stream_backs_off_when_rate_limited():
+    client = httpx.Client(transport=_rate_limited(2))
+    http = _HttpService(client, retry_count=3, backoff=0, backoff_factor=1, page_size=5)
+    assert b"".join(http.get_stream("https://example.com/files/1")) == b"content"
+    client = httpx.Client(transport=_rate_limited(3))
+    http = _HttpService(client, retry_count=3, backoff=0, backoff_factor=1, page_size=5)
+    with pytest.raises(AnaplanException, match="Rate limit exceeded"):
+        list(http.get_stream("https://example.com/files/1"))
+
+
+async def test_async_get_stream_backs_off_when_rate_limited():
+    client = httpx.AsyncClient(transport=_rate_limited(2))
+    http = _AsyncHttpService(client, retry_count=3, backoff=0, backoff_factor=1, page_size=5)
+    assert [b async for b in http.get_stream("https://example.com/files/1")] == [b"content"]
+    client = httpx.AsyncClient(transport=_rate_limited(3))
+    http = _AsyncHttpService(client, retry_count=3, backoff=0, backoff_factor=1, page_size=5)
+    with pytest.raises(AnaplanException, match="Rate limit exceeded"):
+        _ = [b async for b in http.get_stream("https://example.com/files/1")]
+
+
+def test_unknown_json_codec():
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")  # pyright: ignore[reportArgumentType]
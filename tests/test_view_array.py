@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from anaplan_sdk.exceptions import AnaplanException
+from anaplan_sdk.models import Dimension, ViewArray, ViewInfo
+
+_info = ViewInfo(
+    view_id=1,
+    view_name="View",
+    rows=[Dimension(id=1, name="Items")],
+    columns=[Dimension(id=2, name="Time")],
+    pages=[Dimension(id=3, name="Versions")],
+)
+
+
+def test_grids_are_stacked_by_page():
+    grids = [b",Jan,Feb\nA,1,2\nB,,true\n", b",Jan,Feb\nA,3,4.5\nB,x,false\n"]
+    array = ViewArray.from_grids(_info, grids, [["Actual", "Budget"]])
+    assert array.shape == (2, 2, 2)
+    assert array.rows.tolist() == [["A"], ["B"]]
+    assert array.columns.tolist() == [["Jan"], ["Feb"]]
+    assert array.pages[0].tolist() == ["Actual", "Budget"]
+    assert np.array_equal(
+        array.values, np.array([[[1, 3], [2, 4.5]], [[np.nan, np.nan], [1, 0]]]), equal_nan=True
+    )
+
+
+def test_pages_must_match_in_shape():
+    grids = [b",Jan,Feb\nA,1,2\n", b",Jan,Feb\nA,1,2\nB,3,4\n"]
+    with pytest.raises(AnaplanException):
+        ViewArray.from_grids(_info, grids, [["Actual", "Budget"]])
+
+
+def test_only_changed_cells_are_written():
+    info = _info.model_copy(update={"columns": [Dimension(id=20000000000, name="Line Items")]})
+    array = ViewArray.from_grids(info, [b",Sales,Cost\nA,1,2\nB,,3\n"], [["Actual"]])
+    values = array.values.copy()
+    values[1, 0, 0], values[0, 1, 0] = 5, np.nan
+    mask = array.changed(values)
+    assert mask.sum() == 1
+    assert array.to_module_data(values, mask) == [
+        {
+            "lineItemName": "Sales",
+            "dimensions": [
+                {"dimensionId": 1, "itemName": "B"},
+                {"dimensionId": 3, "itemName": "Actual"},
+            ],
+            "value": 5.0,
+        }
+    ]
+    array.apply(values, mask)
+    assert not array.changed(values).any()
+
+
+def test_booleans_are_written_as_booleans():
+    info = _info.model_copy(update={"columns": [Dimension(id=20000000000, name="Line Items")]})
+    array = ViewArray.from_grids(info, [b",Active,Sales\nA,true,1\n"], [["Actual"]])
+    values = array.values.copy()
+    values[0, 0, 0], values[0, 1, 0] = 0, 0
+    data = array.to_module_data(values, array.changed(values))
+    assert [(d["lineItemName"], d["value"]) for d in data] == [("Active", False), ("Sales", 0.0)]
+    assert type(data[1]["value"]) is float
+
+
+def test_line_item_is_required_without_line_items_dimension():
+    array = ViewArray.from_grids(_info, [b",Jan\nA,1\n"], [["Actual"]])
+    with pytest.raises(ValueError):
+        array.to_module_data(array.values + 1, array.changed(array.values + 1))
+    data = array.to_module_data(array.values + 1, array.changed(array.values + 1), 114000000001)
+    assert data[0]["lineItemId"] == 114000000001 and len(data[0]["dimensions"]) == 3
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from threading import Event
+from typing import Any
+
+import pytest
+
+from anaplan_sdk import AsyncModuleWriteBuffer, ModuleWriteBuffer
+from anaplan_sdk.exceptions import BufferedWriteError
+
+
+def _cell(line_item: str, value: float, item: str = "A") -> dict[str, Any]:
+    return {
+        "lineItemName": line_item,
+        "dimensions": [{"dimensionId": 101000000001, "itemName": item}],
+        "value": value,
+    }
+
+
+def test_repeated_writes_are_merged():
+    batches: list[list[dict[str, Any]]] = []
+    with ModuleWriteBuffer(lambda cells: batches.append(cells) or len(cells), 10, 60) as buffer:
+        buffer.write(_cell("Sales", 1))
+        buffer.write([_cell("Sales", 2), _cell("Sales", 3, "B")])
+        assert len(buffer) == 2 and batches == []
+    assert batches == [[_cell("Sales", 2), _cell("Sales", 3, "B")]]
+    assert buffer.cells_written == 2
+
+
+def test_flush_on_size_and_age():
+    batches: list[list[dict[str, Any]]] = []
+    with ModuleWriteBuffer(lambda cells: batches.append(cells) or len(cells), 2, 0.1) as buffer:
+        buffer.write([_cell("Sales", 1), _cell("Units", 1)])
+        buffer.write(_cell("Price", 1))
+        time.sleep(0.3)
+        assert [len(b) for b in batches] == [2, 1]
+    with pytest.raises(RuntimeError):
+        buffer.write(_cell("Sales", 1))
+
+
+def test_errors_are_aggregated():
+    gate = Event()
+
+    def write(cells: list[dict[str, Any]]) -> int:
+        gate.wait()
+        raise ValueError(cells[0]["lineItemName"])
+
+    buffer = ModuleWriteBuffer(write, 1, 60)
+    buffer.write(_cell("Sales", 1))
+    buffer.write(_cell("Units", 1))
+    gate.set()
+    with pytest.raises(BufferedWriteError) as info:
+        buffer.close()
+    assert [str(e) for e in info.value.exceptions] == ["Sales", "Units"]
+    assert [f["cells"] for f in buffer.failures] == [[_cell("Sales", 1)], [_cell("Units", 1)]]
+
+
+async def test_async_errors_are_aggregated():
+    async def write(cells: list[dict[str, Any]]) -> int:
+        raise ValueError(cells[0]["lineItemName"])
+
+    buffer = AsyncModuleWriteBuffer(write, 1, 60)
+    buffer.write(_cell("Sales", 1))
+    buffer.write(_cell("Units", 1))
+    with pytest.raises(BufferedWriteError) as info:
+        await buffer.close()
+    assert [str(e) for e in info.value.exceptions] == ["Sales", "Units"]
+    assert [f["cells"] for f in buffer.failures] == [[_cell("Sales", 1)], [_cell("Units", 1)]]
+
+
+def test_partial_failures_refer_to_cells():
+    def write(cells: list[dict[str, Any]]) -> dict[str, Any]:
+        return {"numberOfCellsChanged": 1, "failures": [{"requestIndex": 1}]}
+
+    with ModuleWriteBuffer(write, 10, 60) as buffer:
+        buffer.write([_cell("Sales", 1), _cell("Sales", 2, "B")])
+    assert buffer.cells_written == 1
+    assert buffer.failures[0]["response"]["failures"] == [
+        {"requestIndex": 1, "cell": _cell("Sales", 2, "B")}
+    ]
+
+
+async def test_async_buffer():
+    batches: list[list[dict[str, Any]]] = []
+
+    async def write(cells: list[dict[str, Any]]) -> int | dict[str, Any]:
+        await asyncio.sleep(0.01)
+        batches.append(cells)
+        return len(cells) if len(cells) > 1 else {"numberOfCellsChanged": 0, "failures": [{}]}
+
+    async with AsyncModuleWriteBuffer(write, 2, 0.1) as buffer:
+        buffer.write([_cell("Sales", 1), _cell("Units", 1)])
+        buffer.write(_cell("Price", 1))
+        await asyncio.sleep(0.3)
+        buffer.write(_cell("Price", 2))
+        buffer.write(_cell("Price", 3))
+    assert [len(b) for b in batches] == [2, 1, 1]
+    assert batches[-1] == [_cell("Price", 3)]
+    assert buffer.cells_written == 2 and len(buffer.failures) == 2